@@ -7,6 +7,9 @@ st.set_page_config(
 )
 import pandas as pd
 import json
+import hashlib
+import html
+from itertools import islice
 import plotly.express as px
 from pathlib import Path
 import numpy as np
@@ -15,29 +18,135 @@ import plotly.graph_objects as go
 
 
 # ---------- DATA LOADING ----------
+from kpis import summary_kpis
+from manifest import iter_cards
+from maps import animated_choropleth, build_frames
+from projection import BASE_YEAR, DEFAULTS, TARGET_YEARS, population_tensor, project, projection_table
+from ranking import build_ranked_long, ranked_slice, top_n_rows
+from sensitivity import threshold_sweep
+from snapshot import SNAPSHOT_NAME, load_snapshot, read_snapshot_header
+from store import read_dataset, store_version
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "app_ready"
+STORE_PATH = Path(__file__).resolve().parent.parent / "data" / "store"
+
+# optional analysis layers (see LAYER_SOURCES in data_preparation/build_snapshot.py)
+LAYER_NAMES = ("proximity", "systems", "system_points", "moran_global", "moran_local", "rank_intervals", "population_age")
+
 
 @st.cache_data
-def load_data():
+def load_data(content_hash: str):
     """
     Load regional metrics and the GeoJSON with regional boundaries.
 
     We join the metrics table to the GeoJSON using the region code. 
     This is more robust than matching on labels.
+
+    The tables come from the single-file snapshot built by
+    data_preparation/build_snapshot.py; `content_hash` (read from the
+    snapshot header) keys the cache, so a rebuilt snapshot is picked up
+    without restarting the app. Without a snapshot we fall back to the CSVs.
+
+    The last item holds the optional LAYER_NAMES tables bundled in the
+    snapshot, by name; missing layers are simply absent (and always without
+    a snapshot).
     """
-    base_path = Path(__file__).resolve().parent.parent
-    data_path = base_path / "data" / "app_ready"
+    snapshot_path = DATA_PATH / SNAPSHOT_NAME
+    if snapshot_path.exists():
+        tables, documents, _ = load_snapshot(snapshot_path)
+        return (
+            tables["md5"],
+            documents["regions_geojson"],
+            tables["md4"],
+            tables["ranked_long"],
+            {name: tables[name] for name in LAYER_NAMES if name in tables},
+        )
 
-    df = pd.read_csv(data_path / "MD5_age_houses_occupation.csv")
+    df = pd.read_csv(DATA_PATH / "MD5_age_houses_occupation.csv")
     df["COD_REG"] = df["region_code"].astype(int)
 
-    df_disp = pd.read_csv(data_path / "MD4_dispertion_places.csv")
+    df_disp = pd.read_csv(DATA_PATH / "MD4_dispertion_places.csv")
 
-    with open(data_path / "italy_regions.geojson", "r", encoding="utf-8") as f:
+    with open(DATA_PATH / "italy_regions.geojson", "r", encoding="utf-8") as f:
         geojson = json.load(f)
 
-    return df, geojson, df_disp
+    return df, geojson, df_disp, build_ranked_long(df), {}
+
+
+def data_version() -> str:
+    """
+    Content hash of the current snapshot ("csv" when running from the CSVs).
+    """
+    snapshot_path = DATA_PATH / SNAPSHOT_NAME
+    if snapshot_path.exists():
+        return read_snapshot_header(snapshot_path)["content_hash"]
+    return "csv"
+
+
+@st.cache_data
+def load_panel(store_hash: str):
+    """
+    Regional metrics for every year in the year-partitioned store.
+
+    Each ingested ISTAT release is one partition (see data_preparation/ingest.py);
+    `store_hash` is the manifest hash, so new years invalidate the cache.
+    Returns an empty DataFrame when no store is available.
+    """
+    df = read_dataset(STORE_PATH, "metrics")
+    if not df.empty:
+        df["COD_REG"] = df["region_code"].astype(int)
+    return df
+
+
+@st.cache_data
+def load_map_frames(_df_panel, store_hash: str, metric: str, macro_regions: tuple):
+    """
+    Per-year value vectors for the time-lapse map (see app/maps.py).
+
+    Computed once per (store version, metric, macro-region selection) and
+    kept server-side; `_df_panel` is not hashed.
+    """
+    df = _df_panel[_df_panel["macro_region"].isin(macro_regions)]
+    return build_frames(df, metric)
+
+
+@st.cache_data
+def load_kpis(_df_regions, _df_panel, _df_disp, data_version: str, store_version: str, year):
+    """
+    Key Findings values (see app/kpis.py) for one year, computed once per
+    snapshot, store version and year; the DataFrames are not hashed.
+
+    Falls back to the snapshot metrics when the store has no rows for `year`.
+    """
+    df = _df_panel[_df_panel["year"] == year] if year is not None else _df_panel.iloc[:0]
+    if df.empty:
+        df = _df_regions
+    return summary_kpis(df, _df_disp, datasets=sum(1 for _ in iter_cards()))
+
+
+@st.cache_data
+def run_projection(_df_age, data_version: str, tfr: float, mortality_improvement: float, net_migration: float):
+    """
+    Projected share of 65+ (see app/projection.py), memoised per data version
+    and parameter set; `_df_age` is not hashed.
+
+    Returns the regional values for TARGET_YEARS and the yearly series for Italy.
+    """
+    codes, population = population_tensor(_df_age)
+    result = project(population, TARGET_YEARS[-1], tfr, mortality_improvement, net_migration)
+
+    df_italy = pd.DataFrame({
+        "year": result["years"],
+        "share_65plus": result["pop_65plus"].sum(axis=0) / result["total"].sum(axis=0) * 100,
+        "total": result["total"].sum(axis=0),
+    })
+    return projection_table(codes, result), df_italy
+
 
-df_regions, regions_geojson, df_disp = load_data()
+DATA_VERSION = data_version()
+STORE_VERSION = store_version(STORE_PATH)
+df_regions, regions_geojson, df_disp, df_ranked_long, layers = load_data(DATA_VERSION)
+df_panel = load_panel(STORE_VERSION)
 
 
 
@@ -249,15 +358,74 @@ with tab_map:
         default=macro_list,
     )
 
+    # ---- year selection (from the year-partitioned store) ----
+    panel_years = sorted(df_panel["year"].unique().tolist()) if not df_panel.empty else []
+
+    if panel_years:
+        selected_year = st.selectbox(
+            "Year",
+            options=panel_years,
+            index=len(panel_years) - 1,
+            key="map_year",
+            help="Reference year of the population release. Housing values come "
+                 "from the latest census wave available for that year.",
+        )
+        time_lapse = st.checkbox(
+            "Play as time-lapse across years",
+            value=False,
+            disabled=len(panel_years) < 2,
+            key="map_time_lapse",
+            help="Available once at least two years have been ingested.",
+        )
+    else:
+        selected_year = None
+        time_lapse = False
+
     show_ageing = st.checkbox("Show the share of 65+", value=True)
     show_vacancy = st.checkbox("Show the share of abandoned homes", value=False)
 
-    # Filter metrics by selected macro-regions
-    df_map = df_regions[df_regions["macro_region"].isin(selected_macro)]
+    # Filter metrics by selected macro-regions (and year)
+    if selected_year is None:
+        df_map = df_regions[df_regions["macro_region"].isin(selected_macro)]
+    else:
+        df_map = df_panel[
+            (df_panel["year"] == selected_year)
+            & df_panel["macro_region"].isin(selected_macro)
+        ]
+
+    def time_lapse_map(metric: str, colorbar_title: str, height=None):
+        """
+        Animated map: the geometry is sent once, each year is a value vector.
+        """
+        frames = load_map_frames(df_panel, STORE_VERSION, metric, tuple(selected_macro))
+        fig = animated_choropleth(frames, regions_geojson, colorbar_title=colorbar_title)
+        if height:
+            fig.update_layout(height=height, margin={"r": 40, "t": 20, "l": 20, "b": 20})
+        else:
+            fig.update_layout(margin={"r": 0, "t": 0, "l": 0, "b": 0})
+        st.plotly_chart(fig, use_container_width=True)
 
     if not show_ageing and not show_vacancy:
         st.info("Select at least one layer to display the map.")
 
+    elif time_lapse and not selected_macro:
+        st.info("Select at least one macro-region to play the time-lapse.")
+
+    elif time_lapse and show_ageing != show_vacancy:
+        if show_ageing:
+            time_lapse_map("share_65plus", "Share of 65+ (%)", height=700)
+        else:
+            time_lapse_map("share_unoccupied", "Share of unoccupied homes (%)", height=700)
+
+    elif time_lapse:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Ageing layer (share_65plus)**")
+            time_lapse_map("share_65plus", "Share of 65+ (%)")
+        with col2:
+            st.markdown("**Vacancy layer (share_unoccupied)**")
+            time_lapse_map("share_unoccupied", "Share of unoccupied homes (%)")
+
     elif show_ageing and not show_vacancy:
         # only ageing layer
 
@@ -389,56 +557,59 @@ with tab_summary:
     """
     st.markdown(results_css, unsafe_allow_html=True)
 
-    st.markdown(
-        """
-        <div class="results-row">
-          <div class="result-card">
-            <div class="result-icon">📊</div>
-            <div>
-              <p class="result-main">8</p>
-              <p class="result-label">
-                <strong>Datasets</strong>, including source and mashup tables, underpin the analysis of
-                ageing, vacancy and settlement structure across Italy.
-              </p>
-            </div>
-          </div>
-
-          <div class="result-card">
-            <div class="result-icon">👵</div>
-            <div>
-              <p class="result-main">24.73%</p>
-              <p class="result-label">
-                <strong>National share of residents aged 65+</strong> in 2025, used as a benchmark for
-                comparing regional ageing patterns.
-              </p>
-            </div>
-          </div>
-        </div>
+    kpis = load_kpis(df_regions, df_panel, df_disp, DATA_VERSION, STORE_VERSION, selected_year)
+    kpi_year = f" in {selected_year}" if selected_year is not None else ""
 
-        <div class="results-row">
-          <div class="result-card">
-            <div class="result-icon">🏚️</div>
-            <div>
-              <p class="result-main">5</p>
-              <p class="result-label">
-                <strong>Regions in the “Old & Empty” quadrant</strong> – combining above-median ageing and
-                housing vacancy.
-              </p>
-            </div>
-          </div>
-
-          <div class="result-card">
-            <div class="result-icon">🗺️</div>
-            <div>
-              <p class="result-main">Valle d'Aosta</p>
-              <p class="result-label">
-                The <strong>most dispersed region</strong> has a Dispersed Settlements Index over ten times
-                higher than the national average, signalling very fragmented settlement patterns.
-              </p>
-            </div>
-          </div>
-        </div>
-        """,
+    def short_name(region: str) -> str:
+        # "Valle d'Aosta/Vallée d'Aoste" → "Valle d'Aosta"
+        return html.escape(region.split("/")[0])
+
+    def result_card(icon: str, value: str, label: str) -> str:
+        # one line per card: blank or indented lines would end the HTML block in Markdown
+        return (
+            f'<div class="result-card"><div class="result-icon">{icon}</div><div>'
+            f'<p class="result-main">{value}</p><p class="result-label">{label}</p></div></div>'
+        )
+
+    cards = [
+        result_card(
+            "📊", kpis["datasets"],
+            "<strong>Datasets</strong>, including source and mashup tables, underpin the analysis of "
+            "ageing, vacancy and settlement structure across Italy.",
+        ),
+        result_card(
+            "👵", f"{kpis['share_65plus']:.2f}%",
+            f"<strong>National share of residents aged 65+</strong>{kpi_year}, used as a benchmark for "
+            "comparing regional ageing patterns.",
+        ),
+        result_card(
+            "🏚️", f"{kpis['old_empty_count']} / {kpis['regions']}",
+            "<strong>Regions in the “Old & Empty” quadrant</strong> – combining above-median ageing and "
+            f"housing vacancy: {', '.join(short_name(r) for r in kpis['old_empty_regions']) or 'none'}.",
+        ),
+        result_card(
+            "🗺️", short_name(kpis["most_dispersed_region"]),
+            "The <strong>most dispersed region</strong> has a Dispersed Settlements Index "
+            f"{kpis['dispersed_ratio']:.1f} times the average of the regions, signalling very "
+            "fragmented settlement patterns.",
+        ),
+        result_card(
+            "🔑", f"{kpis['share_unoccupied']:.2f}%",
+            "<strong>National share of unoccupied homes</strong>, from the latest housing census "
+            "available.",
+        ),
+        result_card(
+            "📈", short_name(kpis["oldest_region"]),
+            f"The <strong>oldest region</strong>{kpi_year}, with {kpis['oldest_share']:.2f}% of "
+            "residents aged 65+.",
+        ),
+    ]
+
+    st.markdown(
+        "".join(
+            f'<div class="results-row">{"".join(cards[i:i + 2])}</div>'
+            for i in range(0, len(cards), 2)
+        ),
         unsafe_allow_html=True,
     )
 
@@ -474,6 +645,101 @@ initiatives are most urgently needed to keep places liveable as the population a
     """
 )
 
+# ---------- PROJECTION: AGEING SCENARIOS ----------
+st.subheader("What if current trends continue?")
+st.write(
+    f"""
+    The {BASE_YEAR} age structure of each region is moved forward year by year (a cohort-component
+    projection): everyone grows one year older, deaths follow a smooth age pattern, births depend
+    on the fertility rate, and migrants arrive mostly at young-adult ages. Change the assumptions
+    to see how the share of residents aged 65+ could evolve. This is a simple scenario model,
+    not an official forecast.
+    """
+)
+
+df_age = layers.get("population_age")
+if df_age is None:
+    st.info(
+        "Projections need the single-year age table, which is not included in the current data "
+        "snapshot; rebuild it with data_preparation/build_snapshot.py."
+    )
+else:
+    col_tfr, col_mort, col_mig = st.columns(3)
+    with col_tfr:
+        proj_tfr = st.slider(
+            "Fertility (children per woman)", 0.8, 2.2, DEFAULTS["tfr"], 0.02, key="proj_tfr"
+        )
+    with col_mort:
+        proj_mortality = st.slider(
+            "Mortality decline per year (%)", 0.0, 3.0, DEFAULTS["mortality_improvement"], 0.1,
+            key="proj_mortality",
+            help="Yearly decline of death rates at every age; 1% adds about one year of life expectancy per decade.",
+        )
+    with col_mig:
+        proj_migration = st.slider(
+            "Net migration (per 1,000 residents per year)", -5.0, 10.0, DEFAULTS["net_migration"], 0.5,
+            key="proj_migration",
+        )
+
+    df_proj, df_proj_italy = run_projection(df_age, DATA_VERSION, proj_tfr, proj_mortality, proj_migration)
+
+    proj_year = st.radio(
+        "Projection year",
+        options=list(TARGET_YEARS),
+        horizontal=True,
+        key="proj_year",
+    )
+
+    share_base = float(df_proj_italy["share_65plus"].iloc[0])
+    share_target = float(df_proj_italy.loc[df_proj_italy["year"] == proj_year, "share_65plus"].iloc[0])
+    col_now, col_then = st.columns(2)
+    col_now.metric(f"Share of 65+ in Italy, {BASE_YEAR}", f"{share_base:.1f}%")
+    col_then.metric(
+        f"Projected share of 65+, {proj_year}",
+        f"{share_target:.1f}%",
+        delta=f"{share_target - share_base:+.1f} pp",
+        delta_color="inverse",
+    )
+
+    col_proj_map, col_proj_line = st.columns([3, 2])
+
+    with col_proj_map:
+        df_proj_year = df_proj[df_proj["year"] == proj_year].merge(
+            df_regions[["region_code", "region_norm"]], on="region_code", how="left"
+        )
+        fig_proj = px.choropleth(
+            df_proj_year,
+            geojson=regions_geojson,
+            locations="region_code",
+            featureidkey="properties.COD_REG",
+            color="share_65plus",
+            hover_name="region_norm",
+            hover_data={"region_code": False, "share_65plus": ":.1f", "total": ":,.0f"},
+            labels={"share_65plus": "Projected share of 65+ (%)", "total": "Projected residents"},
+            # same colour range for every year, so the maps can be compared
+            range_color=(float(df_regions["share_65plus"].min()), float(df_proj["share_65plus"].max())),
+            color_continuous_scale="Reds",
+        )
+        fig_proj.update_geos(fitbounds="locations", visible=False)
+        fig_proj.update_layout(
+            margin={"r": 10, "t": 10, "l": 10, "b": 10},
+            coloraxis_colorbar=dict(title="Share of 65+ (%)"),
+            height=500,
+        )
+        st.plotly_chart(fig_proj, use_container_width=True)
+
+    with col_proj_line:
+        fig_proj_line = px.line(
+            df_proj_italy,
+            x="year",
+            y="share_65plus",
+            labels={"year": "Year", "share_65plus": "Share of 65+ in Italy (%)"},
+        )
+        fig_proj_line.update_traces(hovertemplate="%{x}: %{y:.1f}%<extra></extra>")
+        fig_proj_line.add_vline(x=proj_year, line_width=1, line_dash="dash", line_color="grey")
+        fig_proj_line.update_layout(margin={"r": 10, "t": 10, "l": 60, "b": 40}, height=500)
+        st.plotly_chart(fig_proj_line, use_container_width=True)
+
 st.write("---")
 
 
@@ -817,26 +1083,10 @@ st.markdown("*This section summarises the data quality, legal, ethical and techn
 "conditions under which the data can be safely interpreted and reused.*")
 
 
-DATASET_TITLES = {
-    "d1": "D1 – Italy Population 2025",
-    "d2": "D2 – Italy Housing Data 2021",
-    "gd1": "GD1 – Italy Regions Boundaries",
-    "gd2_gd6": "GD2–GD6 – Settlements Location",
-}
+# dataset cards are declared in data/datasets.toml
+DATASET_TITLES = {card["key"]: card["title"] for card in iter_cards()}
 
-DATASET_KEYS = ["d1", "d2", "gd1", "gd2_gd6"]
-
-technical_datasets = {
-    "d1": "D1 – Italy Population 2025",
-    "d2": "D2 – Italy Housing Data 2021",
-    "gd1": "GD1 – Italy Regions Boundaries",
-    "gd2_gd6": "GD2–GD6 – Settlements Location",
-    "md1": "MD1 – Share Houses Occupation",
-    "md2": "MD2 – Share 65 Plus",
-    "md3": "MD3 – Settlements per Region",
-    "md4": "MD4 – Dispersed Settlements Index",
-    "md5": "MD5 – Age vs Houses Occupation",
-}
+DATASET_KEYS = [card["key"] for card in iter_cards("quality")]
 
 QUALITY_TEXTS = {
     "d1": """
@@ -1521,8 +1771,9 @@ This analysis was conducted in the following dimensions: privacy, intellectual p
 """
 )
 
+    LEGAL_KEYS = [card["key"] for card in iter_cards("legal")]
     cols = st.columns(2)
-    for idx, key in enumerate(DATASET_KEYS):
+    for idx, key in enumerate(LEGAL_KEYS):
       col = cols[idx % 2]
       with col:
         with st.expander(DATASET_TITLES[key], expanded=False):
@@ -1663,13 +1914,13 @@ metadata description. In addition, each dataset is evaluated against the
     )
 
 
-    TECH_KEYS = ["d1", "d2", "gd1", "gd2_gd6", "md1", "md2", "md3", "md4", "md5"]
+    TECH_KEYS = [card["key"] for card in iter_cards("technical")]
     cols = st.columns(2)
 
     for idx, key in enumerate(TECH_KEYS):
        col = cols[idx % 2]          
        with col:
-        with st.expander(technical_datasets[key], expanded=False):
+        with st.expander(DATASET_TITLES[key], expanded=False):
             st.markdown(TECH_TEXTS[key])
 
     st.markdown("### Final note: overall technical and FAIR quality")
@@ -1801,6 +2052,38 @@ st.markdown(
     "or diverge.*"
 )
 
+# upper bound for the dumbbell slider, so the chart stays readable
+# when the data holds many more territorial units than regions
+MAX_DUMBBELL_UNITS = 50
+
+
+@st.cache_data
+def select_top_n(_df, data_version: str, macro_region, metric: str, n: int, descending: bool = True):
+    """
+    Top-n units by `metric`, optionally within one macro-region.
+
+    Selection is a partial sort (see app/ranking.py). Results are cached per
+    (data version, macro-region, metric, n); `_df` is not hashed.
+    """
+    df = _df if macro_region is None else _df[_df["macro_region"] == macro_region]
+    if metric == "abs_rank_diff":
+        df = df.assign(abs_rank_diff=df["rank_diff"].abs())
+    return top_n_rows(df, metric, n, descending)
+
+
+# resolution of the threshold sweep (pairs = steps²)
+SWEEP_STEPS = 81
+
+
+@st.cache_data
+def load_threshold_sweep(_df, data_version: str, steps: int = SWEEP_STEPS):
+    """
+    Quadrant membership over a grid of threshold pairs (see app/sensitivity.py),
+    computed once per data version; `_df` is not hashed.
+    """
+    return threshold_sweep(_df, steps)
+
+
 tab_ranked, tab_scatter, tab_disp = st.tabs(
     [
         "Ranked bars: Ageing vs vacancy",
@@ -1918,44 +2201,45 @@ with tab_ranked:
         ascending_2 = sort_option_2.startswith("Highest")
 
         # ---- Prepare data ----
-        if selected_macro_2 == "All Italy":
-            df_base_2 = df_regions.copy()
-        else:
-            df_base_2 = df_regions[df_regions["macro_region"] == selected_macro_2].copy()
-
-        # Step 1: Top-5 by ranking metric (or all regions)
-        if show_top5_2:
-            df_ranked_2 = df_base_2.sort_values(
-                ranking_metric_2, ascending=False
-            ).head(5)
-        else:
-            df_ranked_2 = df_base_2.copy()
-
-        # Step 2: final order according to ranking metric + sort order
-        df_ranked_2 = df_ranked_2.sort_values(
-            ranking_metric_2, ascending=ascending_2
-        )
-
-        # Long format: only selected metrics (one or both)
-        df_long_2 = df_ranked_2.melt(
-            id_vars=["region_norm"],
-            value_vars=selected_metrics,
-            var_name="metric",
-            value_name="value",
+        # Top-5 and order come from the precomputed rank columns
+        # (see app/ranking.py), so nothing is sorted or reshaped here.
+        df_long_2, region_order_2 = ranked_slice(
+            df_ranked_long,
+            ranking_metric=ranking_metric_2,
+            metrics=selected_metrics,
+            macro_region=None if selected_macro_2 == "All Italy" else selected_macro_2,
+            top_n=5 if show_top5_2 else None,
+            ascending=ascending_2,
         )
 
-        metric_labels_2 = {
-            "share_65plus": "Share of 65+",
-            "share_unoccupied": "Share of unoccupied homes",
-        }
-        df_long_2["metric_label"] = df_long_2["metric"].map(metric_labels_2)
-
         # ---- Height ----
         base_height_2 = 350
         extra_per_bar_2 = 18
-        n_regions_2 = df_ranked_2.shape[0]
+        n_regions_2 = len(region_order_2)
         height_2 = base_height_2 + max(0, (n_regions_2 - 8) * extra_per_bar_2)
 
+        # ---- Bootstrap intervals (precomputed in data_preparation/rank_bootstrap.py) ----
+        df_intervals = layers.get("rank_intervals")
+        bar_error = {}
+        bar_hover = {"value": ":.2f"}
+        if df_intervals is not None:
+            rank_scope_2 = "italy" if selected_macro_2 == "All Italy" else "macro"
+            df_long_2 = df_long_2.merge(df_intervals, on="region_code", how="left")
+            is_65 = (df_long_2["metric"] == "share_65plus").to_numpy()
+            for bound in ("lo", "hi"):
+                df_long_2[f"value_{bound}"] = np.where(
+                    is_65, df_long_2[f"share_65plus_{bound}"], df_long_2[f"share_unoccupied_{bound}"]
+                )
+                df_long_2[f"rank_{bound}"] = np.where(
+                    is_65,
+                    df_long_2[f"rank_share_65plus_{rank_scope_2}_{bound}"],
+                    df_long_2[f"rank_share_unoccupied_{rank_scope_2}_{bound}"],
+                ).astype(int)
+            df_long_2["error_plus"] = df_long_2["value_hi"] - df_long_2["value"]
+            df_long_2["error_minus"] = df_long_2["value"] - df_long_2["value_lo"]
+            bar_error = {"error_x": "error_plus", "error_x_minus": "error_minus"}
+            bar_hover.update({"error_plus": False, "error_minus": False, "rank_lo": True, "rank_hi": True})
+
         # ---- Plot ----
         fig_bar_2 = px.bar(
             df_long_2,
@@ -1968,14 +2252,17 @@ with tab_ranked:
                 "value": "Value",
                 "region_norm": "Region",
                 "metric_label": "Metric",
+                "rank_lo": "Rank, 95% interval from",
+                "rank_hi": "to",
             },
-            hover_data={"value": ":.2f"},
+            hover_data=bar_hover,
+            **bar_error,
         )
 
-        # keep region order as in df_ranked_2
+        # keep region order given by the ranking metric
         fig_bar_2.update_yaxes(
             categoryorder="array",
-            categoryarray=df_ranked_2["region_norm"].tolist(),
+            categoryarray=region_order_2,
         )
 
         fig_bar_2.update_layout(
@@ -1986,6 +2273,12 @@ with tab_ranked:
 
         st.plotly_chart(fig_bar_2, use_container_width=True)
 
+        if df_intervals is not None:
+            st.caption(
+                "Error bars: 95% bootstrap intervals of each share, from 5,000 resamplings of "
+                "residents and dwellings; the hover shows the matching interval of the rank."
+            )
+
 # ========= TAB 2: SCATTER & DUMBBELL =========
 with tab_scatter:
     st.subheader("Retired people vs “retired” places",)
@@ -2145,6 +2438,60 @@ with col1:
 
     st.plotly_chart(fig_scatter, use_container_width=True)
 
+    # ---- THRESHOLD SWEEP ----
+    sweep_mode = st.toggle(
+        "Sweep all thresholds",
+        key="threshold_sweep",
+        help="Instead of one threshold pair, test every combination on a fine grid.",
+    )
+
+    if sweep_mode:
+        sweep = load_threshold_sweep(df_regions, DATA_VERSION)
+
+        st.write(
+            f"""
+            Each row is a region; for every ageing threshold (x-axis) the colour shows in how
+            many of the {len(sweep["thresholds_vac"])} vacancy thresholds the region falls into
+            “Old & Empty”. Regions that stay red across a wide band are robustly “Old & Empty”,
+            whatever exact cut-off is chosen. The dashed line marks the current ageing threshold.
+            """
+        )
+
+        fig_sweep = go.Figure(
+            go.Heatmap(
+                z=sweep["old_empty_by_65"] * 100,
+                x=sweep["thresholds_65"],
+                y=sweep["regions"],
+                customdata=np.repeat(sweep["old_empty_share"][:, None] * 100, len(sweep["thresholds_65"]), axis=1),
+                colorscale="Reds",
+                zmin=0,
+                zmax=100,
+                colorbar=dict(title="“Old & Empty”<br>(% of vacancy<br>thresholds)"),
+                hovertemplate=(
+                    "<b>%{y}</b><br>"
+                    "Ageing threshold: %{x:.1f}%<br>"
+                    "Old & Empty for %{z:.0f}% of vacancy thresholds<br>"
+                    "Over the whole grid: %{customdata:.0f}%<extra></extra>"
+                ),
+            )
+        )
+
+        fig_sweep.add_vline(
+            x=threshold_65,
+            line_width=1,
+            line_dash="dash",
+            line_color="grey",
+        )
+
+        fig_sweep.update_layout(
+            xaxis_title="Threshold for share of 65+ (%)",
+            yaxis=dict(autorange="reversed"),
+            margin={"r": 10, "t": 20, "l": 160, "b": 60},
+            height=max(450, 22 * len(sweep["regions"])),
+        )
+
+        st.plotly_chart(fig_sweep, use_container_width=True)
+
 
     # ---------- COL2: DUMBBELL ----------
     with col2:
@@ -2170,34 +2517,59 @@ with col1:
 
         top_n_dumb = st.slider(
             "Number of regions to display (by absolute rank difference)",
-            min_value=5,
-            max_value=len(df_regions),
+            min_value=min(5, len(df_regions)),
+            max_value=min(MAX_DUMBBELL_UNITS, len(df_regions)),
             value=min(10, len(df_regions)),
             step=1,
             key="topn_dumbbell",
         )
 
-        if selected_macro_dumb == "All Italy":
-            df_dumb = df_regions.copy()
-        else:
-            df_dumb = df_regions[df_regions["macro_region"] == selected_macro_dumb].copy()
-
-        df_dumb["abs_rank_diff"] = df_dumb["rank_diff"].abs()
-        df_dumb = df_dumb.sort_values("abs_rank_diff", ascending=False).head(top_n_dumb)
-        df_dumb = df_dumb.sort_values("abs_rank_diff", ascending=True)
+        df_dumb = select_top_n(
+            df_regions,
+            DATA_VERSION,
+            None if selected_macro_dumb == "All Italy" else selected_macro_dumb,
+            "abs_rank_diff",
+            top_n_dumb,
+        )
+        # largest difference at the top of the chart
+        df_dumb = df_dumb.iloc[::-1]
+
+        # 95% bootstrap intervals of the ranks, when the snapshot has them
+        df_intervals = layers.get("rank_intervals")
+        dumb_error = {"rank_65": None, "rank_vac": None}
+        if df_intervals is not None:
+            df_dumb = df_dumb.merge(df_intervals, on="region_code", how="left")
+            for rank_col in dumb_error:
+                dumb_error[rank_col] = dict(
+                    type="data",
+                    symmetric=False,
+                    array=df_dumb[f"{rank_col}_hi"] - df_dumb[rank_col],
+                    arrayminus=df_dumb[rank_col] - df_dumb[f"{rank_col}_lo"],
+                    thickness=1,
+                    width=3,
+                )
 
         fig_dumb = go.Figure()
 
-        for _, row in df_dumb.iterrows():
-            fig_dumb.add_trace(
-                go.Scatter(
-                    x=[row["rank_65"], row["rank_vac"]],
-                    y=[row["region_norm"], row["region_norm"]],
-                    mode="lines",
-                    showlegend=False,
-                    hoverinfo="skip",
-                )
+        # all connecting lines in one trace, segments separated by None
+        n_dumb = len(df_dumb)
+        line_x = np.full(3 * n_dumb, None, dtype=object)
+        line_y = np.full(3 * n_dumb, None, dtype=object)
+        line_x[0::3] = df_dumb["rank_65"].to_numpy()
+        line_x[1::3] = df_dumb["rank_vac"].to_numpy()
+        line_y[0::3] = df_dumb["region_norm"].to_numpy()
+        line_y[1::3] = df_dumb["region_norm"].to_numpy()
+
+        fig_dumb.add_trace(
+            go.Scatter(
+                x=line_x,
+                y=line_y,
+                mode="lines",
+                line=dict(color="lightgrey"),
+                showlegend=False,
+                hoverinfo="skip",
             )
+        )
 
         fig_dumb.add_trace(
             go.Scatter(
@@ -2211,6 +2583,7 @@ with col1:
                     "Rank by vacancy: %{customdata[0]}<extra></extra>"
                 ),
                 customdata=df_dumb[["rank_vac"]].to_numpy(),
+                error_x=dumb_error["rank_65"],
             )
         )
 
@@ -2226,6 +2599,7 @@ with col1:
                     "Rank by ageing: %{customdata[0]}<extra></extra>"
                 ),
                 customdata=df_dumb[["rank_65"]].to_numpy(),
+                error_x=dumb_error["rank_vac"],
             )
         )
 
@@ -2234,12 +2608,96 @@ with col1:
             yaxis_title="Region",
             xaxis=dict(autorange="reversed"),
             margin={"r": 40, "t": 40, "l": 160, "b": 40},
-            height=550,
+            height=max(550, 22 * n_dumb),
             legend_title="Metric",
         )
 
         st.plotly_chart(fig_dumb, use_container_width=True)
 
+        if df_intervals is not None:
+            st.caption(
+                "Whiskers: 95% bootstrap intervals of each rank. Small regions such as "
+                "Valle d'Aosta or Molise have wider intervals because their shares rest on fewer people and homes."
+            )
+
+
+    # ---------- SPATIAL CLUSTERING: MORAN'S I / LISA ----------
+    st.markdown("---")
+    st.subheader("Do old and empty regions cluster together?")
+
+    st.markdown(
+        "**_Research Question:_** *Are high (or low) values of ageing, vacancy and dispersion "
+        "geographically clustered, or are such regions scattered across Italy?*"
+    )
+
+    st.write(
+        """
+        Moran's I compares each region with its neighbours (regions sharing a border;
+        Sicily and Sardinia are linked to their nearest region). Positive values mean that
+        similar values sit next to each other. The map shows the local version (LISA):
+        regions that are significantly High-High or Low-Low form clusters, while High-Low
+        and Low-High regions are outliers among their neighbours. Significance comes from
+        9,999 random permutations computed in the data pipeline.
+        """
+    )
+
+    df_moran_global = layers.get("moran_global")
+    df_moran_local = layers.get("moran_local")
+    if df_moran_global is None or df_moran_local is None:
+        st.info(
+            "Spatial autocorrelation results are not included in the current data snapshot; "
+            "they are computed by data_preparation/build_snapshot.py."
+        )
+    else:
+        moran_labels = {
+            "share_65plus": "Share of 65+",
+            "share_unoccupied": "Share of unoccupied homes",
+            "dispersed_index": "Dispersed Settlements Index",
+        }
+        moran_metric = st.selectbox(
+            "Indicator",
+            options=[m for m in moran_labels if m in set(df_moran_global["metric"])],
+            format_func=moran_labels.get,
+            key="moran_metric",
+        )
+
+        moran_row = df_moran_global[df_moran_global["metric"] == moran_metric].iloc[0]
+        col_i, col_p, col_e = st.columns(3)
+        col_i.metric("Global Moran's I", f"{moran_row['moran_i']:.3f}")
+        col_p.metric("Pseudo p-value", f"{moran_row['p_value']:.4f}")
+        col_e.metric("Expected I (no clustering)", f"{moran_row['expected_i']:.3f}")
+
+        df_lisa = df_moran_local[df_moran_local["metric"] == moran_metric].merge(
+            df_regions[["region_code", "region_norm"]], on="region_code", how="left"
+        )
+
+        fig_lisa = px.choropleth(
+            df_lisa,
+            geojson=regions_geojson,
+            locations="region_code",
+            featureidkey="properties.COD_REG",
+            color="cluster",
+            hover_name="region_norm",
+            hover_data={"region_code": False, "local_i": ":.3f", "p_value": ":.4f"},
+            labels={"cluster": "LISA cluster", "local_i": "Local Moran's I", "p_value": "Pseudo p-value"},
+            category_orders={"cluster": ["High-High", "Low-Low", "High-Low", "Low-High", "Not significant"]},
+            color_discrete_map={
+                "High-High": "#d7191c",
+                "Low-Low": "#2c7bb6",
+                "High-Low": "#fdae61",
+                "Low-High": "#abd9e9",
+                "Not significant": "#eeeeee",
+            },
+        )
+
+        fig_lisa.update_geos(fitbounds="locations", visible=False)
+        fig_lisa.update_layout(
+            margin={"r": 20, "t": 20, "l": 20, "b": 20},
+            height=550,
+        )
+
+        st.plotly_chart(fig_lisa, use_container_width=True)
+
 
 # ---------- TAB 3: DISPERSED SETTLEMENTS MAP ----------
 with tab_disp:
@@ -2303,6 +2761,153 @@ with tab_disp:
         "between regions with values around 1–2. Regions above the cap are shown in the top colour."
         )
 
+    # ---------- PROXIMITY: DISTANCE TO THE NEAREST TOWN ----------
+    st.markdown("---")
+    st.subheader("How far are villages and hamlets from the nearest town?")
+
+    st.write(
+        """
+        The index above counts small settlements but not how remote they are.
+        For every village/hamlet we measure the straight-line distance to the nearest
+        town or city (OSM places), and summarise it per region: the typical (median)
+        distance, the distance that 90% of settlements stay within, and the share of
+        settlements beyond a given distance.
+        """
+    )
+
+    df_prox = layers.get("proximity")
+    if df_prox is None:
+        st.info(
+            "The proximity layer is not included in the current data snapshot. "
+            "It is computed by data_preparation/proximity.py from the OSM places extracts "
+            "and added by data_preparation/build_snapshot.py."
+        )
+    else:
+        prox_metrics = {
+            "dist_median_km": "Median distance to nearest town (km)",
+            "dist_p90_km": "90th percentile distance (km)",
+        }
+        for col in df_prox.columns:
+            if col.startswith("share_beyond_"):
+                km = col.removeprefix("share_beyond_").removesuffix("km")
+                prox_metrics[col] = f"Share of settlements beyond {km} km (%)"
+
+        prox_metric = st.radio(
+            "Proximity measure",
+            options=list(prox_metrics),
+            format_func=prox_metrics.get,
+            horizontal=True,
+            key="prox_metric",
+        )
+
+        df_prox_map = df_prox.merge(df_disp[["region_code", "region"]], on="region_code", how="left")
+
+        fig_prox = px.choropleth(
+            df_prox_map,
+            geojson=regions_geojson,
+            locations="region_code",
+            featureidkey="properties.COD_REG",
+            color=prox_metric,
+            hover_name="region",
+            hover_data={
+                "region_code": False,
+                "settlements_count": ":,.0f",
+                **{col: ":.1f" for col in prox_metrics},
+            },
+            labels={"settlements_count": "Villages/hamlets", **prox_metrics},
+            color_continuous_scale="Magma_r",
+        )
+
+        fig_prox.update_geos(fitbounds="locations", visible=False)
+
+        fig_prox.update_layout(
+            margin={"r": 20, "t": 20, "l": 20, "b": 20},
+            coloraxis_colorbar=dict(title=prox_metrics[prox_metric].replace(" (", "<br>(")),
+            height=550,
+        )
+
+        st.plotly_chart(fig_prox, use_container_width=True)
+
+    # ---------- SETTLEMENT SYSTEMS ----------
+    st.markdown("---")
+    st.subheader("Are hamlets isolated, or part of settlement systems?")
+
+    st.write(
+        """
+        Many hamlets lie a few hundred metres apart around the same core. Linking every
+        village/hamlet to those within 1 km groups them into settlement systems; the
+        cluster-aware index counts each system once, plus the isolated settlements, per
+        1,000 inhabitants. Circles mark the systems, sized by the number of settlements.
+        """
+    )
+
+    df_systems = layers.get("systems")
+    if df_systems is None:
+        st.info(
+            "The settlement-systems layer is not included in the current data snapshot. "
+            "It is computed by data_preparation/settlement_systems.py from the OSM places extracts "
+            "and added by data_preparation/build_snapshot.py."
+        )
+    else:
+        df_systems_map = df_systems.merge(df_disp[["region_code", "region"]], on="region_code", how="left")
+
+        fig_systems = px.choropleth(
+            df_systems_map,
+            geojson=regions_geojson,
+            locations="region_code",
+            featureidkey="properties.COD_REG",
+            color="system_index",
+            hover_name="region",
+            hover_data={
+                "region_code": False,
+                "settlements_count": ":,.0f",
+                "systems_count": ":,.0f",
+                "isolated_count": ":,.0f",
+                "clustered_share": ":.1f",
+                "system_index": ":.2f",
+            },
+            labels={
+                "settlements_count": "Villages/hamlets",
+                "systems_count": "Settlement systems",
+                "isolated_count": "Isolated settlements",
+                "clustered_share": "Share in systems (%)",
+                "system_index": "Cluster-aware index\n(units / 1,000 inhabitants)",
+            },
+            color_continuous_scale="Blues",
+        )
+
+        df_points = layers.get("system_points")
+        if df_points is not None and not df_points.empty:
+            fig_systems.add_trace(
+                go.Scattergeo(
+                    lon=df_points["lon"],
+                    lat=df_points["lat"],
+                    mode="markers",
+                    marker=dict(
+                        size=df_points["size"],
+                        sizemode="area",
+                        sizeref=2.0 * df_points["size"].max() / 30**2,
+                        sizemin=2,
+                        color="rgba(200, 60, 30, 0.55)",
+                        line=dict(width=0),
+                    ),
+                    customdata=df_points[["size", "spread_km"]],
+                    hovertemplate="%{customdata[0]} settlements<br>spread %{customdata[1]:.1f} km<extra></extra>",
+                    name="Settlement systems",
+                    showlegend=False,
+                )
+            )
+
+        fig_systems.update_geos(fitbounds="locations", visible=False)
+
+        fig_systems.update_layout(
+            margin={"r": 20, "t": 20, "l": 20, "b": 20},
+            coloraxis_colorbar=dict(title="Units / 1,000 inhabitants"),
+            height=550,
+        )
+
+        st.plotly_chart(fig_systems, use_container_width=True)
+
     # ---------- SCATTER: DISPERSED INDEX vs 65+ ----------
     st.markdown("---")
     st.subheader("How dispersed villages relate to older populations?")
@@ -2383,24 +2988,97 @@ how the serializations are published alongside the tabular data.*
         """
     )
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PREVIEW_INDEX = PROJECT_ROOT / "rdf" / "rdf_serialization" / "previews" / "index.json"
+# local (gitignored) record of the mtime each preview hash was last checked for
+PREVIEW_STAT_CACHE = PROJECT_ROOT / "data" / ".cache" / "previews.json"
+
+
+def file_version(relative_path: str):
+    """
+    (size, mtime) of a project file, used to key the preview caches.
+    """
+    try:
+        stat = (PROJECT_ROOT / relative_path).stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
 @st.cache_data
-def load_ttl_preview(relative_path: str, max_lines: int = 18) -> str:
+def load_ttl_preview(relative_path: str, version, max_lines: int = 18) -> str:
     """
     Load a short preview of an RDF/Turtle file from the project tree.
+
+    Only the first `max_lines` lines are read from disk.
     """
-    base_path = Path(__file__).resolve().parent.parent 
-    full_path = base_path / relative_path
+    full_path = PROJECT_ROOT / relative_path
 
     try:
         with open(full_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            lines = list(islice(f, max_lines + 1))
         snippet = "".join(lines[:max_lines])
         if len(lines) > max_lines:
             snippet += "\n# … (truncated for preview) …"
         return snippet
     except FileNotFoundError:
         return f"# Preview not available.\n# File not found: {full_path}"
-    
+
+
+@st.cache_data
+def load_ttl_preview_html(relative_path: str, version, max_lines: int = 18):
+    """
+    Highlighted preview rendered by rdf/rdf_previews.py, or None if missing or stale.
+
+    The snippet is valid if the file still has the size and SHA-256 recorded
+    when it was rendered. The hash is skipped when the local stat cache saw
+    this exact (size, mtime) with that hash before.
+    """
+    if version is None or not PREVIEW_INDEX.exists():
+        return None
+
+    name = Path(relative_path).name
+    with open(PREVIEW_INDEX, "r", encoding="utf-8") as f:
+        entry = json.load(f).get(name)
+    if not entry or entry["max_lines"] != max_lines or entry["size"] != version[0]:
+        return None
+
+    stats = {}
+    if PREVIEW_STAT_CACHE.exists():
+        with open(PREVIEW_STAT_CACHE, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+    seen = stats.get(name)
+    if not (seen and seen["sha256"] == entry["sha256"] and (seen["size"], seen["mtime_ns"]) == tuple(version)):
+        # e.g. a fresh checkout: compare the content hash, streamed in chunks
+        sha = hashlib.sha256()
+        with open(PROJECT_ROOT / relative_path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                sha.update(chunk)
+        if sha.hexdigest() != entry["sha256"]:
+            return None
+
+        stats[name] = {"sha256": entry["sha256"], "size": version[0], "mtime_ns": version[1]}
+        try:
+            PREVIEW_STAT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(PREVIEW_STAT_CACHE, "w", encoding="utf-8") as f:
+                json.dump(stats, f, indent=2, sort_keys=True)
+        except OSError:  # read-only deployments just hash again next time
+            pass
+
+    snippet_path = PREVIEW_INDEX.parent / entry["html"]
+    if not snippet_path.exists():
+        return None
+    return snippet_path.read_text(encoding="utf-8")
+
+
+def show_ttl_preview(relative_path: str, max_lines: int = 18):
+    version = file_version(relative_path)
+    html = load_ttl_preview_html(relative_path, version, max_lines)
+    if html is not None:
+        st.html(f"<div style='overflow-x:auto; font-size:0.8rem'>{html}</div>")
+    else:
+        st.code(load_ttl_preview(relative_path, version, max_lines), language="turtle")
+
 tab_assert, tab_enrich, tab_interop = st.tabs(
     [
         "RDF Assertion and Serialization",
@@ -2432,17 +3110,11 @@ The catalog metadata itself is published under **[CC0](https://creativecommons.o
 
     with col_left:
         st.markdown("**Catalog-level metadata** describes the overall data catalog and lists all dataset entries.")
-        st.code(
-            load_ttl_preview(str(ttl_catalog_rel)),
-            language="turtle",
-        )
+        show_ttl_preview(str(ttl_catalog_rel))
         
     with col_right:
         st.markdown("**Dataset-level metadata** contains detailed metadata for each individual dataset.")
-        st.code(
-            load_ttl_preview(str(ttl_dataset_rel)),
-            language="turtle",
-        )
+        show_ttl_preview(str(ttl_dataset_rel))
 
     st.caption(
     "You can inspect and download the complete RDF files in the project repository:"
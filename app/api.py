@@ -0,0 +1,220 @@
+"""
+Read-only HTTP API for the regional metrics (MD1–MD5).
+
+Serves the tables of the data snapshot (see app/snapshot.py) as JSON or
+Arrow IPC, so other tools do not have to scrape the CSVs or rerun the
+notebooks. Run it next to the dashboard with:
+
+    uvicorn api:app --app-dir app --port 8000
+
+Endpoints:
+
+    GET /tables                 list of tables, columns and row counts
+    GET /tables/{name}          one table (name: MD1…MD5, case-insensitive)
+
+Query parameters for /tables/{name}:
+
+    region_code=1,2,3           keep only these regions
+    macro_region=North,South    keep only these macro-regions
+    columns=region,share_65plus project onto these columns
+    format=json|arrow           response format (default: Accept header, else JSON)
+
+Responses carry an ETag derived from the snapshot content hash and the
+normalised query (invalid queries are rejected first), and honour
+If-None-Match with 304 Not Modified. The snapshot is loaded once at start
+up and encoded responses are cached, so repeated requests are served from
+memory.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from manifest import iter_datasets
+from snapshot import SNAPSHOT_NAME, load_snapshot
+
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "app_ready"
+
+# public table names → snapshot sections, for every dataset the manifest puts in the snapshot
+TABLES = {
+    data["snapshot_table"].upper(): (data["snapshot_table"], data["id"])
+    for data in iter_datasets()
+    if "snapshot_table" in data
+}
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+JSON_MEDIA_TYPE = "application/json"
+
+_tables, _, _header = load_snapshot(DATA_PATH / SNAPSHOT_NAME)
+CONTENT_HASH = _header["content_hash"]
+
+# macro-region of every region, so MD1–MD3 can be filtered by it as well
+MACRO_BY_CODE = dict(zip(_tables["md5"]["region_code"], _tables["md5"]["macro_region"]))
+
+ARROW_TABLES = {}
+REGION_CODES = {}
+MACRO_REGIONS = {}
+for _public, (_section, _) in TABLES.items():
+    _df = _tables[_section]
+    if "COD_REG" in _df.columns:
+        _df = _df.drop(columns="COD_REG")
+    ARROW_TABLES[_public] = pa.Table.from_pandas(_df, preserve_index=False)
+    REGION_CODES[_public] = _df["region_code"].to_numpy()
+    MACRO_REGIONS[_public] = np.array(
+        [str(MACRO_BY_CODE.get(code, "")).lower() for code in _df["region_code"]]
+    )
+
+
+def _parse_list(value):
+    if value is None or value == "":
+        return None
+    return tuple(sorted({item.strip() for item in value.split(",") if item.strip()}))
+
+
+def _resolve_table(name: str):
+    key = name.upper()
+    for public, (_, dataset_id) in TABLES.items():
+        if key in (public, dataset_id.upper()):
+            return public
+    return None
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_query(table_name: str, params):
+    """
+    Validated, normalised filters and projection: (region codes, macro-regions, columns).
+
+    Normalised values are sorted tuples (or None), so equivalent queries share
+    one cache entry and one ETag.
+    """
+    region_codes = _parse_list(params.get("region_code"))
+    if region_codes is not None:
+        try:
+            region_codes = tuple(sorted({int(code) for code in region_codes}))
+        except ValueError:
+            raise BadRequest("region_code must be a comma-separated list of integers")
+
+    macro_regions = _parse_list(params.get("macro_region"))
+    if macro_regions is not None:
+        macro_regions = tuple(sorted({m.lower() for m in macro_regions}))
+
+    columns = _parse_list(params.get("columns"))
+    if columns is not None:
+        unknown = [c for c in columns if c not in ARROW_TABLES[table_name].column_names]
+        if unknown:
+            raise BadRequest(f"Unknown columns: {', '.join(unknown)}")
+
+    return region_codes, macro_regions, columns
+
+
+@lru_cache(maxsize=4096)
+def render(table_name: str, region_codes, macro_regions, columns, fmt: str) -> bytes:
+    """
+    Filter, project and encode one table (arguments from parse_query). Cached per distinct query.
+    """
+    table = ARROW_TABLES[table_name]
+
+    keep = np.ones(table.num_rows, dtype=bool)
+    if region_codes is not None:
+        keep &= np.isin(REGION_CODES[table_name], region_codes)
+    if macro_regions is not None:
+        keep &= np.isin(MACRO_REGIONS[table_name], macro_regions)
+    if not keep.all():
+        table = table.filter(pa.array(keep))
+
+    if columns is not None:
+        # keep the original column order
+        table = table.select([c for c in table.column_names if c in columns])
+
+    if fmt == "arrow":
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    return table.to_pandas().to_json(orient="records", force_ascii=False, double_precision=15).encode("utf-8")
+
+
+def _etag(fmt: str, *query) -> str:
+    """
+    Strong ETag: snapshot content hash, format and the normalised query.
+    """
+    if not query:
+        return f'"{CONTENT_HASH[:32]}-{fmt}"'
+    digest = hashlib.sha256(repr(query).encode("utf-8")).hexdigest()[:16]
+    return f'"{CONTENT_HASH[:32]}-{fmt}-{digest}"'
+
+
+def _not_modified(request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def list_tables(request):
+    etag = _etag("index")
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    body = {
+        "content_hash": CONTENT_HASH,
+        "tables": [
+            {
+                "name": public,
+                "dataset_id": dataset_id,
+                "rows": ARROW_TABLES[public].num_rows,
+                "columns": ARROW_TABLES[public].column_names,
+            }
+            for public, (_, dataset_id) in TABLES.items()
+        ],
+    }
+    return JSONResponse(body, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+async def get_table(request):
+    table_name = _resolve_table(request.path_params["name"])
+    if table_name is None:
+        return JSONResponse({"error": "Unknown table"}, status_code=404)
+
+    params = request.query_params
+    fmt = params.get("format")
+    if fmt is None:
+        fmt = "arrow" if ARROW_MEDIA_TYPE in request.headers.get("accept", "") else "json"
+    if fmt not in ("json", "arrow"):
+        return JSONResponse({"error": "format must be 'json' or 'arrow'"}, status_code=400)
+
+    try:
+        query = parse_query(table_name, params)
+    except BadRequest as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    etag = _etag(fmt, table_name, *query)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = render(table_name, *query, fmt)
+
+    media_type = ARROW_MEDIA_TYPE if fmt == "arrow" else JSON_MEDIA_TYPE
+    return Response(body, media_type=media_type, headers=headers)
+
+
+app = Starlette(
+    routes=[
+        Route("/tables", list_tables, methods=["GET"]),
+        Route("/tables/{name}", get_table, methods=["GET"]),
+    ]
+)
@@ -0,0 +1,258 @@
+"""
+Gazetteer of Italian territorial units (data/reference/gazetteer_it.csv).
+
+One row per unit, with its ISTAT code, the code of the unit above it and
+"|"-separated aliases (English, German/French/Friulian/Sardinian forms and
+the spellings found in ISTAT exports):
+
+    level,code,parent_code,name,macro_region,aliases
+    region,4,,Trentino-Alto Adige/Südtirol,North,Trentino-Alto Adige|...
+    province,21,4,Provincia Autonoma Bolzano/Bozen,,Bolzano/Bozen|Bolzano|...
+
+The hierarchy is region → province → comune. Municipalities are not
+shipped with the repository; convert the ISTAT "Elenco dei comuni italiani"
+once with
+
+    python app/gazetteer.py comuni Elenco-comuni-italiani.csv
+
+and data/reference/comuni_it.csv is loaded together with the base file.
+
+Names are matched on a normalised key (case, accents, punctuation and
+spacing removed), computed with pandas string methods on the distinct
+values only, and resolved through a dict index built once per file
+version. Keys that still do not match fall back to difflib, whose answers
+are cached, so results are deterministic and each misspelling costs one
+fuzzy search per process.
+"""
+
+import argparse
+import difflib
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+import pandas as pd
+
+
+REFERENCE_DIR = Path(__file__).resolve().parent.parent / "data" / "reference"
+GAZETTEER_PATH = REFERENCE_DIR / "gazetteer_it.csv"
+COMUNI_PATH = REFERENCE_DIR / "comuni_it.csv"
+
+LEVELS = ("region", "province", "comune")
+COLUMNS = ["level", "code", "parent_code", "name", "macro_region", "aliases"]
+
+FUZZY_CUTOFF = 0.88
+
+
+def normalize_names(values) -> pd.Series:
+    """
+    Matching key for each name: "Valle d'Aosta / Vallée d'Aoste" → "valle d aosta vallee d aoste".
+    """
+    values = pd.Series(values, dtype="object")
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+
+    keys = (
+        pd.Series(uniques, dtype="object")
+        .astype(str)
+        .str.normalize("NFKD")
+        .str.encode("ascii", errors="ignore")
+        .str.decode("ascii")
+        .str.casefold()
+        .str.replace(r"[^a-z0-9]+", " ", regex=True)
+        .str.strip()
+    )
+
+    out = pd.Series(keys.to_numpy(dtype=object)[codes], index=values.index, dtype="object")
+    out[codes == -1] = None
+    return out
+
+
+def _read_entries(path) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8")
+    df = df.reindex(columns=COLUMNS, fill_value="")
+    df["code"] = df["code"].astype("int64")
+    df["parent_code"] = pd.to_numeric(df["parent_code"]).astype("Int64")
+    return df
+
+
+def _signature(path):
+    path = Path(path)
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _compile(base: tuple, comuni) -> MappingProxyType:
+    entries = _read_entries(base[0])
+    if comuni is not None:
+        entries = pd.concat([entries, _read_entries(comuni[0])], ignore_index=True)
+
+    unknown = sorted(set(entries["level"]) - set(LEVELS))
+    if unknown:
+        raise ValueError(f"Unknown gazetteer levels: {unknown}")
+
+    # every name and alias of a unit becomes one (level, key) → code row
+    names = entries[["level", "code", "parent_code"]].assign(
+        name=entries["name"] + "|" + entries["aliases"]
+    )
+    names = names.assign(name=names["name"].str.split("|")).explode("name")
+    names = names[names["name"].str.strip() != ""]
+    names["key"] = normalize_names(names["name"]).to_numpy()
+    names = names.drop_duplicates(["level", "code", "key"])
+
+    index, scoped, ambiguous = {}, {}, {}
+    for level, group in names.groupby("level", sort=False):
+        counts = group.groupby("key")["code"].nunique()
+        unique = group[group["key"].map(counts) == 1]
+        index[level] = MappingProxyType(dict(zip(unique["key"], unique["code"])))
+        ambiguous[level] = frozenset(counts.index[counts > 1])
+        # homonyms (e.g. comuni in different provinces) resolve within their parent
+        scoped[level] = MappingProxyType(
+            dict(zip(zip(group["parent_code"].fillna(-1), group["key"]), group["code"]))
+        )
+
+    by_level = {level: entries[entries["level"] == level].set_index("code") for level in LEVELS}
+
+    return MappingProxyType({
+        "entries": entries,
+        "index": MappingProxyType(index),
+        "scoped": MappingProxyType(scoped),
+        "ambiguous": MappingProxyType(ambiguous),
+        "keys": MappingProxyType({level: tuple(sorted(index.get(level, {}))) for level in LEVELS}),
+        "parent": MappingProxyType({
+            level: MappingProxyType(df["parent_code"].dropna().astype("int64").to_dict())
+            for level, df in by_level.items()
+        }),
+        "name": MappingProxyType({level: MappingProxyType(df["name"].to_dict()) for level, df in by_level.items()}),
+        "macro_region": MappingProxyType(by_level["region"]["macro_region"].to_dict()),
+    })
+
+
+def load_gazetteer(path=GAZETTEER_PATH, comuni_path=COMUNI_PATH) -> MappingProxyType:
+    """
+    Compiled gazetteer; re-read only when one of the files changes.
+    """
+    return _compile(_signature(path), _signature(comuni_path))
+
+
+@lru_cache(maxsize=4096)
+def _fuzzy_key(key: str, candidates: tuple):
+    match = difflib.get_close_matches(key, candidates, n=1, cutoff=FUZZY_CUTOFF)
+    return match[0] if match else None
+
+
+def resolve_codes(names, level: str = "region", parents=None, fuzzy: bool = True, gazetteer=None) -> pd.Series:
+    """
+    ISTAT code of each name at `level` (nullable Int64, <NA> when unresolved).
+
+    `parents`, aligned with `names`, restricts the match to units below the
+    given codes and is what disambiguates homonymous comuni. Names without
+    an exact match are tried against the closest known key when `fuzzy`.
+    """
+    gazetteer = gazetteer or load_gazetteer()
+    index = gazetteer["index"].get(level, {})
+    keys = normalize_names(names)
+
+    if parents is None:
+        codes = keys.map(index)
+    else:
+        parents = pd.Series(parents, index=keys.index).astype("Int64").fillna(-1)
+        scoped = gazetteer["scoped"].get(level, {})
+        codes = pd.Series(
+            [scoped.get(pair) for pair in zip(parents, keys)],
+            index=keys.index,
+            dtype="object",
+        )
+
+    missing = codes.isna() & keys.notna()
+    if fuzzy and missing.any():
+        candidates = gazetteer["keys"][level]
+        ambiguous = gazetteer["ambiguous"].get(level, frozenset())
+        replacements = {}
+        for key in keys[missing].unique():
+            if key in ambiguous:
+                continue
+            match = _fuzzy_key(key, candidates)
+            if match is not None:
+                replacements[key] = index[match]
+        codes[missing] = keys[missing].map(replacements)
+
+    return codes.astype("Int64")
+
+
+def parent_codes(codes, level: str, to: str = "region", gazetteer=None) -> pd.Series:
+    """
+    Code of the enclosing unit at level `to` (e.g. province → region).
+    """
+    gazetteer = gazetteer or load_gazetteer()
+    codes = pd.Series(codes).astype("Int64")
+    for step in LEVELS[LEVELS.index(to) + 1:LEVELS.index(level) + 1][::-1]:
+        codes = codes.map(gazetteer["parent"][step]).astype("Int64")
+    return codes
+
+
+def unit_names(codes, level: str = "region", gazetteer=None) -> pd.Series:
+    gazetteer = gazetteer or load_gazetteer()
+    return pd.Series(codes).map(gazetteer["name"][level])
+
+
+def macro_regions(region_codes, gazetteer=None) -> pd.Series:
+    """
+    North / Centre / South / Islands for each region code.
+    """
+    gazetteer = gazetteer or load_gazetteer()
+    return pd.Series(region_codes).map(gazetteer["macro_region"])
+
+
+def import_istat_comuni(src, out_path=COMUNI_PATH) -> Path:
+    """
+    Convert the ISTAT "Elenco dei comuni italiani" CSV to the gazetteer layout.
+
+    The ISTAT headers carry line breaks and footnote markers, so columns are
+    located by their leading words.
+    """
+    raw = pd.read_csv(src, sep=";", dtype=str, encoding="latin-1", keep_default_na=False)
+
+    def column(prefix):
+        for name in raw.columns:
+            if " ".join(name.split()).startswith(prefix):
+                return raw[name].str.strip()
+        raise ValueError(f"Column '{prefix}...' not found in {src}")
+
+    italian = column("Denominazione in italiano")
+    other = column("Denominazione altra lingua")
+    bilingual = column("Denominazione (Italiana e straniera)")
+
+    df = pd.DataFrame({
+        "level": "comune",
+        "code": column("Codice Comune formato numerico").astype("int64"),
+        "parent_code": column("Codice Provincia (Storico)").astype("int64"),
+        "name": italian,
+        "macro_region": "",
+        # "Bolzano/Bozen" is listed both split and whole
+        "aliases": (bilingual + "|" + other.str.replace("/", "|", regex=False)).str.strip("|"),
+    })
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    df.sort_values("code").to_csv(out_path, index=False, encoding="utf-8")
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the gazetteer reference files.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    comuni = sub.add_parser("comuni", help="import the ISTAT list of municipalities")
+    comuni.add_argument("src", type=Path, help="Elenco-comuni-italiani.csv")
+    comuni.add_argument("--out", type=Path, default=COMUNI_PATH)
+    args = parser.parse_args()
+
+    if args.command == "comuni":
+        out_path = import_istat_comuni(args.src, args.out)
+        print(f"saved to: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Key Findings figures, derived from the loaded tables.
+
+The Summary tab used to show hand-copied numbers from
+data_preparation/notebooks/03_results.ipynb. These functions compute the
+same values (and a few more) from the regional metrics of one year and the
+dispersion table. The dashboard caches them per data version and year, and
+the notebook calls the same functions.
+"""
+
+import pandas as pd
+
+
+def national_share(df: pd.DataFrame, numerator: str, denominator: str) -> float:
+    """
+    Share (%) over all regions, weighted by the counts (not a mean of shares).
+    """
+    return float(df[numerator].sum() / df[denominator].sum() * 100)
+
+
+def old_empty_regions(df: pd.DataFrame) -> list:
+    """
+    Regions in the "Old & Empty" quadrant (above-median ageing and vacancy), by name.
+    """
+    mask = (df["high_65"] == 1) & (df["high_vac"] == 1)
+    return sorted(df.loc[mask, "region_norm"])
+
+
+def _top(df: pd.DataFrame, column: str):
+    row = df.loc[df[column].idxmax()]
+    return row["region_code"], float(row[column])
+
+
+def summary_kpis(df: pd.DataFrame, df_disp: pd.DataFrame, datasets: int = None) -> dict:
+    """
+    Key Findings values for one year of regional metrics (MD5 columns) and
+    the dispersion table (MD4 columns).
+    """
+    # labels as in the rest of the dashboard (MD5 region_norm), matched by code
+    names = dict(zip(df["region_code"], df["region_norm"]))
+
+    old_empty = old_empty_regions(df)
+    oldest_code, oldest_share = _top(df, "share_65plus")
+    emptiest_code, emptiest_share = _top(df, "share_unoccupied")
+    dispersed_code, dispersed_index = _top(df_disp, "dispersed_index")
+
+    return {
+        "datasets": datasets,
+        "regions": len(df),
+        "share_65plus": national_share(df, "pop_65plus", "tot_pop"),
+        "share_unoccupied": national_share(df, "homes_unoccupied", "homes_total"),
+        "old_empty_count": len(old_empty),
+        "old_empty_regions": old_empty,
+        "oldest_region": names[oldest_code],
+        "oldest_share": oldest_share,
+        "emptiest_region": names[emptiest_code],
+        "emptiest_share": emptiest_share,
+        "most_dispersed_region": names.get(dispersed_code, dispersed_code),
+        "most_dispersed_index": dispersed_index,
+        "dispersed_ratio": dispersed_index / float(df_disp["dispersed_index"].mean()),
+    }
@@ -0,0 +1,121 @@
+"""
+Dataset manifest (data/datasets.toml) shared by the RDF scripts, the
+dashboard and the data pipeline.
+
+The TOML file is parsed once per process into an immutable compiled form
+(tuples, plus an index by id and by card) and reused until the file changes
+on disk. Consumers iterate it through generators, so nothing is built for
+datasets they do not look at.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+import re
+import tomllib
+
+
+MANIFEST_PATH = Path(__file__).resolve().parent.parent / "data" / "datasets.toml"
+
+REPO_URL = re.compile(r"^https://github\.com/eugeniavd/retired_places/(?:blob|tree)/main/(.+)$")
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=4)
+def _compile(path: str, size: int, mtime_ns: int) -> MappingProxyType:
+    with open(path, "rb") as f:
+        raw = tomllib.load(f)
+
+    datasets = _freeze(raw.get("dataset", []))
+    cards = _freeze(raw.get("card", []))
+
+    ids = [data["id"] for data in datasets]
+    duplicates = sorted({i for i in ids if ids.count(i) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate dataset ids in {path}: {duplicates}")
+
+    by_card = {}
+    for data in datasets:
+        if "card" in data:
+            by_card.setdefault(data["card"], []).append(data["id"])
+
+    return MappingProxyType({
+        "datasets": datasets,
+        "cards": cards,
+        "by_id": MappingProxyType({data["id"]: data for data in datasets}),
+        "by_card": MappingProxyType({key: tuple(value) for key, value in by_card.items()}),
+    })
+
+
+def load_manifest(path=MANIFEST_PATH) -> MappingProxyType:
+    """
+    Compiled manifest; re-parsed only when the file's size or mtime change.
+    """
+    stat = Path(path).stat()
+    return _compile(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def iter_datasets(path=MANIFEST_PATH):
+    """
+    Dataset entries (read-only mappings) in manifest order.
+    """
+    yield from load_manifest(path)["datasets"]
+
+
+def dataset_ids(path=MANIFEST_PATH) -> list:
+    return [data["id"] for data in iter_datasets(path)]
+
+
+def get_dataset(dataset_id: str, path=MANIFEST_PATH):
+    return load_manifest(path)["by_id"][dataset_id]
+
+
+def iter_cards(section: str = None, path=MANIFEST_PATH):
+    """
+    Dashboard cards, optionally only those shown in `section`
+    ("quality", "legal" or "technical").
+    """
+    for card in load_manifest(path)["cards"]:
+        if section is None or section in card["sections"]:
+            yield card
+
+
+def local_path(access_url: str, project_root=MANIFEST_PATH.parent.parent):
+    """
+    File or directory in the working tree for a repository access URL, or
+    None if the URL is not a repository URL or nothing exists at that path.
+    """
+    match = REPO_URL.match(access_url or "")
+    if not match:
+        return None
+
+    path = Path(project_root) / match.group(1)
+    if path.exists():
+        return path
+
+    # some raw folders carry a stray space in their name ("GD4_ places_north_east")
+    parent = path.parent
+    if parent.is_dir():
+        wanted = path.name.replace(" ", "")
+        for candidate in parent.iterdir():
+            if candidate.name.replace(" ", "") == wanted:
+                return candidate
+    return None
+
+
+def to_dict(value):
+    """
+    Mutable copy of a manifest entry (mappings → dicts, tuples → lists).
+    """
+    if isinstance(value, MappingProxyType):
+        return {k: to_dict(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [to_dict(v) for v in value]
+    return value
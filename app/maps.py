@@ -0,0 +1,119 @@
+"""
+Animated choropleths that ship the geometry only once.
+
+`px.choropleth(..., animation_frame=...)` embeds the full GeoJSON in every
+frame. Here the base trace carries the geometry, and each frame only
+updates the per-region value vector `z`, so a frame costs a few bytes per
+region.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+
+def build_frames(df_panel: pd.DataFrame, metric: str, id_col: str = "COD_REG", name_col: str = "region_norm") -> dict:
+    """
+    Compact per-year value vectors for `metric`.
+
+    Returns a dict with `locations` and `names` (one entry per region, in a
+    fixed order), `years` and `z` (one list of values per year, aligned
+    with `locations`; missing regions are None). Plain lists, so the result
+    is cheap to cache and serialise.
+    """
+    wide = df_panel.pivot_table(index=id_col, columns="year", values=metric, aggfunc="first")
+    names = (
+        df_panel.drop_duplicates(id_col, keep="last")
+        .set_index(id_col)[name_col]
+        .reindex(wide.index)
+    )
+
+    values = wide.to_numpy(dtype="float64")
+    z = [
+        [None if np.isnan(v) else float(v) for v in values[:, j]]
+        for j in range(values.shape[1])
+    ]
+
+    return {
+        "locations": [int(code) for code in wide.index],
+        "names": names.astype(str).tolist(),
+        "years": [int(year) for year in wide.columns],
+        "z": z,
+        "zmin": float(np.nanmin(values)) if values.size else 0.0,
+        "zmax": float(np.nanmax(values)) if values.size else 1.0,
+    }
+
+
+def animated_choropleth(
+    frames: dict,
+    geojson: dict,
+    featureidkey: str = "properties.COD_REG",
+    colorbar_title: str = "",
+    value_format: str = ".2f",
+    frame_duration: int = 800,
+) -> go.Figure:
+    """
+    Choropleth with one frame per year; geometry is only in the base trace.
+    """
+    years = frames["years"]
+    hovertemplate = f"<b>%{{hovertext}}</b><br>%{{z:{value_format}}}<extra></extra>"
+
+    fig = go.Figure(
+        data=[
+            go.Choropleth(
+                geojson=geojson,
+                featureidkey=featureidkey,
+                locations=frames["locations"],
+                z=frames["z"][0],
+                zmin=frames["zmin"],
+                zmax=frames["zmax"],
+                hovertext=frames["names"],
+                hovertemplate=hovertemplate,
+                colorscale="Plasma",
+                colorbar_title=colorbar_title,
+            )
+        ],
+        frames=[
+            go.Frame(name=str(year), data=[go.Choropleth(z=z)], traces=[0])
+            for year, z in zip(years, frames["z"])
+        ],
+    )
+
+    play_args = {"frame": {"duration": frame_duration, "redraw": True}, "fromcurrent": True}
+    fig.update_layout(
+        updatemenus=[
+            {
+                "type": "buttons",
+                "showactive": False,
+                "x": 0.0,
+                "y": 0.0,
+                "xanchor": "right",
+                "yanchor": "top",
+                "buttons": [
+                    {"label": "▶", "method": "animate", "args": [None, play_args]},
+                    {
+                        "label": "❚❚",
+                        "method": "animate",
+                        "args": [[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate"}],
+                    },
+                ],
+            }
+        ],
+        sliders=[
+            {
+                "active": 0,
+                "currentvalue": {"prefix": "Year: "},
+                "steps": [
+                    {
+                        "label": str(year),
+                        "method": "animate",
+                        "args": [[str(year)], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate"}],
+                    }
+                    for year in years
+                ],
+            }
+        ],
+    )
+    fig.update_geos(fitbounds="locations", visible=False, projection_type="mercator")
+
+    return fig
@@ -0,0 +1,153 @@
+"""
+Cohort-component projection of the regional age structure.
+
+Starting from the single-year population by region, sex and age (the
+"population_age" snapshot table, 2025), each projected year
+
+- ages every cohort by one year with Gompertz survival rates
+  (hazard a·exp(b·age), with `a` falling by the mortality improvement
+  each year); the 100+ group is open and keeps its survivors,
+- adds births from women aged 15–49 with an age schedule scaled to the
+  total fertility rate, split by the sex ratio at birth,
+- adds net migration, a rate per 1,000 residents spread over a young-adult
+  age profile.
+
+All regions and both sexes move together as one (region, sex, age) array,
+so a 25-year run is a few dozen vectorised steps. The dashboard memoises
+runs per data version and parameter set.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+BASE_YEAR = 2025
+TARGET_YEARS = (2030, 2040, 2050)
+MAX_AGE = 100  # open age group 100+
+
+SEXES = ("male", "female")
+
+# Gompertz hazard per sex: mu(age) = a * exp(b * age), calibrated to a
+# life expectancy at birth of about 81 (men) and 85 (women)
+GOMPERTZ = {"male": (1.7e-5, 0.1), "female": (1.1e-5, 0.1)}
+
+DEFAULTS = {
+    "tfr": 1.18,  # children per woman
+    "mortality_improvement": 1.0,  # % decline of the hazard per year
+    "net_migration": 2.5,  # net migrants per 1,000 residents per year
+}
+
+SEX_RATIO_AT_BIRTH = 1.05  # boys per girl
+FERTILITY_PEAK, FERTILITY_SD = 32.0, 5.5
+MIGRATION_PEAK, MIGRATION_SD = 28.0, 9.0
+
+
+AGES = np.arange(MAX_AGE + 1)
+
+
+def population_tensor(df: pd.DataFrame):
+    """
+    (region codes, (regions, 2, MAX_AGE + 1) population array) from the long table.
+    """
+    df = df[df["age"] <= MAX_AGE]
+    codes = np.sort(df["region_code"].unique())
+    row = np.searchsorted(codes, df["region_code"].to_numpy())
+    age = df["age"].to_numpy()
+
+    population = np.zeros((len(codes), len(SEXES), MAX_AGE + 1))
+    for s, sex in enumerate(SEXES):
+        population[row, s, age] = df[f"pop_{sex}"].to_numpy(dtype="float64")
+    return codes, population
+
+
+def survival_rates(year_offset: int, mortality_improvement: float) -> np.ndarray:
+    """
+    (2, MAX_AGE + 1) probability of surviving from age x to x + 1.
+    """
+    factor = (1 - mortality_improvement / 100) ** year_offset
+    rates = np.empty((len(SEXES), MAX_AGE + 1))
+    for s, sex in enumerate(SEXES):
+        a, b = GOMPERTZ[sex]
+        # integrated hazard over [x, x + 1]
+        rates[s] = np.exp(-a * factor / b * np.exp(b * AGES) * (np.exp(b) - 1))
+    return rates
+
+
+def _profile(peak: float, sd: float, low: int, high: int) -> np.ndarray:
+    weights = np.exp(-0.5 * ((AGES - peak) / sd) ** 2)
+    weights[(AGES < low) | (AGES > high)] = 0
+    return weights / weights.sum()
+
+
+FERTILITY_PROFILE = _profile(FERTILITY_PEAK, FERTILITY_SD, 15, 49)
+MIGRATION_PROFILE = _profile(MIGRATION_PEAK, MIGRATION_SD, 0, 70)
+
+
+def life_expectancy(mortality_improvement: float = 0.0, year_offset: int = 0) -> dict:
+    """
+    Period life expectancy at birth implied by the Gompertz rates, per sex.
+    """
+    rates = survival_rates(year_offset, mortality_improvement)
+    alive = np.cumprod(np.concatenate([np.ones((len(SEXES), 1)), rates[:, :-1]], axis=1), axis=1)
+    # survivors live half of their final year on average
+    years = (alive * (1 + rates) / 2).sum(axis=1)
+    return dict(zip(SEXES, years))
+
+
+def project(population: np.ndarray, end_year: int = TARGET_YEARS[-1], tfr: float = DEFAULTS["tfr"],
+            mortality_improvement: float = DEFAULTS["mortality_improvement"],
+            net_migration: float = DEFAULTS["net_migration"]) -> dict:
+    """
+    Project a (regions, 2, MAX_AGE + 1) population from BASE_YEAR to `end_year`.
+
+    Returns {"years": (T,), "total": (regions, T), "pop_65plus": (regions, T),
+    "share_65plus": (regions, T)}, with BASE_YEAR as the first column.
+    """
+    years = np.arange(BASE_YEAR, end_year + 1)
+    current = np.asarray(population, dtype="float64").copy()
+
+    total = np.empty((len(current), len(years)))
+    pop_65 = np.empty((len(current), len(years)))
+    total[:, 0] = current.sum(axis=(1, 2))
+    pop_65[:, 0] = current[:, :, 65:].sum(axis=(1, 2))
+
+    asfr = tfr * FERTILITY_PROFILE
+    boys = SEX_RATIO_AT_BIRTH / (1 + SEX_RATIO_AT_BIRTH)
+
+    for t in range(1, len(years)):
+        survival = survival_rates(t, mortality_improvement)
+
+        births = current[:, 1, :] @ asfr
+        migrants = total[:, t - 1] * net_migration / 1000
+
+        aged = np.empty_like(current)
+        aged[:, :, 1:] = current[:, :, :-1] * survival[None, :, :-1]
+        aged[:, :, MAX_AGE] += current[:, :, MAX_AGE] * survival[None, :, MAX_AGE]
+        # newborns are exposed to about half a year of infant mortality
+        aged[:, :, 0] = births[:, None] * np.array([boys, 1 - boys])[None, :] * np.sqrt(survival[None, :, 0])
+        aged += migrants[:, None, None] * 0.5 * MIGRATION_PROFILE[None, None, :]
+
+        current = np.maximum(aged, 0)
+        total[:, t] = current.sum(axis=(1, 2))
+        pop_65[:, t] = current[:, :, 65:].sum(axis=(1, 2))
+
+    return {
+        "years": years,
+        "total": total,
+        "pop_65plus": pop_65,
+        "share_65plus": pop_65 / total * 100,
+    }
+
+
+def projection_table(codes, result: dict, years=TARGET_YEARS) -> pd.DataFrame:
+    """
+    Long table (region_code, year, total, pop_65plus, share_65plus) for `years`.
+    """
+    columns = np.searchsorted(result["years"], years)
+    return pd.DataFrame({
+        "region_code": np.repeat(codes, len(years)),
+        "year": np.tile(np.asarray(years), len(codes)),
+        "total": result["total"][:, columns].ravel(),
+        "pop_65plus": result["pop_65plus"][:, columns].ravel(),
+        "share_65plus": result["share_65plus"][:, columns].ravel(),
+    })
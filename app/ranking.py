@@ -0,0 +1,123 @@
+"""
+Precomputed rankings for the ranked bar chart.
+
+The pipeline stores the regional metrics in long format (one row per
+region and metric) together with the rank of every region by each ranking
+metric, both across Italy and within its macro-region. The dashboard then
+only filters rows and places regions by rank: no melt, map or sort per rerun.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+METRIC_LABELS = {
+    "share_65plus": "Share of 65+",
+    "share_unoccupied": "Share of unoccupied homes",
+}
+
+RANK_SCOPES = ("italy", "macro")
+
+
+def rank_column(metric: str, scope: str) -> str:
+    """
+    Name of the column holding the descending rank of `metric` within `scope`.
+    """
+    return f"rank_{metric}_{scope}"
+
+
+def build_ranked_long(df: pd.DataFrame, id_col: str = "region_norm") -> pd.DataFrame:
+    """
+    Melt the metrics table and attach per-metric, per-scope rank columns.
+
+    Ranks are descending (1 = highest value) and ties are broken by row
+    order.
+    """
+    base = df[["region_code", id_col, "macro_region", *METRIC_LABELS]].copy()
+
+    for metric in METRIC_LABELS:
+        base[rank_column(metric, "italy")] = (
+            base[metric].rank(method="first", ascending=False).astype("int32")
+        )
+        base[rank_column(metric, "macro")] = (
+            base.groupby("macro_region")[metric]
+            .rank(method="first", ascending=False)
+            .astype("int32")
+        )
+
+    rank_cols = [rank_column(m, s) for m in METRIC_LABELS for s in RANK_SCOPES]
+    df_long = base.melt(
+        id_vars=["region_code", id_col, "macro_region", *rank_cols],
+        value_vars=list(METRIC_LABELS),
+        var_name="metric",
+        value_name="value",
+    )
+    df_long["metric_label"] = df_long["metric"].map(METRIC_LABELS)
+
+    return df_long.reset_index(drop=True)
+
+
+def ranked_slice(
+    df_long: pd.DataFrame,
+    ranking_metric: str,
+    metrics: list,
+    macro_region: str = None,
+    top_n: int = None,
+    ascending: bool = False,
+    id_col: str = "region_norm",
+):
+    """
+    Rows to plot and the category order for the ranked bar chart.
+
+    `macro_region=None` ranks across all of Italy. Returns the selected
+    long-format rows and the unit names ordered by the ranking metric
+    (increasing values when `ascending`, decreasing otherwise).
+    """
+    if macro_region is None:
+        rows = df_long
+        rank_col = rank_column(ranking_metric, "italy")
+    else:
+        rows = df_long[df_long["macro_region"] == macro_region]
+        rank_col = rank_column(ranking_metric, "macro")
+
+    rank = rows[rank_col].to_numpy()
+    in_range = rank <= top_n if top_n is not None else np.ones(len(rows), dtype=bool)
+
+    df_plot = rows[in_range & rows["metric"].isin(metrics).to_numpy()]
+
+    # ranks within the slice are 1..k, so each name goes straight to its slot
+    anchor = rows[in_range & (rows["metric"] == ranking_metric).to_numpy()]
+    position = anchor[rank_col].to_numpy() - 1
+    if ascending:
+        position = len(anchor) - 1 - position
+    order = np.empty(len(anchor), dtype=object)
+    order[position] = anchor[id_col].to_numpy()
+
+    return df_plot, order.tolist()
+
+
+def top_n_indices(values, n: int, descending: bool = True) -> np.ndarray:
+    """
+    Positions of the `n` most extreme values, most extreme first.
+
+    Uses a partial selection (np.argpartition, O(len(values))) and only
+    sorts the `n` selected values, instead of sorting the whole column.
+    """
+    values = np.asarray(values, dtype="float64")
+    n = max(0, min(int(n), len(values)))
+    if n == 0:
+        return np.empty(0, dtype="int64")
+
+    key = -values if descending else values
+    if n < len(values):
+        candidates = np.argpartition(key, n - 1)[:n]
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(key[candidates], kind="stable")]
+
+
+def top_n_rows(df: pd.DataFrame, column: str, n: int, descending: bool = True) -> pd.DataFrame:
+    """
+    Rows of `df` with the `n` most extreme values of `column`, most extreme first.
+    """
+    return df.iloc[top_n_indices(df[column].to_numpy(), n, descending)]
@@ -0,0 +1,65 @@
+"""
+Threshold sensitivity of the 2×2 quadrant classification.
+
+MD5 splits regions at the median share of 65+ and of unoccupied homes.
+Here every pair of thresholds on a dense grid is evaluated at once: the
+membership tests broadcast to a (threshold_65, threshold_vac, region)
+boolean cube, and the "Old & Empty" frequency of each region is averaged
+out of it. The dashboard caches the result per data snapshot.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+QUADRANTS = ("Old & Empty", "Old & Lived-in", "Younger but Emptying", "Younger & Lived-in")
+
+
+def threshold_grid(values, steps: int = 81) -> np.ndarray:
+    """
+    `steps` evenly spaced thresholds from the smallest to the largest value.
+    """
+    values = np.asarray(values, dtype="float64")
+    return np.linspace(values.min(), values.max(), steps)
+
+
+def quadrant_cube(share_65, share_vac, thresholds_65, thresholds_vac) -> np.ndarray:
+    """
+    Quadrant index (position in QUADRANTS) for every (threshold_65, threshold_vac, region).
+    """
+    high_65 = np.asarray(share_65, dtype="float64")[None, :] >= np.asarray(thresholds_65)[:, None]
+    high_vac = np.asarray(share_vac, dtype="float64")[None, :] >= np.asarray(thresholds_vac)[:, None]
+
+    # bit 1: younger, bit 0: lived-in, so "Old & Empty" is 0 and "Younger & Lived-in" is 3
+    return (~high_65[:, None, :]).astype("int8") * 2 + (~high_vac[None, :, :]).astype("int8")
+
+
+def threshold_sweep(df: pd.DataFrame, steps: int = 81, id_col: str = "region_norm") -> dict:
+    """
+    Sweep of the quadrant classification over a steps × steps threshold grid.
+
+    Returns:
+        thresholds_65, thresholds_vac: the grid axes
+        old_empty_by_65: (regions, steps) share of vacancy thresholds that put
+            each region in "Old & Empty", for each ageing threshold
+        old_empty_share: per-region share of the whole grid in "Old & Empty"
+        old_empty_count: (steps, steps) number of "Old & Empty" regions per pair
+        regions: region labels, most stable "Old & Empty" first
+    """
+    thresholds_65 = threshold_grid(df["share_65plus"], steps)
+    thresholds_vac = threshold_grid(df["share_unoccupied"], steps)
+
+    old_empty = quadrant_cube(df["share_65plus"], df["share_unoccupied"], thresholds_65, thresholds_vac) == 0
+
+    by_65 = old_empty.mean(axis=1).T
+    share = old_empty.mean(axis=(0, 1))
+    order = np.lexsort((df[id_col].to_numpy(), -share))
+
+    return {
+        "thresholds_65": thresholds_65,
+        "thresholds_vac": thresholds_vac,
+        "old_empty_by_65": by_65[order],
+        "old_empty_share": share[order],
+        "old_empty_count": old_empty.sum(axis=2),
+        "regions": df[id_col].to_numpy()[order],
+    }
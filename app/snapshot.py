@@ -0,0 +1,254 @@
+"""
+Single-file snapshot of the app-ready data.
+
+The pipeline bundles every table used by the dashboard (as Arrow IPC
+streams) and the regional GeoJSON into one versioned file. The dashboard
+memory-maps that file instead of parsing several CSV/GeoJSON files on each
+cold start.
+
+Layout of a snapshot file:
+
+    8 bytes   magic  b"RPSNAP01"
+    8 bytes   header length (little-endian unsigned int)
+    n bytes   header (UTF-8 JSON: version, content hash, metadata, sections)
+    ...       sections, each aligned to 64 bytes
+
+Sections are "arrow" (an Arrow IPC file holding one table), "json" (a
+compact JSON document) or "geojson" parts. Polygon GeoJSON documents are
+stored as three Arrow tables (feature properties, ring lengths and a flat
+coordinate array) so that loading the boundaries needs no text parsing.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+
+
+SNAPSHOT_MAGIC = b"RPSNAP01"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_NAME = "retired_places.snapshot"
+
+_ALIGNMENT = 64
+
+
+def _pad(n: int) -> int:
+    return (-n) % _ALIGNMENT
+
+
+def _table_to_ipc(df) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _geojson_to_tables(doc: dict):
+    """
+    Split a Polygon/MultiPolygon FeatureCollection into Arrow-friendly tables.
+
+    Returns None when the document holds other geometry types; such
+    documents are stored as plain JSON instead.
+    """
+    properties = []
+    geometry_types = []
+    ring_feature, ring_polygon, ring_length = [], [], []
+    chunks = []
+
+    for i, feature in enumerate(doc.get("features", [])):
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") == "Polygon":
+            polygons = [geometry["coordinates"]]
+        elif geometry.get("type") == "MultiPolygon":
+            polygons = geometry["coordinates"]
+        else:
+            return None
+
+        properties.append(feature.get("properties") or {})
+        geometry_types.append(geometry["type"])
+        for j, polygon in enumerate(polygons):
+            for ring in polygon:
+                points = np.asarray(ring, dtype="float64").reshape(-1, 2)
+                ring_feature.append(i)
+                ring_polygon.append(j)
+                ring_length.append(len(points))
+                chunks.append(points)
+
+    df_features = pd.DataFrame(properties)
+    df_features["__geometry_type"] = geometry_types
+    df_rings = pd.DataFrame(
+        {
+            "feature": np.asarray(ring_feature, dtype="int32"),
+            "polygon": np.asarray(ring_polygon, dtype="int32"),
+            "length": np.asarray(ring_length, dtype="int64"),
+        }
+    )
+    points = np.concatenate(chunks) if chunks else np.empty((0, 2))
+    df_coords = pd.DataFrame({"x": points[:, 0], "y": points[:, 1]})
+
+    members = {key: value for key, value in doc.items() if key != "features"}
+    return members, {"features": df_features, "rings": df_rings, "coords": df_coords}
+
+
+def _tables_to_geojson(members: dict, parts: dict) -> dict:
+    df_features = parts["features"]
+    df_rings = parts["rings"]
+    coords = parts["coords"]
+
+    # one C-level conversion for all points, then cheap list slicing per ring
+    points = np.column_stack((coords["x"].to_numpy(), coords["y"].to_numpy())).tolist()
+    stops = np.cumsum(df_rings["length"].to_numpy()).tolist()
+    starts = [0] + stops[:-1]
+
+    geometry_types = df_features["__geometry_type"].tolist()
+    properties = df_features.drop(columns="__geometry_type").to_dict("records")
+    polygons_by_feature = [[] for _ in geometry_types]
+    ring_iter = zip(df_rings["feature"].tolist(), df_rings["polygon"].tolist(), starts, stops)
+    for feature_idx, polygon_idx, start, stop in ring_iter:
+        polygons = polygons_by_feature[feature_idx]
+        if polygon_idx == len(polygons):
+            polygons.append([])
+        polygons[polygon_idx].append(points[start:stop])
+
+    features = []
+    for props, geometry_type, polygons in zip(properties, geometry_types, polygons_by_feature):
+        coordinates = polygons[0] if geometry_type == "Polygon" else polygons
+        features.append(
+            {
+                "type": "Feature",
+                "properties": props,
+                "geometry": {"type": geometry_type, "coordinates": coordinates},
+            }
+        )
+
+    doc = dict(members)
+    doc["features"] = features
+    return doc
+
+
+def write_snapshot(path, tables: dict, documents: dict, metadata: dict = None) -> str:
+    """
+    Write DataFrames and JSON documents to a single snapshot file.
+
+    The content hash covers only the section bytes, so rebuilding the same
+    data produces the same hash and does not invalidate caches.
+    Returns the content hash.
+    """
+    payloads = []
+    geojson_members = {}
+    for name, df in tables.items():
+        payloads.append((name, "arrow", _table_to_ipc(df)))
+    for name, doc in documents.items():
+        split = _geojson_to_tables(doc) if doc.get("type") == "FeatureCollection" else None
+        if split is None:
+            payloads.append(
+                (name, "json", json.dumps(doc, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+            )
+            continue
+        geojson_members[name], parts = split
+        for part, df in parts.items():
+            payloads.append((f"{name}/{part}", "geojson", _table_to_ipc(df)))
+
+    digest = hashlib.sha256()
+    for name, kind, data in payloads:
+        digest.update(f"{name}:{kind}:{len(data)}\n".encode("utf-8"))
+        digest.update(data)
+    content_hash = digest.hexdigest()
+
+    # Offsets depend on the header length, which depends on the offsets:
+    # render the header until its length stops changing.
+    sections = {name: {"kind": kind, "offset": 0, "length": len(data)} for name, kind, data in payloads}
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "content_hash": content_hash,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "metadata": metadata or {},
+        "geojson": geojson_members,
+        "sections": sections,
+    }
+    header_bytes = b""
+    while True:
+        offset = len(SNAPSHOT_MAGIC) + 8 + len(header_bytes)
+        offset += _pad(offset)
+        for name, kind, data in payloads:
+            sections[name]["offset"] = offset
+            offset += len(data) + _pad(len(data))
+        rendered = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        if len(rendered) == len(header_bytes):
+            break
+        header_bytes = rendered
+    header_bytes = rendered
+
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for name, kind, data in payloads:
+            f.write(b"\0" * (sections[name]["offset"] - f.tell()))
+            f.write(data)
+        f.write(b"\0" * _pad(f.tell()))
+    os.replace(tmp_path, path)
+
+    return content_hash
+
+
+def read_snapshot_header(path) -> dict:
+    """
+    Read only the header of a snapshot (a few hundred bytes).
+
+    Cheap enough to call on every rerun to get the content hash.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(SNAPSHOT_MAGIC))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a Retired Places snapshot: {path}")
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    if header.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {header.get('version')} in {path} "
+            f"(expected {SNAPSHOT_VERSION})"
+        )
+    return header
+
+
+def load_snapshot(path):
+    """
+    Memory-map a snapshot and return (tables, documents, header).
+
+    Arrow sections are read zero-copy from the mapped file and converted
+    to DataFrames; only the JSON documents need decoding.
+    """
+    header = read_snapshot_header(path)
+    buffer = pa.memory_map(str(path), "r").read_buffer()
+
+    tables = {}
+    documents = {}
+    geojson_parts = {name: {} for name in header.get("geojson", {})}
+    for name, section in header["sections"].items():
+        data = buffer.slice(section["offset"], section["length"])
+        if section["kind"] == "arrow":
+            tables[name] = pa.ipc.open_file(data).read_all().to_pandas()
+        elif section["kind"] == "geojson":
+            doc_name, part = name.split("/", 1)
+            geojson_parts[doc_name][part] = pa.ipc.open_file(data).read_all().to_pandas()
+        elif section["kind"] == "json":
+            documents[name] = json.loads(data.to_pybytes())
+        else:
+            raise ValueError(f"Unknown section kind {section['kind']!r} in {path}")
+
+    for name, members in header.get("geojson", {}).items():
+        documents[name] = _tables_to_geojson(members, geojson_parts[name])
+
+    return tables, documents, header
@@ -0,0 +1,161 @@
+"""
+Append-only, year-partitioned store for multi-year data.
+
+Each dataset (e.g. "population", "housing", "metrics") is kept as one
+Arrow IPC file per reference year:
+
+    data/store/<dataset>/year=<YYYY>.arrow
+
+and every write is recorded in data/store/manifest.json. Partitions are
+never rewritten: ingesting a new ISTAT release only adds its own year, so
+history is not recomputed. The manifest hash identifies the store version
+for caching in the dashboard.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _manifest_path(store_root) -> Path:
+    return Path(store_root) / MANIFEST_NAME
+
+
+def partition_path(store_root, dataset: str, year: int) -> Path:
+    return Path(store_root) / dataset / f"year={int(year)}.arrow"
+
+
+def read_manifest(store_root) -> dict:
+    """
+    Manifest of the store; an empty one if nothing was ingested yet.
+    """
+    path = _manifest_path(store_root)
+    if not path.exists():
+        return {"partitions": []}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def store_version(store_root) -> str:
+    """
+    Hash of the manifest, changes whenever a partition is added.
+    """
+    path = _manifest_path(store_root)
+    if not path.exists():
+        return "empty"
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def list_years(store_root, dataset: str) -> list:
+    """
+    Sorted reference years available for `dataset`.
+    """
+    manifest = read_manifest(store_root)
+    return sorted(p["year"] for p in manifest["partitions"] if p["dataset"] == dataset)
+
+
+def _write_table(table: pa.Table, path: Path):
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def append_partitions(store_root, year: int, frames: dict, source: str = None) -> list:
+    """
+    Write several partitions of the same `year` ({dataset: df}) together.
+
+    Every frame is encoded and written to a temporary file first, and the
+    manifest is updated once after all of them are in place, so a failure
+    leaves no partial release in the store. Raises FileExistsError if any of
+    the partitions already exists: releases are appended, never overwritten.
+    """
+    paths = {dataset: partition_path(store_root, dataset, year) for dataset in frames}
+    existing = [str(path) for path in paths.values() if path.exists()]
+    if existing:
+        raise FileExistsError(f"Partition already exists: {', '.join(existing)}")
+
+    tables = {dataset: pa.Table.from_pandas(df, preserve_index=False) for dataset, df in frames.items()}
+
+    placed = []
+    try:
+        for dataset, table in tables.items():
+            path = paths[dataset]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_table(table, path.with_suffix(".arrow.tmp"))
+        for path in paths.values():
+            os.replace(path.with_suffix(".arrow.tmp"), path)
+            placed.append(path)
+
+        manifest = read_manifest(store_root)
+        ingested_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for dataset, table in tables.items():
+            path = paths[dataset]
+            manifest["partitions"].append(
+                {
+                    "dataset": dataset,
+                    "year": int(year),
+                    "path": path.relative_to(Path(store_root)).as_posix(),
+                    "rows": int(table.num_rows),
+                    "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+                    "source": source,
+                    "ingested_at": ingested_at,
+                }
+            )
+        manifest_tmp = _manifest_path(store_root).with_suffix(".json.tmp")
+        with open(manifest_tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(manifest_tmp, _manifest_path(store_root))
+    except BaseException:
+        # partitions not recorded in the manifest are removed again
+        for path in paths.values():
+            path.with_suffix(".arrow.tmp").unlink(missing_ok=True)
+        for path in placed:
+            path.unlink(missing_ok=True)
+        raise
+
+    return list(paths.values())
+
+
+def append_partition(store_root, dataset: str, year: int, df: pd.DataFrame, source: str = None) -> Path:
+    """
+    Write `df` as the partition of `dataset` for `year` (see append_partitions).
+    """
+    return append_partitions(store_root, year, {dataset: df}, source=source)[0]
+
+
+def read_partition(store_root, dataset: str, year: int) -> pd.DataFrame:
+    """
+    Memory-map one partition and return it as a DataFrame.
+    """
+    path = partition_path(store_root, dataset, year)
+    source = pa.memory_map(str(path), "r")
+    return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def read_dataset(store_root, dataset: str, years=None) -> pd.DataFrame:
+    """
+    Concatenate the partitions of `dataset` (all years, or only `years`)
+    into one long table with a `year` column.
+    """
+    available = list_years(store_root, dataset)
+    if years is not None:
+        available = [y for y in available if y in set(years)]
+
+    frames = []
+    for year in available:
+        df = read_partition(store_root, dataset, year)
+        df.insert(0, "year", year)
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=["year"])
+    return pd.concat(frames, ignore_index=True)
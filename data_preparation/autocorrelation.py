@@ -0,0 +1,235 @@
+"""
+Spatial autocorrelation of the regional indicators (Moran's I and LISA).
+
+Contiguity weights are derived once from the boundary GeoJSON: two
+polygons are neighbours when they share boundary vertices (queen
+contiguity). Vertices are rounded, encoded as integers and grouped with a
+single sort, which acts as a hash index over all boundary points, so no
+polygon-against-polygon geometry test is needed. Units without a land
+neighbour (Sicilia, Sardegna) are linked to their nearest unit by
+centroid distance. The weights are row-standardised and kept as a sparse
+CSR matrix.
+
+Global Moran's I uses a permutation test; local Moran's I uses
+conditional randomisation (each unit keeps its value, its neighbours are
+drawn from the others). Permutations are processed as matrices in chunks,
+so 9,999 draws stay fast at municipality scale as well.
+
+build_snapshot.py stores the results in the snapshot; the dashboard only
+reads them.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+
+METRICS = ("share_65plus", "share_unoccupied", "dispersed_index")
+
+PERMUTATIONS = 9999
+SIGNIFICANCE = 0.05
+SEED = 20250101
+
+# LISA quadrant of a unit (own value, spatial lag) with respect to the mean
+QUADRANTS = {1: "High-High", 2: "Low-High", 3: "Low-Low", 4: "High-Low"}
+NOT_SIGNIFICANT = "Not significant"
+
+
+# ---------- WEIGHTS ----------
+def _polygons(geometry: dict):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    raise ValueError(f"Unsupported geometry type {geometry['type']!r}")
+
+
+def contiguity_weights(geojson: dict, id_property: str = "COD_REG", precision: int = 6, connect_islands: bool = True) -> dict:
+    """
+    Row-standardised queen contiguity weights for the features of `geojson`.
+
+    Returns {"ids": feature ids in id order, "matrix": (n, n) CSR matrix}.
+    """
+    features = sorted(geojson["features"], key=lambda f: f["properties"][id_property])
+    ids = np.array([f["properties"][id_property] for f in features])
+    n = len(ids)
+
+    owners, points, centroids = [], [], []
+    for i, feature in enumerate(features):
+        coords = np.concatenate([
+            np.asarray(ring, dtype="float64").reshape(-1, 2)
+            for polygon in _polygons(feature["geometry"])
+            for ring in polygon
+        ])
+        points.append(coords)
+        owners.append(np.full(len(coords), i, dtype="int64"))
+        centroids.append(coords.mean(axis=0))
+
+    # integer vertex keys; units sharing a key touch
+    scale = 10.0 ** precision
+    keys = np.round(np.concatenate(points) * scale).astype("int64")
+    owner = np.concatenate(owners)
+    _, vertex = np.unique(keys, axis=0, return_inverse=True)
+    vertex = vertex.ravel()
+
+    pairs = pd.DataFrame({"vertex": vertex, "unit": owner}).drop_duplicates()
+    shared = pairs[pairs.duplicated("vertex", keep=False)]
+    links = shared.merge(shared, on="vertex", suffixes=("_i", "_j"))
+    links = links.loc[links["unit_i"] != links["unit_j"], ["unit_i", "unit_j"]].drop_duplicates()
+
+    if connect_islands:
+        isolated = np.setdiff1d(np.arange(n), links["unit_i"].to_numpy())
+        if len(isolated) and n > 1:
+            centroids = np.asarray(centroids)
+            dist = np.hypot(*(centroids[isolated, None, :] - centroids[None, :, :]).transpose(2, 0, 1))
+            dist[np.arange(len(isolated)), isolated] = np.inf
+            nearest = dist.argmin(axis=1)
+            extra = pd.DataFrame({
+                "unit_i": np.concatenate([isolated, nearest]),
+                "unit_j": np.concatenate([nearest, isolated]),
+            })
+            links = pd.concat([links, extra]).drop_duplicates()
+
+    links = links.sort_values(["unit_i", "unit_j"])
+    row = links["unit_i"].to_numpy()
+    indices = links["unit_j"].to_numpy()
+    counts = np.bincount(row, minlength=n)
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    data = 1.0 / np.repeat(np.where(counts > 0, counts, 1), counts)
+
+    return {"ids": ids, "matrix": csr_matrix((data, indices, indptr), shape=(n, n))}
+
+
+def spatial_lag(weights: dict, values: np.ndarray) -> np.ndarray:
+    """
+    W @ values for a vector (n,) or a matrix of column vectors (n, k).
+    """
+    return weights["matrix"] @ np.asarray(values, dtype="float64")
+
+
+# ---------- MORAN'S I ----------
+def _pseudo_p(larger, permutations: int):
+    """
+    Folded pseudo p-value from the number of simulated values >= the observed one.
+    """
+    larger = np.minimum(larger, permutations - larger)
+    return (larger + 1) / (permutations + 1)
+
+
+def global_moran(weights: dict, values, permutations: int = PERMUTATIONS, seed: int = SEED, chunk: int = 1000) -> dict:
+    """
+    Moran's I of `values` (ordered as weights["ids"]) with its pseudo p-value.
+    """
+    z = np.asarray(values, dtype="float64")
+    z = z - z.mean()
+    n = len(z)
+    s0 = weights["matrix"].sum()
+    scale = n / s0 / (z @ z)
+
+    observed = scale * (z @ spatial_lag(weights, z))
+
+    rng = np.random.default_rng(seed)
+    larger = 0
+    for start in range(0, permutations, chunk):
+        size = min(chunk, permutations - start)
+        # each column is one permutation of z
+        shuffled = rng.permuted(np.tile(z, (size, 1)), axis=1).T
+        simulated = scale * np.einsum("ij,ij->j", shuffled, spatial_lag(weights, shuffled))
+        larger += int((simulated >= observed).sum())
+
+    return {
+        "moran_i": float(observed),
+        "expected_i": -1.0 / (n - 1),
+        "p_value": float(_pseudo_p(larger, permutations)),
+        "permutations": int(permutations),
+    }
+
+
+def _distinct_draws(rng, rows: int, high: int, k: int) -> np.ndarray:
+    """
+    (rows, k) integers in [0, high), distinct within each row (redrawn on collision).
+    """
+    draws = rng.integers(0, high, size=(rows, k))
+    while True:
+        ordered = np.sort(draws, axis=1)
+        repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        if not repeated.any():
+            return draws
+        draws[repeated] = rng.integers(0, high, size=(int(repeated.sum()), k))
+
+
+def local_moran(weights: dict, values, permutations: int = PERMUTATIONS, seed: int = SEED, chunk: int = 1000) -> pd.DataFrame:
+    """
+    Local Moran's I, conditional-randomisation p-value and LISA quadrant of every unit.
+    """
+    z = np.asarray(values, dtype="float64")
+    z = z - z.mean()
+    n = len(z)
+    m2 = (z @ z) / n
+
+    lag = spatial_lag(weights, z)
+    observed = z * lag / m2
+
+    indptr, data = weights["matrix"].indptr, weights["matrix"].data
+    counts = np.diff(indptr)
+    k_max = int(counts.max()) if n else 0
+
+    # neighbour weights padded to k_max columns (zeros beyond each unit's count)
+    padded = np.zeros((n, k_max))
+    for k in range(k_max):
+        has = counts > k
+        padded[has, k] = data[indptr[:-1][has] + k]
+
+    # bound the (permutations, units, neighbours) index block to ~20M entries
+    chunk = max(1, min(chunk, 20_000_000 // max(1, n * k_max)))
+
+    rng = np.random.default_rng(seed)
+    larger = np.zeros(n, dtype="int64")
+    for start in range(0, permutations if k_max else 0, chunk):
+        size = min(chunk, permutations - start)
+        # k_max distinct draws among the n-1 other units, shared by all units
+        draws = _distinct_draws(rng, size, n - 1, k_max)
+        # index j >= i refers to unit j+1, which skips unit i itself
+        picked = draws[:, None, :] + (draws[:, None, :] >= np.arange(n)[None, :, None])
+        lag_sim = np.einsum("pik,ik->pi", z[picked], padded)
+        larger += (z[None, :] * lag_sim / m2 >= observed[None, :]).sum(axis=0)
+
+    p_value = _pseudo_p(larger, permutations) if k_max else np.full(n, np.nan)
+
+    quadrant = np.select(
+        [(z > 0) & (lag > 0), (z <= 0) & (lag > 0), (z <= 0) & (lag <= 0)],
+        [1, 2, 3],
+        default=4,
+    )
+    label = np.where(p_value < SIGNIFICANCE, pd.Series(quadrant).map(QUADRANTS).to_numpy(), NOT_SIGNIFICANT)
+    label = np.where(counts > 0, label, NOT_SIGNIFICANT)
+
+    return pd.DataFrame({
+        "local_i": observed,
+        "p_value": p_value,
+        "quadrant": quadrant.astype("int8"),
+        "cluster": label,
+    })
+
+
+def moran_tables(df: pd.DataFrame, geojson: dict, metrics=METRICS, id_col: str = "region_code", permutations: int = PERMUTATIONS):
+    """
+    (global, local) result tables for every metric present in `df`.
+
+    global: one row per metric; local: one row per (unit, metric).
+    """
+    weights = contiguity_weights(geojson)
+    frame = df.set_index(id_col).reindex(weights["ids"])
+
+    rows, local_frames = [], []
+    for metric in metrics:
+        if metric not in frame.columns or frame[metric].isna().any():
+            continue
+        values = frame[metric].to_numpy(dtype="float64")
+        rows.append({"metric": metric, **global_moran(weights, values, permutations)})
+        local = local_moran(weights, values, permutations)
+        local.insert(0, "metric", metric)
+        local.insert(0, id_col, weights["ids"])
+        local_frames.append(local)
+
+    return pd.DataFrame(rows), pd.concat(local_frames, ignore_index=True)
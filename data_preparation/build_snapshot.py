@@ -0,0 +1,163 @@
+"""
+Bundle the app-ready tables and the regional GeoJSON into a single snapshot.
+
+Run from the project root after the preprocessing notebooks:
+
+    python data_preparation/build_snapshot.py
+
+The result (data/app_ready/retired_places.snapshot) is what the dashboard
+loads at start-up; see app/snapshot.py for the file layout.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from autocorrelation import moran_tables
+from rank_bootstrap import bootstrap_rank_intervals
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROCESSED = PROJECT_ROOT / "data" / "processed"
+APP_READY = PROJECT_ROOT / "data" / "app_ready"
+
+# the snapshot format and ranking helpers are shared with the dashboard
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+from manifest import iter_datasets, local_path  # noqa: E402
+from ranking import build_ranked_long  # noqa: E402
+from snapshot import SNAPSHOT_NAME, write_snapshot  # noqa: E402
+
+# optional layers: written by their own pipeline scripts, bundled when present
+LAYER_SOURCES = {
+    "proximity": PROCESSED / "MD6_settlement_proximity.csv",  # data_preparation/proximity.py
+    "systems": PROCESSED / "MD7_settlement_systems.csv",  # data_preparation/settlement_systems.py
+    "system_points": PROCESSED / "settlement_systems_points.csv",
+}
+
+
+def table_sources() -> dict:
+    """
+    {snapshot section: CSV path} for the datasets the manifest marks with `snapshot_table`.
+    """
+    sources = {}
+    for data in iter_datasets():
+        if "snapshot_table" not in data:
+            continue
+        path = local_path(data["distribution"][0]["access_url"], PROJECT_ROOT)
+        if path is None:
+            raise FileNotFoundError(f"{data['id']}: no local file for {data['distribution'][0]['access_url']}")
+        sources[data["snapshot_table"]] = path
+    return sources
+
+
+def load_tables(sources: dict) -> dict:
+    """
+    Read the mashup tables and fix their dtypes once, at build time.
+    """
+    df_md5 = pd.read_csv(sources["md5"])
+    df_md5["region_code"] = df_md5["region_code"].astype("int32")
+    # key used to join the metrics to the GeoJSON features
+    df_md5["COD_REG"] = df_md5["region_code"]
+
+    df_md4 = pd.read_csv(sources["md4"])
+    df_md4["region_code"] = df_md4["region_code"].astype("int32")
+
+    # MD1–MD3 are not drawn by the dashboard but are served by app/api.py
+    df_md1 = pd.read_csv(sources["md1"])
+    df_md1["region_code"] = df_md1["region_code"].astype("int32")
+
+    df_md2 = pd.read_csv(sources["md2"])
+    df_md2["region_code"] = df_md2["region_code"].astype("int32")
+
+    df_md3 = pd.read_csv(sources["md3"])
+    df_md3["region_code"] = df_md3["region_code"].astype("int32")
+
+    # long format with ranks for the ranked bar chart
+    df_ranked_long = build_ranked_long(df_md5)
+
+    return {
+        "md5": df_md5,
+        "md4": df_md4,
+        "md1": df_md1,
+        "md2": df_md2,
+        "md3": df_md3,
+        "ranked_long": df_ranked_long,
+    }
+
+
+def load_layers(sources: dict = LAYER_SOURCES) -> dict:
+    """
+    The optional layers whose file exists; the dashboard hides the others.
+    """
+    layers = {}
+    for name, path in sources.items():
+        if path.exists():
+            df = pd.read_csv(path)
+            df["region_code"] = df["region_code"].astype("int32")
+            layers[name] = df
+    return layers
+
+
+def load_population_age(path=PROCESSED / "pop_reg_it_clean.arrow") -> pd.DataFrame:
+    """
+    Single-year population by region and sex (without the age-999 totals),
+    the base of the projections in app/projection.py.
+    """
+    df = feather.read_table(path, columns=["region_code", "age", "pop_male", "pop_female"]).to_pandas()
+    return df[df["age"] != 999].reset_index(drop=True)
+
+
+def spatial_tables(tables: dict, documents: dict) -> dict:
+    """
+    Global and local Moran's I of the regional indicators (see autocorrelation.py).
+    """
+    df = tables["md5"].merge(tables["md4"][["region_code", "dispersed_index"]], on="region_code", how="left")
+    moran_global, moran_local = moran_tables(df, documents["regions_geojson"])
+    moran_local["region_code"] = moran_local["region_code"].astype("int32")
+    return {"moran_global": moran_global, "moran_local": moran_local}
+
+
+def load_documents() -> dict:
+    with open(PROCESSED / "italy_regions.geojson", "r", encoding="utf-8") as f:
+        regions_geojson = json.load(f)
+
+    return {
+        "regions_geojson": regions_geojson,
+    }
+
+
+def main():
+    sources = table_sources()
+    tables = load_tables(sources)
+    layers = load_layers()
+    tables.update(layers)
+    documents = load_documents()
+    tables.update(spatial_tables(tables, documents))
+    tables["rank_intervals"] = bootstrap_rank_intervals(tables["md5"])
+    tables["population_age"] = load_population_age()
+
+    metadata = {
+        "sources": {
+            **{name: path.relative_to(PROJECT_ROOT).as_posix() for name, path in sources.items()},
+            "ranked_long": "derived from md5",
+            "moran_global": "derived from md5, md4 and regions_geojson",
+            "moran_local": "derived from md5, md4 and regions_geojson",
+            "rank_intervals": "bootstrap of md5 counts",
+            "population_age": "data/processed/pop_reg_it_clean.arrow",
+            **{name: LAYER_SOURCES[name].relative_to(PROJECT_ROOT).as_posix() for name in layers},
+            "regions_geojson": "data/processed/italy_regions.geojson",
+        },
+        "rows": {name: int(len(df)) for name, df in tables.items()},
+    }
+
+    out_path = APP_READY / SNAPSHOT_NAME
+    content_hash = write_snapshot(out_path, tables, documents, metadata)
+
+    print(f"saved to: {out_path}")
+    print(f"content hash: {content_hash}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Extractor for the ISTAT housing census workbook (D2 layout).
+
+The export has a metadata block ("Anno", "Indicatore", ..., "Territorio")
+followed by one row per territory:
+
+    Anno                 2021            2021                2021
+    Indicatore           Abitazioni      Abitazioni non      Abitazioni al
+                         occupate ...    occupate ...        31 dicembre
+    ...
+    Territorio
+    Piemonte             1964108         827768              2791876
+    ...
+
+Instead of a fixed iloc slice, the header rows are found by their labels,
+the value columns are identified from the "Indicatore" texts, and the data
+block is every following row with a territory name and numeric values, so
+an extra or missing metadata row does not break the extraction. Rows are
+streamed with openpyxl in read-only mode.
+
+Parsed tables are cached as Arrow files keyed by the SHA-256 of the
+workbook, so an unchanged workbook is never opened again.
+"""
+
+import hashlib
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = PROJECT_ROOT / "data" / ".cache" / "housing"
+
+# "Indicatore" label → column name; the first matching pattern wins
+INDICATOR_COLUMNS = [
+    ("non occupate", "homes_unoccupied"),
+    ("occupate", "homes_occupied"),
+    ("abitazioni", "homes_total"),
+]
+COLUMNS = ["region", "homes_occupied", "homes_unoccupied", "homes_total"]
+
+
+def _label(value) -> str:
+    return str(value).strip().lower() if value is not None else ""
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def extract_housing_table(path) -> tuple:
+    """
+    Locate the header and data block of the workbook's first sheet.
+
+    Returns (DataFrame with COLUMNS, reference year or None).
+    """
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        year, value_columns, rows = None, None, []
+
+        for row in ws.iter_rows(values_only=True):
+            label = _label(row[0] if row else None)
+
+            if value_columns is None:
+                if label == "anno":
+                    years = {_label(v) for v in row[1:] if _label(v)}
+                    year = int(years.pop()) if len(years) == 1 else None
+                elif label == "indicatore":
+                    value_columns = {}
+                    for index, text in enumerate(row[1:], start=1):
+                        text = _label(text)
+                        for pattern, column in INDICATOR_COLUMNS:
+                            if pattern in text and column not in value_columns:
+                                value_columns[column] = index
+                                break
+                    missing = set(COLUMNS[1:]) - set(value_columns)
+                    if missing:
+                        raise ValueError(f"Indicator columns not found in {path}: {sorted(missing)}")
+                continue
+
+            values = [row[value_columns[column]] if value_columns[column] < len(row) else None for column in COLUMNS[1:]]
+            if label and all(_is_number(v) for v in values):
+                rows.append([row[0], *values])
+            elif rows:
+                # first non-data row after the block (notes, blank lines)
+                break
+    finally:
+        wb.close()
+
+    if value_columns is None:
+        raise ValueError(f"No 'Indicatore' header row in {path}")
+    if not rows:
+        raise ValueError(f"No data rows found in {path}")
+
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    for column in COLUMNS[1:]:
+        df[column] = pd.to_numeric(df[column]).round().astype("Int64")
+    return df, year
+
+
+def workbook_hash(path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def read_housing_workbook(path, cache_dir=CACHE_DIR) -> pd.DataFrame:
+    """
+    Cached `extract_housing_table`; the reference year is in df.attrs["year"].
+    """
+    cache_path = Path(cache_dir) / f"{workbook_hash(path)}.arrow"
+
+    if cache_path.exists():
+        table = feather.read_table(cache_path)
+        df = table.to_pandas()
+        for column in COLUMNS[1:]:
+            df[column] = df[column].astype("Int64")
+        year = (table.schema.metadata or {}).get(b"year", b"")
+        df.attrs["year"] = int(year) if year else None
+        return df
+
+    df, year = extract_housing_table(path)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"year": str(year or "").encode()})
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    tmp_path.replace(cache_path)
+
+    df.attrs["year"] = year
+    return df
@@ -0,0 +1,171 @@
+"""
+Incremental ingestion of ISTAT releases into the year-partitioned store.
+
+Each call processes a single raw file and appends the partitions for its
+reference year only:
+
+    python data_preparation/ingest.py housing 2021 data/raw/D2_housing_it.xlsx
+    python data_preparation/ingest.py population 2025 data/raw/D1_population_regions.csv
+
+A population release writes "population" (age structure) and "metrics"
+(regional indicators, combined with the latest housing wave not later than
+that year). A housing wave writes "housing". Existing years are never
+reprocessed; see app/store.py for the layout.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STORE = PROJECT_ROOT / "data" / "store"
+
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+from gazetteer import macro_regions, resolve_codes  # noqa: E402
+from store import append_partition, append_partitions, list_years, read_partition  # noqa: E402
+
+from housing import read_housing_workbook  # noqa: E402
+from population import read_population_csv, to_pandas  # noqa: E402
+
+
+# normalize region names
+def normalize_region_name(s: str) -> str:
+    s = s.strip()
+    s = s.replace(" / ", "/")
+    s = s.replace(" - ", "-")
+    s = s.replace("–", "-")
+    return s
+
+
+def read_population_release(path) -> pd.DataFrame:
+    """
+    Clean one D1-style release: resident population by region, age and sex.
+
+    Age 999 holds the regional totals and is kept, as in pop_reg_it_clean.csv.
+    Parsing uses the declared schema of data_preparation/population.py.
+    """
+    return to_pandas(read_population_csv(path))
+
+
+def read_housing_wave(path) -> pd.DataFrame:
+    """
+    Clean one D2-style census table: occupied and unoccupied dwellings by region.
+    """
+    # header and data block are located by data_preparation/housing.py (cached)
+    homes = read_housing_workbook(path)
+
+    homes["region_norm"] = homes["region"].astype(str).apply(normalize_region_name)
+
+    # codes come from the gazetteer (app/gazetteer.py), which knows the
+    # census spellings and the autonomous provinces of Trentino-Alto Adige
+    region_code = resolve_codes(homes["region"], "region")
+    province_code = resolve_codes(homes["region"], "province")
+
+    missing = homes.loc[region_code.isna() & province_code.isna(), "region_norm"].tolist()
+    if missing:
+        raise ValueError(f"Unknown region names in {path}: {missing}")
+
+    # the autonomous provinces sum to the Trentino-Alto Adige total
+    homes = homes[region_code.notna()].copy()
+    homes["region_code"] = region_code[region_code.notna()].astype("int32")
+
+    return homes.reset_index(drop=True)
+
+
+def derive_metrics(df_population: pd.DataFrame, df_housing: pd.DataFrame) -> pd.DataFrame:
+    """
+    Regional indicators for one reference year, with the MD5 columns.
+    """
+    totals = (
+        df_population[df_population["age"] == 999][["region_code", "region", "pop_total"]]
+        .rename(columns={"pop_total": "tot_pop"})
+    )
+    by_age = df_population[df_population["age"] != 999]
+    pop_65plus = (
+        by_age[by_age["age"] >= 65]
+        .groupby("region_code", as_index=False)["pop_total"]
+        .sum()
+        .rename(columns={"pop_total": "pop_65plus"})
+    )
+
+    df = totals.merge(pop_65plus, on="region_code", how="left")
+    df["region_code"] = df["region_code"].astype("int32")
+    df["pop_65plus"] = df["pop_65plus"].astype("float64")
+    df["tot_pop"] = df["tot_pop"].astype("float64")
+    df["share_65plus"] = df["pop_65plus"] / df["tot_pop"] * 100
+
+    df = df.merge(
+        df_housing[["region_code", "homes_occupied", "homes_unoccupied", "homes_total", "region_norm"]],
+        on="region_code",
+        how="left",
+    )
+    for col in ["homes_occupied", "homes_unoccupied", "homes_total"]:
+        df[col] = df[col].astype("int64")
+    df["share_unoccupied"] = df["homes_unoccupied"] / df["homes_total"] * 100
+    df["macro_region"] = macro_regions(df["region_code"])
+
+    # median thresholds and 2×2 typology, as in 02_italy_preprocessing
+    df["high_65"] = df["share_65plus"] >= df["share_65plus"].median()
+    df["high_vac"] = df["share_unoccupied"] >= df["share_unoccupied"].median()
+    df["category_2x2"] = np.select(
+        [
+            df["high_65"] & df["high_vac"],
+            df["high_65"] & ~df["high_vac"],
+            ~df["high_65"] & df["high_vac"],
+        ],
+        ["Old & Empty", "Old & Lived-in", "Younger but Emptying"],
+        default="Younger & Lived-in",
+    )
+
+    df["rank_65"] = df["share_65plus"].rank(method="average")
+    df["rank_vac"] = df["share_unoccupied"].rank(method="average")
+    df["rank_diff"] = df["rank_vac"] - df["rank_65"]
+
+    return df.sort_values("region_code").reset_index(drop=True)
+
+
+def ingest_housing(year: int, path, store_root=STORE):
+    df_housing = read_housing_wave(path)
+    return append_partition(store_root, "housing", year, df_housing, source=str(path))
+
+
+def ingest_population(year: int, path, store_root=STORE):
+    waves = [w for w in list_years(store_root, "housing") if w <= year]
+    if not waves:
+        raise ValueError(
+            f"No housing wave up to {year} in the store; ingest the housing census first."
+        )
+    housing_year = waves[-1]
+
+    df_population = read_population_release(path)
+    df_metrics = derive_metrics(df_population, read_partition(store_root, "housing", housing_year))
+    df_metrics["housing_year"] = np.int32(housing_year)
+
+    # both partitions are recorded together, so a year never has population without metrics
+    return append_partitions(
+        store_root, year, {"population": df_population, "metrics": df_metrics}, source=str(path)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=["population", "housing"])
+    parser.add_argument("year", type=int, help="reference year of the release")
+    parser.add_argument("path", type=Path, help="raw ISTAT file for that year")
+    parser.add_argument("--store", type=Path, default=STORE)
+    args = parser.parse_args()
+
+    if args.kind == "housing":
+        paths = [ingest_housing(args.year, args.path, args.store)]
+    else:
+        paths = ingest_population(args.year, args.path, args.store)
+
+    for path in paths:
+        print(f"saved to: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Distance from every village/hamlet to the nearest town or city.
+
+The Dispersed Settlements Index counts small settlements per inhabitant;
+this adds how far they are from a service centre. All centres
+(national_capital, city, town) go into one KD-tree over Earth-centred
+coordinates, and all small settlements are queried against it in a single
+call spread over every core. Centres are searched across the whole
+country, so a hamlet near a regional border may be served by a town in the
+neighbouring region. Distances are aggregated per region:
+
+    python data_preparation/proximity.py
+
+writes data/processed/MD6_settlement_proximity.csv, which
+build_snapshot.py adds to the snapshot as the "proximity" table.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from settlements import CENTRE_CLASSES, PROCESSED, SMALL_CLASSES, chord_to_km, load_places, to_ecef
+
+PROXIMITY_PATH = PROCESSED / "MD6_settlement_proximity.csv"
+
+THRESHOLDS_KM = (10, 20)
+
+
+def nearest_centre_km(places: pd.DataFrame, workers: int = -1) -> np.ndarray:
+    """
+    Great-circle distance (km) from each small settlement to the nearest centre.
+
+    Returns one value per row of `places` with fclass in SMALL_CLASSES, in row order.
+    """
+    centres = places[places["fclass"].isin(CENTRE_CLASSES)]
+    small = places[places["fclass"].isin(SMALL_CLASSES)]
+    if centres.empty:
+        raise ValueError("No towns or cities among the places; cannot measure proximity.")
+
+    tree = cKDTree(to_ecef(centres["lon"], centres["lat"]))
+    chord, _ = tree.query(to_ecef(small["lon"], small["lat"]), k=1, workers=workers)
+    return chord_to_km(chord)
+
+
+def proximity_by_region(places: pd.DataFrame, thresholds_km=THRESHOLDS_KM, workers: int = -1) -> pd.DataFrame:
+    """
+    Per region: number of small settlements, median and 90th percentile of
+    the distance to the nearest centre, and the share (%) beyond each threshold.
+    """
+    small = places[places["fclass"].isin(SMALL_CLASSES)][["region_code"]].copy()
+    small["dist_km"] = nearest_centre_km(places, workers=workers)
+    for km in thresholds_km:
+        small[f"beyond_{km}km"] = small["dist_km"] > km
+
+    grouped = small.groupby("region_code")
+    df = pd.DataFrame({
+        "settlements_count": grouped.size(),
+        "dist_median_km": grouped["dist_km"].median(),
+        "dist_p90_km": grouped["dist_km"].quantile(0.9),
+    })
+    for km in thresholds_km:
+        df[f"share_beyond_{km}km"] = grouped[f"beyond_{km}km"].mean() * 100
+
+    return df.reset_index().astype({"region_code": "int32"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distance of villages/hamlets to the nearest town, by region.")
+    parser.add_argument("--out", default=PROXIMITY_PATH)
+    parser.add_argument("--workers", type=int, default=-1, help="threads for the KD-tree queries (-1: all cores)")
+    args = parser.parse_args()
+
+    places = load_places()
+
+    start = time.perf_counter()
+    df = proximity_by_region(places, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    df.to_csv(args.out, index=False)
+    print(f"{int(df['settlements_count'].sum())} settlements measured in {elapsed:.2f} s")
+    print(f"saved to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Bootstrap intervals for the regional shares and ranks.
+
+share_65plus and share_unoccupied are proportions of counts (residents
+aged 65+ among all residents, unoccupied among all dwellings), so a
+region with a small population has a noisier share and a less certain
+rank. Each bootstrap draw resamples the individuals of every region at
+once, i.e. the counts are redrawn as Binomial(total, observed share) for a
+(draws, regions) matrix, and all regions are re-ranked per row. Percentile
+intervals are then taken over the draws.
+
+The ranks mirror the ones shown by the dashboard: rank_65, rank_vac and
+rank_diff as in MD5 (ascending, ties averaged), and the descending
+per-metric ranks of the ranked bar chart, across Italy and within each
+macro-region (see app/ranking.py). build_snapshot.py stores the result as
+the "rank_intervals" table.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.stats import rankdata
+
+
+DRAWS = 5000
+LEVEL = 0.95
+SEED = 20250101
+
+# share column: (numerator, denominator, MD5 rank column)
+SHARES = {
+    "share_65plus": ("pop_65plus", "tot_pop", "rank_65"),
+    "share_unoccupied": ("homes_unoccupied", "homes_total", "rank_vac"),
+}
+
+
+def resample_shares(df: pd.DataFrame, draws: int, rng) -> dict:
+    """
+    {share column: (draws, regions) matrix of resampled shares in %}.
+    """
+    out = {}
+    for share, (numerator, denominator, _) in SHARES.items():
+        total = df[denominator].to_numpy(dtype="int64")
+        p = df[numerator].to_numpy(dtype="float64") / total
+        out[share] = rng.binomial(total[None, :], p[None, :], size=(draws, len(df))) / total * 100
+    return out
+
+
+def _interval(samples: np.ndarray, level: float):
+    tail = (1 - level) / 2 * 100
+    return np.percentile(samples, [tail, 100 - tail], axis=0)
+
+
+def bootstrap_rank_intervals(df: pd.DataFrame, draws: int = DRAWS, level: float = LEVEL, seed: int = SEED) -> pd.DataFrame:
+    """
+    One row per region with `<column>_lo` / `<column>_hi` bounds for the
+    shares, rank_65, rank_vac, rank_diff and the ranked-bar ranks
+    (rank_<share>_italy, rank_<share>_macro).
+    """
+    rng = np.random.default_rng(seed)
+    shares = resample_shares(df, draws, rng)
+
+    samples = {}
+    for share, (_, _, md5_rank) in SHARES.items():
+        samples[share] = shares[share]
+        samples[md5_rank] = rankdata(shares[share], method="average", axis=1)
+
+        # descending ranks, as in app/ranking.py (1 = highest value)
+        samples[f"rank_{share}_italy"] = rankdata(-shares[share], method="ordinal", axis=1)
+        macro = np.empty_like(shares[share])
+        for _, positions in df.groupby("macro_region").indices.items():
+            macro[:, positions] = rankdata(-shares[share][:, positions], method="ordinal", axis=1)
+        samples[f"rank_{share}_macro"] = macro
+
+    samples["rank_diff"] = samples["rank_vac"] - samples["rank_65"]
+
+    out = pd.DataFrame({"region_code": df["region_code"].to_numpy(dtype="int32")})
+    for column, values in samples.items():
+        lo, hi = _interval(values, level)
+        out[f"{column}_lo"] = lo
+        out[f"{column}_hi"] = hi
+
+    return out
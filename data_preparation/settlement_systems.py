@@ -0,0 +1,202 @@
+"""
+Settlement systems: chains of villages/hamlets close enough to act as one.
+
+The Dispersed Settlements Index counts every OSM village/hamlet node as an
+independent settlement, although many hamlets sit a few hundred metres
+apart around the same core. Here small settlements are linked when they
+lie within LINK_KM of each other, and each connected group (friends-of-
+friends / single-linkage clustering) is one settlement system. Neighbour
+pairs come from a KD-tree over Earth-centred coordinates
+(`cKDTree.query_pairs`) and groups from sparse connected components, so a
+region costs close to linear time; regions run in parallel in a process
+pool and each result is cached under data/.cache/settlement_systems, keyed
+by the region's coordinates and the parameters.
+
+    python data_preparation/settlement_systems.py
+
+writes
+
+    data/processed/MD7_settlement_systems.csv      one row per region
+    data/processed/settlement_systems_points.csv   one row per system (size >= MIN_SYSTEM_SIZE)
+
+which build_snapshot.py adds as the "systems" and "system_points" layers.
+The cluster-aware index counts each system once, plus the isolated
+settlements, per 1,000 inhabitants.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+from settlements import EARTH_RADIUS_KM, PROCESSED, PROJECT_ROOT, SMALL_CLASSES, km_to_chord, load_places, to_ecef
+
+CACHE_DIR = PROJECT_ROOT / "data" / ".cache" / "settlement_systems"
+SYSTEMS_PATH = PROCESSED / "MD7_settlement_systems.csv"
+SYSTEM_POINTS_PATH = PROCESSED / "settlement_systems_points.csv"
+DISPERSION_PATH = PROCESSED / "MD4_dispertion_places.csv"
+
+LINK_KM = 1.0
+MIN_SYSTEM_SIZE = 3
+
+
+def cluster_labels(xyz: np.ndarray, link_km: float = LINK_KM) -> np.ndarray:
+    """
+    System label of each point: points within `link_km` are chained together.
+    """
+    n = len(xyz)
+    if n == 0:
+        return np.empty(0, dtype="int64")
+
+    pairs = cKDTree(xyz).query_pairs(km_to_chord(link_km), output_type="ndarray")
+    graph = coo_matrix((np.ones(len(pairs), dtype="int8"), (pairs[:, 0], pairs[:, 1])), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    return labels.astype("int64")
+
+
+def summarise_systems(xyz: np.ndarray, labels: np.ndarray, fclass: np.ndarray) -> pd.DataFrame:
+    """
+    One row per label: size, centroid (lon/lat), spread (RMS distance to the
+    centroid, km) and the number of villages among the members.
+    """
+    counts = np.bincount(labels)
+    centroid = np.column_stack([np.bincount(labels, weights=xyz[:, i]) for i in range(3)]) / counts[:, None]
+    sq_dist = ((xyz - centroid[labels]) ** 2).sum(axis=1)
+    spread = np.sqrt(np.bincount(labels, weights=sq_dist) / counts)
+
+    # project the mean position back onto the sphere
+    unit = centroid / np.linalg.norm(centroid, axis=1, keepdims=True)
+    return pd.DataFrame({
+        "system_id": np.arange(len(counts), dtype="int64"),
+        "size": counts.astype("int64"),
+        "villages": np.bincount(labels, weights=(fclass == "village")).astype("int64"),
+        "lon": np.degrees(np.arctan2(unit[:, 1], unit[:, 0])),
+        "lat": np.degrees(np.arcsin(np.clip(unit[:, 2], -1, 1))),
+        "spread_km": spread,
+    })
+
+
+def cluster_region(task) -> pd.DataFrame:
+    """
+    Systems of one region; `task` is (lon, lat, fclass, link_km), picklable for the pool.
+    """
+    lon, lat, fclass, link_km = task
+    xyz = to_ecef(lon, lat)
+    return summarise_systems(xyz, cluster_labels(xyz, link_km), fclass)
+
+
+def iter_systems(tasks, workers=None):
+    """
+    cluster_region over `tasks`, in order, one region per worker process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        yield from map(cluster_region, tasks)
+        return
+
+    with ProcessPoolExecutor(min(workers, len(tasks))) as pool:
+        yield from pool.map(cluster_region, tasks)
+
+
+def _cache_key(lon, lat, fclass, link_km) -> str:
+    sha = hashlib.sha256()
+    sha.update(json.dumps({"link_km": link_km, "earth_radius_km": EARTH_RADIUS_KM}).encode())
+    for array in (lon, lat):
+        sha.update(np.ascontiguousarray(array, dtype="float64").tobytes())
+    sha.update("\n".join(fclass).encode())
+    return sha.hexdigest()
+
+
+def cluster_regions(places: pd.DataFrame, link_km: float = LINK_KM, workers=None, cache_dir=CACHE_DIR) -> pd.DataFrame:
+    """
+    Settlement systems of every region (region_code + summarise_systems columns).
+    """
+    small = places[places["fclass"].isin(SMALL_CLASSES)].sort_values(["region_code", "lon", "lat"], kind="stable")
+
+    results, pending = {}, {}
+    for code, group in small.groupby("region_code", sort=True):
+        task = (group["lon"].to_numpy(), group["lat"].to_numpy(), group["fclass"].to_numpy(dtype=str), link_km)
+        cache_path = cache_dir / f"{_cache_key(*task)}.arrow"
+        if cache_path.exists():
+            results[code] = feather.read_table(cache_path).to_pandas()
+        else:
+            pending[code] = (task, cache_path)
+
+    if pending:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tasks = [task for task, _ in pending.values()]
+        for code, df in zip(pending, iter_systems(tasks, workers)):
+            _, cache_path = pending[code]
+            tmp_path = cache_path.with_suffix(".tmp")
+            feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), tmp_path, compression="uncompressed")
+            tmp_path.replace(cache_path)
+            results[code] = df
+
+    frames = [df.assign(region_code=np.int32(code)) for code, df in sorted(results.items())]
+    return pd.concat(frames, ignore_index=True)[["region_code", *frames[0].columns.drop("region_code")]]
+
+
+def systems_by_region(systems: pd.DataFrame, df_disp: pd.DataFrame, min_size: int = MIN_SYSTEM_SIZE) -> pd.DataFrame:
+    """
+    Regional summary and the cluster-aware dispersion index.
+
+    A group of at least `min_size` settlements is a system; smaller groups
+    count as isolated settlements.
+    """
+    is_system = systems["size"] >= min_size
+    grouped = systems.assign(
+        in_system=systems["size"].where(is_system, 0),
+        isolated=systems["size"].where(~is_system, 0),
+        is_system=is_system,
+        spread_system=systems["spread_km"].where(is_system),
+    ).groupby("region_code")
+
+    df = pd.DataFrame({
+        "settlements_count": grouped["size"].sum(),
+        "systems_count": grouped["is_system"].sum(),
+        "isolated_count": grouped["isolated"].sum(),
+        "largest_system": grouped["size"].max(),
+        "mean_system_spread_km": grouped["spread_system"].mean(),
+    })
+    df["clustered_share"] = grouped["in_system"].sum() / df["settlements_count"] * 100
+    df["mean_system_size"] = grouped["in_system"].sum() / df["systems_count"].where(df["systems_count"] > 0)
+    df["units_count"] = df["systems_count"] + df["isolated_count"]
+
+    df = df.reset_index().merge(df_disp[["region_code", "tot_pop"]], on="region_code", how="left")
+    df["system_index"] = df["units_count"] / (df["tot_pop"] / 1000)
+    return df.drop(columns="tot_pop").astype({"region_code": "int32"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Group villages/hamlets into settlement systems, by region.")
+    parser.add_argument("--link-km", type=float, default=LINK_KM, help="maximum distance between linked settlements")
+    parser.add_argument("--min-size", type=int, default=MIN_SYSTEM_SIZE, help="smallest group reported as a system")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    args = parser.parse_args()
+
+    places = load_places()
+
+    start = time.perf_counter()
+    systems = cluster_regions(places, link_km=args.link_km, workers=args.workers)
+    df = systems_by_region(systems, pd.read_csv(DISPERSION_PATH), min_size=args.min_size)
+    elapsed = time.perf_counter() - start
+
+    df.to_csv(SYSTEMS_PATH, index=False)
+    systems[systems["size"] >= args.min_size].to_csv(SYSTEM_POINTS_PATH, index=False)
+    print(f"{int(df['systems_count'].sum())} systems from {int(df['settlements_count'].sum())} settlements in {elapsed:.2f} s")
+    print(f"saved to: {SYSTEMS_PATH}")
+    print(f"saved to: {SYSTEM_POINTS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+OSM settlement points with their region, as plain coordinate arrays.
+
+The points come from data/processed/MED1_settlements_italy.gpkg (written by
+01_italy_cleaning) and are assigned to regions with the same spatial join
+as 02_italy_preprocessing. Metric engines (proximity.py, ...) work on the
+resulting DataFrame (fclass, name, lon, lat, region_code) and on 3-D
+Earth-centred coordinates, where straight-line distances are monotonic in
+great-circle distance, so standard KD-trees can be used without projecting
+the whole country.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROCESSED = PROJECT_ROOT / "data" / "processed"
+
+PLACES_PATH = PROCESSED / "MED1_settlements_italy.gpkg"
+REGIONS_PATH = PROCESSED / "italy_regions.geojson"
+
+EARTH_RADIUS_KM = 6371.0088
+
+# OSM place classes: service centres and the small settlements of the index
+CENTRE_CLASSES = ("national_capital", "city", "town")
+SMALL_CLASSES = ("village", "hamlet")
+
+
+def load_places(places_path=PLACES_PATH, regions_path=REGIONS_PATH, classes=CENTRE_CLASSES + SMALL_CLASSES) -> pd.DataFrame:
+    """
+    Settlement points of `classes` that fall within an Italian region.
+    """
+    import geopandas as gpd
+
+    gdf_places = gpd.read_file(places_path, layer="places")
+    gdf_places = gdf_places[gdf_places["fclass"].isin(classes)].loc[:, ["fclass", "name", "geometry"]]
+
+    gdf_regions = gpd.read_file(regions_path)[["COD_REG", "geometry"]]
+    joined = gpd.sjoin(gdf_places, gdf_regions.to_crs(gdf_places.crs), how="inner", predicate="within")
+
+    geometry = joined.geometry.to_crs(epsg=4326)
+    return pd.DataFrame({
+        "fclass": joined["fclass"].to_numpy(),
+        "name": joined["name"].to_numpy(),
+        "lon": geometry.x.to_numpy(),
+        "lat": geometry.y.to_numpy(),
+        "region_code": joined["COD_REG"].astype("int32").to_numpy(),
+    })
+
+
+def to_ecef(lon, lat) -> np.ndarray:
+    """
+    (n, 3) Earth-centred coordinates in km on a spherical Earth.
+    """
+    lon = np.radians(np.asarray(lon, dtype="float64"))
+    lat = np.radians(np.asarray(lat, dtype="float64"))
+    cos_lat = np.cos(lat)
+    return EARTH_RADIUS_KM * np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def chord_to_km(chord):
+    """
+    Great-circle distance for a straight-line (chord) distance in km.
+    """
+    chord = np.minimum(np.asarray(chord, dtype="float64"), 2 * EARTH_RADIUS_KM)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(chord / (2 * EARTH_RADIUS_KM))
+
+
+def km_to_chord(km):
+    return 2 * EARTH_RADIUS_KM * np.sin(np.asarray(km, dtype="float64") / (2 * EARTH_RADIUS_KM))
@@ -1,6 +1,18 @@
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, XSD, DCTERMS as DCT, PROV, FOAF
+import argparse
+import inspect
 import os
+import sys
+from pathlib import Path
+
+from rdf_incremental import build_incremental, entry_hash
+from rdf_previews import write_preview
+from rdf_stream import NTriplesWriter, ntriples_to_turtle
+
+# dataset ids come from the manifest shared with rdf_datasets.py and the dashboard
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+from manifest import dataset_ids  # noqa: E402
 
 # Namespaces
 DCAT = Namespace("http://www.w3.org/ns/dcat#")
@@ -13,109 +25,154 @@ SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
 # Base namespace the project datasets
 OLD = Namespace("https://github.com/eugeniavd/retired_places/")
 
-catalog_g = Graph()
-
 # Prefixes
-catalog_g.bind("dcat", DCAT)
-catalog_g.bind("dcatapit", DCATAPIT)
-catalog_g.bind("dct", DCT)
-catalog_g.bind("adms", ADMS)
-catalog_g.bind("xsd", XSD_NS)
-catalog_g.bind("cc", CC)
-catalog_g.bind("skos", SKOS)
-catalog_g.bind("old", OLD)
-catalog_g.bind("prov", PROV)
-catalog_g.bind("foaf", FOAF)
-
-# Catalog URI and metadata
+def bind_namespaces(catalog_g):
+    catalog_g.bind("dcat", DCAT)
+    catalog_g.bind("dcatapit", DCATAPIT)
+    catalog_g.bind("dct", DCT)
+    catalog_g.bind("adms", ADMS)
+    catalog_g.bind("xsd", XSD_NS)
+    catalog_g.bind("cc", CC)
+    catalog_g.bind("skos", SKOS)
+    catalog_g.bind("old", OLD)
+    catalog_g.bind("prov", PROV)
+    catalog_g.bind("foaf", FOAF)
+
+
 catalog_uri = URIRef("https://github.com/eugeniavd/retired_places/tree/main/data/")
-catalog_g.add((catalog_uri, RDF.type, DCAT.Catalog))
-catalog_g.add((catalog_uri, DCT.title, Literal("Retired Places Datasets Catalog", lang="en")))
-catalog_g.add((catalog_uri, DCT.description, Literal(
-    "Catalog containing the source, merged and mashup datasets for the Retired Places project.",
-    lang="en"
-)))
-
-# Publisher information
-publisher_uri = URIRef("https://github.com/eugeniavd/retired_places/")
-catalog_g.add((catalog_uri, DCT.publisher, publisher_uri))
-catalog_g.add((publisher_uri, RDF.type, FOAF.Organization))
-catalog_g.add((publisher_uri, FOAF.name, Literal("Open Access – Retired Places Project", lang="en")))
-
-# Dates 
-catalog_g.add((catalog_uri, DCT.issued, Literal("2025-11-13", datatype=XSD.date)))
-catalog_g.add((catalog_uri, DCT.modified, Literal("2025-12-07", datatype=XSD.date)))
-
-# language
-catalog_g.add((catalog_uri, DCT.language, URIRef("http://www.lexvo.org/page/iso639-3/eng")))
-catalog_g.add((catalog_uri, DCT.language, URIRef("http://www.lexvo.org/page/iso639-3/ita")))
-
-# ADMS.identifier
-catalog_g.add((catalog_uri, ADMS.identifier, Literal("OLD_catalog", datatype=XSD.string)))
-
-# Theme taxonomy used by the catalog
-theme_taxonomy_uri = URIRef("http://publications.europa.eu/resource/authority/data-theme")
-catalog_g.add((catalog_uri, DCAT.themeTaxonomy, theme_taxonomy_uri))
-catalog_g.add((theme_taxonomy_uri, RDF.type, SKOS.ConceptScheme))
-catalog_g.add((theme_taxonomy_uri, DCT.title, Literal(
-    "Publications Office of the European Union Data Themes", lang="en"
-)))
-catalog_g.add((theme_taxonomy_uri, DCT.description, Literal(
-    "Controlled vocabulary of data themes used for dataset classification in DCAT-AP.",
-    lang="en"
-)))
-
-# Conformance to DCAT 
-dcat_ap_uri = URIRef("https://www.w3.org/TR/vocab-dcat-3/")
-catalog_g.add((catalog_uri, DCT.conformsTo, dcat_ap_uri))
-
-# License
-license_uri = URIRef("https://creativecommons.org/publicdomain/zero/1.0/")
-catalog_g.add((catalog_uri, DCT.license, license_uri))
-
-# Details about the license
-catalog_g.add((license_uri, RDF.type, CC.License))
-catalog_g.add((license_uri, CC.legalcode, URIRef(
-    "https://creativecommons.org/publicdomain/zero/1.0/"
-)))
-catalog_g.add((license_uri, RDFS.label, Literal("Creative Commons CC0 1.0 Universal (Public Domain Dedication)", lang="en")))
-
-# Provenance
-catalog_g.add((catalog_uri, PROV.wasAttributedTo, publisher_uri))
-
-# List of dataset IDs 
-dataset_ids = [
-    "D1_population_regions",
-    "D2_housing_it",
-    "GD1_regions_it",
-    "GD2_places_center",
-    "GD3_places_islands",
-    "GD4_places_north_east",
-    "GD5_places_north_west",
-    "GD6_places_south",
-    "MD1_share_houses_occupation",
-    "MD2_share_65_plus",
-    "MD3_settlements_count",
-    "MD4_dispertion_places",
-    "MD5_age_houses_occupation",
-    "MED1_settlements_italy",
-]
+
+
+def add_catalog(catalog_g):
+    # Catalog URI and metadata
+    catalog_g.add((catalog_uri, RDF.type, DCAT.Catalog))
+    catalog_g.add((catalog_uri, DCT.title, Literal("Retired Places Datasets Catalog", lang="en")))
+    catalog_g.add((catalog_uri, DCT.description, Literal(
+        "Catalog containing the source, merged and mashup datasets for the Retired Places project.",
+        lang="en"
+    )))
+
+    # Publisher information
+    publisher_uri = URIRef("https://github.com/eugeniavd/retired_places/")
+    catalog_g.add((catalog_uri, DCT.publisher, publisher_uri))
+    catalog_g.add((publisher_uri, RDF.type, FOAF.Organization))
+    catalog_g.add((publisher_uri, FOAF.name, Literal("Open Access – Retired Places Project", lang="en")))
+
+    # Dates 
+    catalog_g.add((catalog_uri, DCT.issued, Literal("2025-11-13", datatype=XSD.date)))
+    catalog_g.add((catalog_uri, DCT.modified, Literal("2025-12-07", datatype=XSD.date)))
+
+    # language
+    catalog_g.add((catalog_uri, DCT.language, URIRef("http://www.lexvo.org/page/iso639-3/eng")))
+    catalog_g.add((catalog_uri, DCT.language, URIRef("http://www.lexvo.org/page/iso639-3/ita")))
+
+    # ADMS.identifier
+    catalog_g.add((catalog_uri, ADMS.identifier, Literal("OLD_catalog", datatype=XSD.string)))
+
+    # Theme taxonomy used by the catalog
+    theme_taxonomy_uri = URIRef("http://publications.europa.eu/resource/authority/data-theme")
+    catalog_g.add((catalog_uri, DCAT.themeTaxonomy, theme_taxonomy_uri))
+    catalog_g.add((theme_taxonomy_uri, RDF.type, SKOS.ConceptScheme))
+    catalog_g.add((theme_taxonomy_uri, DCT.title, Literal(
+        "Publications Office of the European Union Data Themes", lang="en"
+    )))
+    catalog_g.add((theme_taxonomy_uri, DCT.description, Literal(
+        "Controlled vocabulary of data themes used for dataset classification in DCAT-AP.",
+        lang="en"
+    )))
+
+    # Conformance to DCAT 
+    dcat_ap_uri = URIRef("https://www.w3.org/TR/vocab-dcat-3/")
+    catalog_g.add((catalog_uri, DCT.conformsTo, dcat_ap_uri))
+
+    # License
+    license_uri = URIRef("https://creativecommons.org/publicdomain/zero/1.0/")
+    catalog_g.add((catalog_uri, DCT.license, license_uri))
+
+    # Details about the license
+    catalog_g.add((license_uri, RDF.type, CC.License))
+    catalog_g.add((license_uri, CC.legalcode, URIRef(
+        "https://creativecommons.org/publicdomain/zero/1.0/"
+    )))
+    catalog_g.add((license_uri, RDFS.label, Literal("Creative Commons CC0 1.0 Universal (Public Domain Dedication)", lang="en")))
+
+    # Provenance
+    catalog_g.add((catalog_uri, PROV.wasAttributedTo, publisher_uri))
+
 
 # Add each dataset as a proper DCAT Dataset resource
-for dataset_id in dataset_ids:
-    dataset_uri = OLD[dataset_id] 
+def add_catalog_dataset(catalog_g, dataset_id):
+    dataset_uri = OLD[dataset_id]
     catalog_g.add((catalog_uri, DCAT.dataset, dataset_uri))
     catalog_g.add((dataset_uri, RDF.type, DCAT.Dataset))
     catalog_g.add((dataset_uri, DCT.identifier, Literal(dataset_id)))
-    
+
 
 # Saving the RDF
 output_dir = os.path.join("rdf", "rdf_serialization")
-os.makedirs(output_dir, exist_ok=True)
-
 catalog_file = os.path.join(output_dir, "serialization_catalog.ttl")
 
-with open(catalog_file, "w", encoding="utf-8") as f:
-    f.write(catalog_g.serialize(format="turtle"))
-
-print("Serialization complete!")
+# fragments are rebuilt whenever the code producing them changes
+BUILD_SALT = inspect.getsource(bind_namespaces) + inspect.getsource(add_catalog_dataset)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialize the DCAT catalog of the project datasets.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-serialize the parts of the catalog that changed since the last run",
+    )
+    mode.add_argument(
+        "--ntriples",
+        action="store_true",
+        help="stream N-Triples to the .nt file in chunks instead of building the graph in memory",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="with --ntriples, also pretty-print the .nt file as Turtle afterwards",
+    )
+    args = parser.parse_args()
+    if args.pretty and not args.ntriples:
+        parser.error("--pretty only applies with --ntriples")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    if args.ntriples:
+        nt_file = os.path.splitext(catalog_file)[0] + ".nt"
+        with NTriplesWriter(nt_file) as nt:
+            add_catalog(nt)
+            for dataset_id in dataset_ids():
+                add_catalog_dataset(nt, dataset_id)
+        print(f"Wrote {nt.count} triples to {nt_file}")
+
+        if args.pretty:
+            ntriples_to_turtle(nt_file, catalog_file, bind_namespaces)
+    elif args.incremental:
+        entries = [("catalog", entry_hash(inspect.getsource(add_catalog), BUILD_SALT), add_catalog)]
+        entries += [
+            (dataset_id, entry_hash(dataset_id, BUILD_SALT), lambda g, dataset_id=dataset_id: add_catalog_dataset(g, dataset_id))
+            for dataset_id in dataset_ids()
+        ]
+        report = build_incremental(catalog_file, entries, bind_namespaces)
+        print(f"Re-serialized: {len(report['rebuilt'])}, reused: {len(report['reused'])}")
+    else:
+        catalog_g = Graph()
+        bind_namespaces(catalog_g)
+        add_catalog(catalog_g)
+        for dataset_id in dataset_ids():
+            add_catalog_dataset(catalog_g, dataset_id)
+
+        with open(catalog_file, "w", encoding="utf-8") as f:
+            f.write(catalog_g.serialize(format="turtle"))
+
+    # highlighted preview shown in the dashboard, refreshed only when the Turtle file was rewritten
+    if not args.ntriples or args.pretty:
+        write_preview(catalog_file)
+
+    print("Serialization complete!")
+
+
+if __name__ == "__main__":
+    main()
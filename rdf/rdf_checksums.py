@@ -0,0 +1,111 @@
+"""
+Size and SHA-256 checksum of the local files behind each distribution.
+
+Access URLs of the form https://github.com/eugeniavd/retired_places/(blob|tree)/main/<path>
+are mapped to <project root>/<path> (see app/manifest.py, local_path); a
+directory (e.g. a shapefile bundle) counts as the concatenation of its files
+in name order. Files are hashed in a thread pool, and results are cached by
+(size, mtime) so unchanged files are not read again.
+"""
+
+import hashlib
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# access URLs are resolved by the manifest module shared with the dashboard
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+from manifest import local_path  # noqa: E402
+
+CACHE_FILE = PROJECT_ROOT / "rdf" / "rdf_serialization" / ".checksum_cache.json"
+
+CHUNK_SIZE = 1 << 20
+
+
+def _members(path: Path):
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.is_file())
+    return [path]
+
+
+def _signature(path: Path):
+    """
+    Cheap fingerprint of a file or bundle: name, size and mtime of each member.
+    """
+    return [[p.name, p.stat().st_size, p.stat().st_mtime_ns] for p in _members(path)]
+
+
+def _digest(path: Path) -> dict:
+    sha = hashlib.sha256()
+    size = 0
+    for member in _members(path):
+        with open(member, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                sha.update(chunk)
+                size += len(chunk)
+    return {"byte_size": size, "sha256": sha.hexdigest()}
+
+
+def file_stats(paths, cache_file=CACHE_FILE, max_workers=None) -> dict:
+    """
+    {path: {"byte_size": ..., "sha256": ...}} for every existing path.
+    """
+    cache_file = Path(cache_file)
+    if cache_file.exists():
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    else:
+        cache = {}
+
+    stats, pending = {}, {}
+    for path in {Path(p) for p in paths}:
+        key = path.relative_to(PROJECT_ROOT).as_posix()
+        signature = _signature(path)
+        cached = cache.get(key)
+        if cached and cached["signature"] == signature:
+            stats[path] = cached["stats"]
+        else:
+            pending[path] = (key, signature)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for path, result in zip(pending, pool.map(_digest, pending)):
+                key, signature = pending[path]
+                cache[key] = {"signature": signature, "stats": result}
+                stats[path] = result
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+
+    return stats
+
+
+def annotate_distributions(datasets, cache_file=CACHE_FILE, max_workers=None):
+    """
+    Set `byte_size` and `checksum` on every distribution with a local file.
+
+    Distributions whose file is not in the working tree are left as they are.
+    Returns the datasets as a list.
+    """
+    datasets = list(datasets)
+    located = []
+    for data in datasets:
+        dist_list = data.get("distribution", [])
+        if isinstance(dist_list, dict):
+            dist_list = [dist_list]
+        for dist_data in dist_list:
+            path = local_path(dist_data.get("access_url"))
+            if path is not None:
+                located.append((dist_data, path))
+
+    stats = file_stats([path for _, path in located], cache_file, max_workers)
+    for dist_data, path in located:
+        dist_data["byte_size"] = stats[path]["byte_size"]
+        dist_data["checksum"] = stats[path]["sha256"]
+
+    return datasets
@@ -1,6 +1,20 @@
 from rdflib import Graph, Literal, Namespace, URIRef, BNode
 from rdflib.namespace import RDF, RDFS, XSD, DCTERMS as DCT, PROV, FOAF
+import argparse
+import inspect
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from rdf_checksums import annotate_distributions
+from rdf_incremental import build_incremental, entry_hash
+from rdf_previews import write_preview
+from rdf_stream import NTriplesWriter, TripleBatch, ntriples_to_turtle
+
+# the dataset manifest loader is shared with the dashboard
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+from manifest import iter_datasets, to_dict  # noqa: E402
 
 # Namespaces
 DCAT = Namespace("http://www.w3.org/ns/dcat#")
@@ -10,765 +24,45 @@ CC = Namespace("http://creativecommons.org/ns#")
 XSD_NS = Namespace("http://www.w3.org/2001/XMLSchema#")
 SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
 FOAF_NS = Namespace("http://xmlns.com/foaf/0.1/")
+SPDX = Namespace("http://spdx.org/rdf/terms#")
 
 # Base namespace the project datasets
 OLD = Namespace("https://github.com/eugeniavd/retired_places/")
 
-g = Graph()
 
 # Prefixes
-g.bind("dcat", DCAT)
-g.bind("dcatapit", DCATAPIT)
-g.bind("dct", DCT)
-g.bind("adms", ADMS)
-g.bind("xsd", XSD_NS)
-g.bind("cc", CC)
-g.bind("skos", SKOS)
-g.bind("old", OLD)
-g.bind("prov", PROV)
-
-
-# Data: List of dataset dictionaries
-datasets_list = [
-    {
-    # D1 – Italy Population 2025
-    "id": "D1_population_regions",
-    "uri": OLD["D1_population_regions"],
-
-    "title": "D1 – Italy Population 2025",
-    "description": (
-        "Resident population by age, sex and marital status on January 1st. "
-        "It is a process that, starting from Population Census data, calculates "
-        "the municipal resident population by sex, year of birth and marital "
-        "status as of December 31 of each year and is released as of January 1 "
-        "of the following year. Resident population consists of the people "
-        "having habitual residence in the national territory even if temporarily "
-        "absent, both Italian and foreign citizenship."
-    ),
-
-    "publisher_uri": "https://www.istat.it/",
-    "publisher_name": "Istituto nazionale di statistica (ISTAT)",
-    "creator_uri": "https://www.istat.it/",
-    "creator_name": "Italian National Institute of Statistics",
-
-    "data_language": "it",       
-    "metadata_language": "en",     
-    "keywords_language": "it",    
-
-    "production_year": "2025",
-
-    "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-    "distribution": [
-        {
-            "access_url": (
-                "https://github.com/eugeniavd/retired_places/blob/main/"
-                "data/raw/D1_population_regions.csv"
-            ),
-            "media_type": "text/csv",
-            "format": "CSV",
-            "access_rights_uri": (
-                "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-            ),
-        }
-    ],
-
-    "source_url": "https://demo.istat.it/app/?i=POS&l=it",
-
-    "license_uri": "https://creativecommons.org/licenses/by/4.0/",
-    "keywords": ["regione", "età", "popolazione"],
-
-    "theme": {
-        "uri": "http://publications.europa.eu/resource/authority/data-theme/SOCI",
-        "label": "Population and society",
-    },
-},
-
-    {
-    # D2 – Italy Housing Data 2021
-    "id": "D2_housing_it",
-    "uri": OLD["D2_housing_it"],
-
-    "title": "D2 – Italy Housing Data 2021",
-    "description": (
-        "Housing census data on dwellings and occupied housing units in Italy. "
-        "The dataset provides information on the stock of dwellings by type, "
-        "occupancy status and other housing characteristics at territorial level."
-    ),
-
-    "publisher_uri": "https://www.istat.it/",
-    "publisher_name": "Istituto nazionale di statistica (ISTAT)",
-    "creator_uri": "https://www.istat.it/",
-    "creator_name": "Italian National Institute of Statistics",
-
-    "data_language": "it",
-    "metadata_language": "en",
-    "keywords_language": "it",
-
-    "production_year": "2021",
-
-    "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-    "distribution": [
-        {
-            "access_url": (
-                "https://github.com/eugeniavd/retired_places/blob/main/"
-                "data/raw/D2_housing_it.xlsx"
-            ),
-            "media_type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "format": "XLSX",
-            "access_rights_uri": (
-                "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-            ),
-        },
-    ],
-
-    "source_url": (
-        "https://esploradati.istat.it/databrowser/#/it/censpop/"
-        "categories/DCSS_ABITAZIONI_TV/IT1,DF_DCSS_ABITAZIONI_TV_1,1.0"
-    ),
-
-    "license_uri": "https://creativecommons.org/licenses/by/4.0/",
-    "keywords": ["abitazioni", "censimento", "alloggi"],
-
-    "theme": {
-        "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-        "label": "Regions and cities",
-    },
-},
- 
-
-    {
-    # GD1 – Italy Regions Boundaries
-    "id": "GD1_regions_it",
-    "uri": OLD["GD1_regions_it"],
-
-    "title": "GD1 – Italy Regions Boundaries",
-    "description": (
-        "Geospatial dataset of Italian administrative regions (NUTS 2 level) "
-        "used for statistical purposes. The dataset provides polygon geometries "
-        "for regional boundaries in 2025."
-    ),
-
-    "publisher_uri": "https://www.istat.it/",
-    "publisher_name": "Istituto nazionale di statistica (ISTAT)",
-    "creator_uri": "https://www.istat.it/",
-    "creator_name": "Italian National Institute of Statistics",
-
-    "data_language": "it",
-    "metadata_language": "en",
-    "keywords_language": "it",
-
-    "production_year": "2025",
-
-    "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-    "distribution": [
-        {
-            "access_url": (
-                "https://github.com/eugeniavd/retired_places/tree/main/"
-                "data/raw/GD1_regions_it"
-            ),
-            "media_type": "application/x-shapefile",
-            "format": "SHP",
-            "access_rights_uri": (
-                "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-            ),
-        }
-    ],
-
-    "source_url": (
-        "https://www.istat.it/notizia/"
-        "confini-delle-unita-amministrative-a-fini-statistici-al-1-gennaio-2018-2/"
-    ),
-
-    "license_uri": "https://creativecommons.org/licenses/by/4.0/",
-    "keywords": ["confini", "regioni", "geometrie"],
-
-    "theme": {
-        "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-        "label": "Regions and cities",
-    },
-},
-
-    {
-        # GD2 – Settlements Location Center
-        "id": "GD2_places_center",
-        "uri": OLD["GD2_places_center"],
-
-        "title": "GD2 – Settlements Location Center",
-        "description": (
-            "Geospatial dataset of settlement locations in Central Italy, "
-            "derived from OpenStreetMap via Geofabrik. Used to identify and map "
-            "settlements in the Centre macro-region."
-        ),
-
-        "publisher_uri": "https://www.geofabrik.de/",
-        "publisher_name": "Geofabrik GmbH",
-        "creator_uri": "https://www.openstreetmap.org/",
-        "creator_name": "OpenStreetMap Contributors",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/tree/main/"
-                    "data/raw/GD2_places_center"
-                ),
-                "media_type": "application/x-shapefile",
-                "format": "SHP",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "source_url": "https://download.geofabrik.de/europe/italy.html",
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": ["OpenStreetMap", "geometry", "center", "Italy"],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    {
-        # GD3 – Settlements Location Islands
-        "id": "GD3_places_islands",
-        "uri": OLD["GD3_places_islands"],
-
-        "title": "GD3 – Settlements Location Islands",
-        "description": (
-            "Geospatial dataset of settlement locations (populated places) in the "
-            "Italian islands (Sicilia, Sardegna), derived from OpenStreetMap via "
-            "Geofabrik. Used to map settlements in the Islands macro-region."
-        ),
-
-        "publisher_uri": "https://www.geofabrik.de/",
-        "publisher_name": "Geofabrik GmbH",
-        "creator_uri": "https://www.openstreetmap.org/",
-        "creator_name": "OpenStreetMap Contributors",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/tree/main/"
-                    "data/raw/GD3_places_islands"
-                ),
-                "media_type": "application/x-shapefile",
-                "format": "SHP",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "source_url": "https://download.geofabrik.de/europe/italy.html",
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": ["OpenStreetMap", "geometry", "sicily", "islands", "Italy"],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    {
-        # GD4 – Settlements Location North-East
-        "id": "GD4_places_north_east",
-        "uri": OLD["GD4_places_north_east"],
-
-        "title": "GD4 – Settlements Location North-East",
-        "description": (
-            "Geospatial dataset of settlement locations (populated places) in "
-            "North-Eastern Italy, derived from OpenStreetMap via Geofabrik."
-        ),
-
-        "publisher_uri": "https://www.geofabrik.de/",
-        "publisher_name": "Geofabrik GmbH",
-        "creator_uri": "https://www.openstreetmap.org/",
-        "creator_name": "OpenStreetMap Contributors",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/tree/main/"
-                    "data/raw/GD4_places_north_east"
-                ),
-                "media_type": "application/x-shapefile",
-                "format": "SHP",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "source_url": "https://download.geofabrik.de/europe/italy.html",
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": ["OpenStreetMap", "geometry", "Nord-Est", "Italy"],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    {
-        # GD5 – Settlements Location North-West
-        "id": "GD5_places_north_west",
-        "uri": OLD["GD5_places_north_west"],
-
-        "title": "GD5 – Settlements Location North-West",
-        "description": (
-            "Geospatial dataset of settlement locations (populated places) in "
-            "North-Western Italy, derived from OpenStreetMap via Geofabrik."
-        ),
-
-        "publisher_uri": "https://www.geofabrik.de/",
-        "publisher_name": "Geofabrik GmbH",
-        "creator_uri": "https://www.openstreetmap.org/",
-        "creator_name": "OpenStreetMap Contributors",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/tree/main/"
-                    "data/raw/GD5_places_north_west"
-                ),
-                "media_type": "application/x-shapefile",
-                "format": "SHP",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "source_url": "https://download.geofabrik.de/europe/italy.html",
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": ["OpenStreetMap", "geometry", "Nord-Ovest", "Italy"],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    {
-        # GD6 – Settlements Location South
-        "id": "GD6_places_south",
-        "uri": OLD["GD6_places_south"],
-
-        "title": "GD6 – Settlements Location South",
-        "description": (
-            "Geospatial dataset of settlement locations (populated places) in "
-            "Southern Italy, derived from OpenStreetMap via Geofabrik."
-        ),
-
-        "publisher_uri": "https://www.geofabrik.de/",
-        "publisher_name": "Geofabrik GmbH",
-        "creator_uri": "https://www.openstreetmap.org/",
-        "creator_name": "OpenStreetMap Contributors",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/tree/main/"
-                    "data/raw/GD6_places_south"
-                ),
-                "media_type": "application/x-shapefile",
-                "format": "SHP",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "source_url": "https://download.geofabrik.de/europe/italy.html",
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": ["OpenStreetMap", "geometrie", "south", "Italy"],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    # MASHED DATASETS
-    {
-        # MD1 – Share Houses Occupation
-        "id": "MD1_share_houses_occupation",
-        "uri": OLD["MD1_share_houses_occupation"],
-
-        "title": "MD1 – Share of Occupied and Unoccupied Houses by Region",
-        "description": (
-            "Derived dataset providing housing occupation indicators by Italian region. "
-            "For each region, it reports the number of occupied houses, unoccupied houses "
-            "and total housing units, along with the share of unoccupied houses "
-            "(share_unoccupied). The table also includes a normalized region name "
-            "(region_norm) and a region code (region_code) to support consistent "
-            "joining and visualizations."
-        ),
-
-        "publisher_uri": "https://github.com/eugeniavd/retired_places",
-        "publisher_name": "Retired Places Project",
-        "creator_uri": "https://github.com/eugeniavd",
-        "creator_name": "Evgeniia Vdovichenko",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/blob/main/"
-                    "data/processed/MD1_share_houses_occupation.csv"
-                ),
-                "media_type": "text/csv",
-                "format": "CSV",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-        "derived_from": [               
-        OLD["D2_housing_it"],                          
-    ],
-
-        "license_uri": "https://creativecommons.org/licenses/by/4.0/",
-        "keywords": [
-            "housing", "occupied houses", "unoccupied houses",
-            "regions"
-        ],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/SOCI",
-            "label": "Population and society",
-        },
-    },
-
-    {
-        # MD2 – Share 65 plus
-        "id": "MD2_share_65_plus",
-        "uri": OLD["MD2_share_65_plus"],
-
-        "title": "MD2 – Share of Population Aged 65+ by Region",
-        "description": (
-            "Derived dataset providing the share of population aged 65 and over by Italian region. "
-            "For each region, it reports the total number of residents aged 65+ (pop_65plus), "
-            "total population (tot_pop) and the resulting percentage of older residents "
-            "(share_65plus). The table also includes the region name (region) and a numeric "
-            "region code (region_code) to support aggregation, joining and visualization."
-        ),
-
-        "publisher_uri": "https://github.com/eugeniavd/retired_places",
-        "publisher_name": "Retired Places Project",
-        "creator_uri": "https://github.com/eugeniavd",
-        "creator_name": "Evgeniia Vdovichenko",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/blob/main/"
-                    "data/processed/MD2_share_65_plus.csv"
-                ),
-                "media_type": "text/csv",
-                "format": "CSV",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "derived_from": [
-        OLD["D1_population_regions"]                
-        
-    ],
-
-        "license_uri": "https://creativecommons.org/licenses/by/4.0/",
-        "keywords": [
-            "ageing", "65 plus", "older population",
-            "regions", "demography"
-        ],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/SOCI",
-            "label": "Population and society",
-        },
-    },
-
-    {
-        # MD3 – Settlements per Region
-        "id": "MD3_settlements_count",
-        "uri": OLD["MD3_settlements_count"],
-
-        "title": "MD3 – Number of Settlements per Region",
-        "description": (
-            "Derived dataset reporting the number of settlements per Italian region. "
-            "For each region, it provides the total count of small settlements "
-            "(villages and hamlets), together with the region name (region) and a numeric "
-            "region code (region_code). This table is used to quantify and compare how "
-            "densely the territory is fragmented into individual settlements across regions."
-        ),
-
-        "publisher_uri": "https://github.com/eugeniavd/retired_places",
-        "publisher_name": "Retired Places Project",
-        "creator_uri": "https://github.com/eugeniavd",
-        "creator_name": "Evgeniia Vdovichenko",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/blob/main/"
-                    "data/processed/MD3_settlements_count.csv"
-                ),
-                "media_type": "text/csv",
-                "format": "CSV",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "derived_from": [
-        OLD["MED1_settlements_italy"]
-        
-    ],
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": [
-            "settlements", "places",
-            "regions", "geospatial"
-        ],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    {
-        # MD4 – Dispersed Settlements Index
-        "id": "MD4_dispertion_places",
-        "uri": OLD["MD4_dispertion_places"],
-
-        "title": "MD4 – Dispersed Settlements Index by Region",
-        "description": (
-            "Derived index capturing the dispersion of settlements across Italian "
-            "regions. The dataset combines the number of small settlements with regional "
-            "population or area to approximate how dispersed or concentrated "
-            "settlement patterns are in each region."
-        ),
-
-        "publisher_uri": "https://github.com/eugeniavd/retired_places",
-        "publisher_name": "Retired Places Project",
-        "creator_uri": "https://github.com/eugeniavd",
-        "creator_name": "Evgeniia Vdovichenko",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/blob/main/"
-                    "data/processed/MD4_dispertion_places.csv"
-                ),
-                "media_type": "text/csv",
-                "format": "CSV",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "derived_from": [
-        OLD["MD3_settlements_count"],
-        OLD["MD2_share_65_plus"],
-        OLD["MD1_share_houses_occupation"]
-        
-    ],
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-        "keywords": [
-            "settlements dispersion", "dispersed places",
-            "regional index"
-        ],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-
-    {
-        # MD5 – Age vs Houses Occupation
-        "id": "MD5_age_houses_occupation",
-        "uri": OLD["MD5_age_houses_occupation"],
-
-        "title": "MD5 – Ageing vs Housing Occupation by Region",
-        "description": (
-            "Derived dataset combining ageing indicators and housing occupation metrics "
-            "for each Italian region. For every region, it reports the size and share of "
-            "the 65+ population (pop_65plus, tot_pop, share_65plus) together with housing "
-            "occupation figures (homes_occupied, homes_unoccupied, homes_total) and the "
-            "share of unoccupied houses (share_unoccupied). The table also includes the "
-            "normalized region name (region_norm), a region code (region_code) and a "
-            "macro-region label (macro_region). To support typology and ranking, it adds "
-            "boolean flags for high ageing and high vacancy (high_65, high_vac), a 2×2 "
-            "category label (category_2x2) and regional ranks for ageing and vacancy "
-            "indicators (rank_65, rank_vac, rank_diff)."
-        ),
-
-        "publisher_uri": "https://github.com/eugeniavd/retired_places",
-        "publisher_name": "Retired Places Project",
-        "creator_uri": "https://github.com/eugeniavd",
-        "creator_name": "Evgeniia Vdovichenko",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/blob/main/"
-                    "data/processed/MD5_age_houses_occupation.csv"
-                ),
-                "media_type": "text/csv",
-                "format": "CSV",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "derived_from": [
-        OLD["MD2_share_65_plus"],
-        OLD["MD1_share_houses_occupation"]
-        
-    ],
-
-        "license_uri": "https://creativecommons.org/licenses/by/4.0/",
-        "keywords": [
-            "ageing", "housing", "65 plus",
-            "occupied houses", "regional indicators"
-        ],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/SOCI",
-            "label": "Population and society",
-        },
-    },
-
-    {
-        # MED1 – Settlements Italy (merged geospatial dataset)
-        "id": "MED1_settlements_italy",
-        "uri": OLD["MED1_settlements_italy"],
-
-        "title": "MED1 – Settlements Italy (Merged Geospatial Layer)",
-        "description": (
-            "Merged geospatial dataset of settlement locations (populated places) "
-            "for the whole of Italy. It combines the regional settlement extracts "
-            "used in the project (Center, Islands, North-East, North-West, South) "
-            "into a single national layer stored as a GeoPackage (GPKG). The dataset "
-            "is derived from OpenStreetMap data and is used as the core geospatial "
-            "layer for the analysis of settlement patterns across Italian regions."
-        ),
-
-        "publisher_uri": "https://github.com/eugeniavd/retired_places",
-        "publisher_name": "Retired Places Project",
-        "creator_uri": "https://github.com/eugeniavd",
-        "creator_name": "Evgeniia Vdovichenko",
-
-        "language": "en",
-        "production_year": "2025",
-
-        "spatial_coverage_uri": "https://viaf.org/viaf/152361066",
-
-        "distribution": [
-            {
-                "access_url": (
-                    "https://github.com/eugeniavd/retired_places/blob/main/"
-                    "data/processed/MED1_settlements_italy.gpkg"
-                ),
-                "media_type": "application/geopackage+sqlite3",
-                "format": "GPKG",
-                "access_rights_uri": (
-                    "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
-                ),
-            }
-        ],
-
-        "derived_from": [
-        OLD["GD2_places_center"],
-        OLD["GD3_places_islands"],
-        OLD["GD4_places_north_east"],
-        OLD["GD5_places_north_west"],
-        OLD["GD6_places_south"]
-        
-    ],
-
-        "license_uri": "https://opendatacommons.org/licenses/odbl/1-0/",
-
-        "keywords": [
-            "settlements", "GeoPackage",
-            "OpenStreetMap", "Italy"
-        ],
-
-        "theme": {
-            "uri": "http://publications.europa.eu/resource/authority/data-theme/REGI",
-            "label": "Regions and cities",
-        },
-    },
-]
-
-
-for data in datasets_list:
+def bind_namespaces(g):
+    g.bind("dcat", DCAT)
+    g.bind("dcatapit", DCATAPIT)
+    g.bind("dct", DCT)
+    g.bind("adms", ADMS)
+    g.bind("xsd", XSD_NS)
+    g.bind("cc", CC)
+    g.bind("skos", SKOS)
+    g.bind("old", OLD)
+    g.bind("prov", PROV)
+    g.bind("spdx", SPDX)
+
+
+# Data: dataset metadata is kept in data/datasets.toml
+def rdf_datasets() -> list:
+    """
+    Manifest entries as plain dicts, with dataset ids turned into URIs.
+
+    Built as a list: the checksums are computed for all distributions in one
+    pass, and iter_batches sizes its process pool from the number of datasets.
+    """
+    datasets = []
+    for entry in iter_datasets():
+        data = to_dict(entry)
+        data["uri"] = OLD[data["id"]]
+        if "derived_from" in data:
+            data["derived_from"] = [OLD[dataset_id] for dataset_id in data["derived_from"]]
+        datasets.append(data)
+    return datasets
+
+
+def add_dataset(g, data):
     # --- URI ---
     dataset_uri = data["uri"]                 
     catalog_uri = OLD["catalog"]             
@@ -894,6 +188,14 @@ for data in datasets_list:
                      Literal(byte_size, datatype=XSD_NS.integer))
                 )
 
+            checksum = dist_data.get("checksum")
+            if checksum:
+                checksum_bnode = BNode()
+                g.add((dist_bnode, SPDX.checksum, checksum_bnode))
+                g.add((checksum_bnode, RDF.type, SPDX.Checksum))
+                g.add((checksum_bnode, SPDX.algorithm, SPDX.checksumAlgorithm_sha256))
+                g.add((checksum_bnode, SPDX.checksumValue, Literal(checksum, datatype=XSD_NS.hexBinary)))
+
             access_rights = dist_data.get("access_rights_uri")
             if access_rights:
                 g.add(
@@ -943,11 +245,106 @@ for data in datasets_list:
 
 # Saving the RDF
 output_dir = os.path.join("rdf", "rdf_serialization")
-os.makedirs(output_dir, exist_ok=True)
-
 datasets_file = os.path.join(output_dir, "serialization_datasets.ttl")
 
-with open(datasets_file, "w", encoding="utf-8") as f:
-    f.write(g.serialize(format="turtle"))
+# fragments are rebuilt whenever the code producing them changes
+BUILD_SALT = inspect.getsource(bind_namespaces) + inspect.getsource(add_dataset)
+
+# below this many datasets, starting worker processes costs more than it saves
+PARALLEL_MIN_DATASETS = 64
+
+
+def dataset_batch(data):
+    """
+    Triples of one dataset as a plain list (picklable, built in a worker).
+    """
+    batch = TripleBatch()
+    add_dataset(batch, data)
+    return batch.triples
+
+
+def iter_batches(datasets, workers=None):
+    """
+    Per-dataset triple batches, in dataset order, generated in a process pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(datasets) < PARALLEL_MIN_DATASETS:
+        yield from map(dataset_batch, datasets)
+        return
+
+    chunksize = max(1, len(datasets) // (workers * 4))
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(dataset_batch, datasets, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialize the DCAT description of every dataset.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-serialize datasets whose metadata changed since the last run",
+    )
+    mode.add_argument(
+        "--ntriples",
+        action="store_true",
+        help="stream N-Triples to the .nt file in chunks instead of building the graph in memory",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="with --ntriples, also pretty-print the .nt file as Turtle afterwards",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="processes generating the per-dataset triples (default: one per core)",
+    )
+    args = parser.parse_args()
+    if args.pretty and not args.ntriples:
+        parser.error("--pretty only applies with --ntriples")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # byteSize and checksum of the files shipped in the repository
+    datasets_list = annotate_distributions(rdf_datasets())
+
+    if args.ntriples:
+        nt_file = os.path.splitext(datasets_file)[0] + ".nt"
+        with NTriplesWriter(nt_file) as nt:
+            for batch in iter_batches(datasets_list, args.workers):
+                for triple in batch:
+                    nt.add(triple)
+        print(f"Wrote {nt.count} triples to {nt_file}")
+
+        if args.pretty:
+            ntriples_to_turtle(nt_file, datasets_file, bind_namespaces)
+    elif args.incremental:
+        entries = [
+            (data["id"], entry_hash(data, BUILD_SALT), lambda g, data=data: add_dataset(g, data))
+            for data in datasets_list
+        ]
+        report = build_incremental(datasets_file, entries, bind_namespaces)
+        print(f"Re-serialized: {len(report['rebuilt'])}, reused: {len(report['reused'])}")
+    else:
+        g = Graph()
+        bind_namespaces(g)
+        g.addN(
+            (s, p, o, g)
+            for batch in iter_batches(datasets_list, args.workers)
+            for s, p, o in batch
+        )
+
+        with open(datasets_file, "w", encoding="utf-8") as f:
+            f.write(g.serialize(format="turtle"))
+
+    # highlighted preview shown in the dashboard, refreshed only when the Turtle file was rewritten
+    if not args.ntriples or args.pretty:
+        write_preview(datasets_file)
+
+    print("Serialization complete!")
+
 
-print("Serialization complete!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Incremental Turtle serialization from per-entry graph fragments.
+
+Each entry (a dataset, or the catalog header) is hashed and serialized on
+its own into rdf_serialization/fragments/<output>/<key>.ttl. On the next
+build only entries whose hash changed are re-serialized; the output file
+is then spliced from the prefix lines and the fragment bodies.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from rdflib import Graph
+
+
+def entry_hash(entry, salt: str = "") -> str:
+    """
+    Stable hash of a metadata entry (dicts, lists, strings, URIRefs...).
+
+    `salt` should change whenever the code turning entries into triples
+    changes, so that every fragment is rebuilt.
+    """
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256((salt + "\n" + canonical).encode("utf-8")).hexdigest()
+
+
+def _split_turtle(text: str):
+    """
+    Separate the @prefix lines from the body of a Turtle serialization.
+    """
+    prefixes, body = [], []
+    for line in text.splitlines():
+        if line.startswith("@prefix"):
+            prefixes.append(line)
+        else:
+            body.append(line)
+    return prefixes, "\n".join(body).strip("\n")
+
+
+def build_incremental(output_file, entries, bind_namespaces, fragments_dir=None) -> dict:
+    """
+    Write `output_file` from fragments, re-serializing only changed entries.
+
+    entries: iterable of (key, hash, add_fn) where add_fn(graph) adds the
+             entry's triples; it is only called for changed entries.
+    bind_namespaces: function binding the project prefixes on a Graph.
+
+    Returns {"rebuilt": [...], "reused": [...], "removed": [...]}.
+    """
+    output_file = Path(output_file)
+    if fragments_dir is None:
+        fragments_dir = output_file.parent / "fragments" / output_file.stem
+    fragments_dir = Path(fragments_dir)
+    fragments_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = fragments_dir / "manifest.json"
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        manifest = {}
+
+    new_manifest = {}
+    bodies = []
+    report = {"rebuilt": [], "reused": [], "removed": []}
+
+    for key, digest, add_fn in entries:
+        fragment_path = fragments_dir / f"{key}.ttl"
+        cached = manifest.get(key)
+
+        if cached and cached["hash"] == digest and fragment_path.exists():
+            body = fragment_path.read_text(encoding="utf-8")
+            prefixes = cached["prefixes"]
+            report["reused"].append(key)
+        else:
+            g = Graph()
+            bind_namespaces(g)
+            add_fn(g)
+            prefixes, body = _split_turtle(g.serialize(format="turtle"))
+            fragment_path.write_text(body, encoding="utf-8")
+            report["rebuilt"].append(key)
+
+        new_manifest[key] = {"hash": digest, "prefixes": prefixes}
+        bodies.append(body)
+
+    for key in set(manifest) - set(new_manifest):
+        stale = fragments_dir / f"{key}.ttl"
+        if stale.exists():
+            stale.unlink()
+        report["removed"].append(key)
+
+    header = sorted({line for entry in new_manifest.values() for line in entry["prefixes"]})
+
+    tmp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(header) + "\n\n")
+        f.write("\n\n".join(body for body in bodies if body) + "\n")
+    os.replace(tmp_file, output_file)
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(new_manifest, f, indent=2, ensure_ascii=False)
+
+    return report
@@ -0,0 +1,210 @@
+"""
+Row-level export of the regional indicators as an RDF Data Cube.
+
+Every row of MD5 (joined with MD4 for the dispersion index) becomes one
+qb:Observation with two dimensions (region, reference year) and the measures
+share_65plus, share_unoccupied and dispersed_index. The cube structure is a
+handful of triples built with rdflib; the observations themselves are
+encoded column-wise and filled into a precompiled N-Triples template, then
+written in chunks, so they never become rdflib terms.
+
+Run from the project root:
+
+    python rdf/rdf_observations.py                 # MD5 + MD4, reference year 2025
+    python rdf/rdf_observations.py --pretty        # also write the Turtle version
+"""
+
+import argparse
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF, RDFS, XSD, DCTERMS as DCT, PROV
+
+from rdf_previews import write_preview
+from rdf_stream import NTriplesWriter, ntriples_to_turtle
+
+# Namespaces
+QB = Namespace("http://purl.org/linked-data/cube#")
+SDMX_DIMENSION = Namespace("http://purl.org/linked-data/sdmx/2009/dimension#")
+SDMX_MEASURE = Namespace("http://purl.org/linked-data/sdmx/2009/measure#")
+XSD_NS = Namespace("http://www.w3.org/2001/XMLSchema#")
+
+# Base namespace the project datasets
+OLD = Namespace("https://github.com/eugeniavd/retired_places/")
+
+CUBE = OLD["cube/regional_indicators"]
+STRUCTURE = OLD["cube/regional_indicators/structure"]
+OBSERVATION_BASE = str(OLD) + "cube/regional_indicators/obs/"
+REGION_BASE = str(OLD) + "region/"
+
+DIMENSIONS = {
+    "region": (OLD["refArea"], SDMX_DIMENSION.refArea, "Region"),
+    "year": (OLD["refPeriod"], SDMX_DIMENSION.refPeriod, "Reference year"),
+}
+MEASURES = {
+    "share_65plus": "Share of residents aged 65+ (%)",
+    "share_unoccupied": "Share of unoccupied dwellings (%)",
+    "dispersed_index": "Dispersed settlements index",
+}
+
+DEFAULT_YEAR = 2025
+PROCESSED = os.path.join("data", "processed")
+
+
+# Prefixes
+def bind_namespaces(g):
+    g.bind("qb", QB)
+    g.bind("sdmx-dimension", SDMX_DIMENSION)
+    g.bind("sdmx-measure", SDMX_MEASURE)
+    g.bind("dct", DCT)
+    g.bind("prov", PROV)
+    g.bind("xsd", XSD_NS)
+    g.bind("old", OLD)
+
+
+def add_structure(g, derived_from):
+    """
+    qb:DataSet, its data structure definition and the component properties.
+    """
+    g.add((CUBE, RDF.type, QB.DataSet))
+    g.add((CUBE, DCT.title, Literal("Regional ageing, vacancy and dispersion indicators", lang="en")))
+    g.add((CUBE, QB.structure, STRUCTURE))
+    for source in derived_from:
+        g.add((CUBE, PROV.wasDerivedFrom, source))
+
+    g.add((STRUCTURE, RDF.type, QB.DataStructureDefinition))
+
+    for order, (prop, super_prop, label) in enumerate(DIMENSIONS.values(), start=1):
+        component = URIRef(f"{STRUCTURE}/dimension/{order}")
+        g.add((STRUCTURE, QB.component, component))
+        g.add((component, QB.dimension, prop))
+        g.add((component, QB.order, Literal(order)))
+        g.add((prop, RDF.type, QB.DimensionProperty))
+        g.add((prop, RDFS.subPropertyOf, super_prop))
+        g.add((prop, RDFS.label, Literal(label, lang="en")))
+
+    for measure, label in MEASURES.items():
+        prop = OLD[measure]
+        component = URIRef(f"{STRUCTURE}/measure/{measure}")
+        g.add((STRUCTURE, QB.component, component))
+        g.add((component, QB.measure, prop))
+        g.add((prop, RDF.type, QB.MeasureProperty))
+        g.add((prop, RDFS.subPropertyOf, SDMX_MEASURE.obsValue))
+        g.add((prop, RDFS.range, XSD.double))
+        g.add((prop, RDFS.label, Literal(label, lang="en")))
+
+
+def load_indicators(md5_path, md4_path, year=DEFAULT_YEAR) -> pd.DataFrame:
+    """
+    One row per (region_code, year) with the three measures.
+
+    A `year` column in the inputs is kept (panels); otherwise `year` is used.
+    """
+    df_md5 = pd.read_csv(md5_path)
+    df_md4 = pd.read_csv(md4_path)
+
+    keys = ["region_code", "year"] if "year" in df_md5.columns and "year" in df_md4.columns else ["region_code"]
+    df = df_md5[keys + ["share_65plus", "share_unoccupied"]].merge(
+        df_md4[keys + ["dispersed_index"]], on=keys, how="left"
+    )
+    if "year" not in df.columns:
+        df["year"] = year
+    return df
+
+
+def _observation_template() -> str:
+    """
+    N-Triples of one observation with {0}=region, {1}=year, {2}…=measures.
+    """
+    subject = "<" + OBSERVATION_BASE + "{0}-{1}> "
+    lines = [
+        subject + f"<{RDF.type}> <{QB.Observation}> .\n",
+        subject + f"<{QB.dataSet}> <{CUBE}> .\n",
+        subject + f"<{DIMENSIONS['region'][0]}> <" + REGION_BASE + "{0}> .\n",
+        subject + f"<{DIMENSIONS['year'][0]}> \"{{1}}\"^^<{XSD.gYear}> .\n",
+    ]
+    for i, measure in enumerate(MEASURES, start=2):
+        lines.append(subject + f"<{OLD[measure]}> \"{{{i}}}\"^^<{XSD.double}> .\n")
+    return "".join(lines)
+
+
+OBSERVATION_TEMPLATE = _observation_template()
+MISSING_MEASURE = re.compile(r"^.*\"nan\"\^\^<" + re.escape(str(XSD.double)) + r"> \.\n", re.MULTILINE)
+
+
+def observation_lines(df: pd.DataFrame) -> str:
+    """
+    N-Triples for all observations in `df`.
+
+    Every column is converted to strings once (vectorised); rows are then
+    filled into a precompiled template. Missing measure values produce no
+    triple.
+    """
+    region = df["region_code"].astype("int64").astype(str).str.zfill(2).tolist()
+    year = df["year"].astype("int64").astype(str).tolist()
+    values = [df[measure].to_numpy(dtype="float64") for measure in MEASURES]
+
+    fill = OBSERVATION_TEMPLATE.format
+    text = "".join([fill(*row) for row in zip(region, year, *(v.astype(str).tolist() for v in values))])
+
+    if any(np.isnan(v).any() for v in values):
+        text = MISSING_MEASURE.sub("", text)
+    return text
+
+
+def write_observations(df: pd.DataFrame, nt_file, derived_from, chunk_rows: int = 100_000) -> int:
+    """
+    Structure triples, then the observations in chunks of `chunk_rows`.
+    """
+    with NTriplesWriter(nt_file) as nt:
+        add_structure(nt, derived_from)
+        for start in range(0, len(df), chunk_rows):
+            nt.write_encoded(observation_lines(df.iloc[start:start + chunk_rows]))
+    return len(df)
+
+
+def observations_graph(df: pd.DataFrame, derived_from=()) -> Graph:
+    """
+    The same cube as an in-memory rdflib Graph (bulk-loaded from N-Triples).
+    """
+    g = Graph()
+    bind_namespaces(g)
+    add_structure(g, derived_from)
+    g.parse(data=observation_lines(df), format="nt")
+    return g
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the regional indicators as RDF Data Cube observations.")
+    parser.add_argument("--md5", default=os.path.join(PROCESSED, "MD5_age_houses_occupation.csv"))
+    parser.add_argument("--md4", default=os.path.join(PROCESSED, "MD4_dispertion_places.csv"))
+    parser.add_argument("--year", type=int, default=DEFAULT_YEAR, help="reference year if the inputs have no year column")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="also pretty-print the observations as Turtle",
+    )
+    args = parser.parse_args()
+
+    output_dir = os.path.join("rdf", "rdf_serialization")
+    os.makedirs(output_dir, exist_ok=True)
+    nt_file = os.path.join(output_dir, "serialization_observations.nt")
+
+    df = load_indicators(args.md5, args.md4, args.year)
+    derived_from = [OLD["MD5_age_houses_occupation"], OLD["MD4_dispertion_places"]]
+    n_obs = write_observations(df, nt_file, derived_from)
+    print(f"Wrote {n_obs} observations to {nt_file}")
+
+    if args.pretty:
+        ttl_file = os.path.join(output_dir, "serialization_observations.ttl")
+        ntriples_to_turtle(nt_file, ttl_file, bind_namespaces)
+        write_preview(ttl_file)
+
+    print("Serialization complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Pre-rendered previews of the Turtle serializations for the dashboard.
+
+For every .ttl file in rdf_serialization/ the first lines are highlighted
+with Pygments and saved as an HTML snippet in rdf_serialization/previews/.
+previews/index.json records, per file, the SHA-256 and size it was
+rendered from, so the dashboard can tell whether a snippet is still valid
+without parsing or loading the serialization. The index is committed, so it
+holds nothing checkout-specific: the mtime each hash was computed for lives
+in the gitignored data/.cache/previews.json and only lets the dashboard skip
+re-hashing a file it has already seen.
+
+The RDF scripts refresh the preview of the file they write; to rebuild all
+of them, run from the project root:
+
+    python rdf/rdf_previews.py
+"""
+
+import hashlib
+import json
+from itertools import islice
+from pathlib import Path
+
+try:
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import TurtleLexer
+except ImportError:  # previews are optional; the dashboard falls back to plain text
+    highlight = None
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SERIALIZATION_DIR = Path(__file__).resolve().parent / "rdf_serialization"
+PREVIEW_DIR = SERIALIZATION_DIR / "previews"
+INDEX_FILE = PREVIEW_DIR / "index.json"
+STAT_CACHE = PROJECT_ROOT / "data" / ".cache" / "previews.json"
+
+PREVIEW_LINES = 18
+TRUNCATION_NOTE = "\n# … (truncated for preview) …"
+
+
+def read_head(path, max_lines: int = PREVIEW_LINES) -> str:
+    """
+    First `max_lines` lines of a text file, streamed; the rest is never read.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = list(islice(f, max_lines + 1))
+    snippet = "".join(lines[:max_lines])
+    if len(lines) > max_lines:
+        snippet += TRUNCATION_NOTE
+    return snippet
+
+
+def file_sha256(path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _read_json(path) -> dict:
+    if Path(path).exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def _write_json(path, data: dict):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def write_preview(ttl_path, max_lines: int = PREVIEW_LINES):
+    """
+    Render (or keep, if the file is unchanged) the preview of one file.
+
+    Returns the snippet path, or None when Pygments is not installed.
+    """
+    if highlight is None:
+        print("Pygments not installed, preview skipped.")
+        return None
+
+    ttl_path = Path(ttl_path).resolve()
+    PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+
+    index = _read_json(INDEX_FILE)
+    stat = ttl_path.stat()
+    digest = file_sha256(ttl_path)
+    snippet_path = PREVIEW_DIR / f"{ttl_path.stem}.html"
+
+    entry = index.get(ttl_path.name)
+    if not (entry and entry["sha256"] == digest and entry["max_lines"] == max_lines and snippet_path.exists()):
+        formatter = HtmlFormatter(noclasses=True, style="friendly")
+        snippet_path.write_text(highlight(read_head(ttl_path, max_lines), TurtleLexer(), formatter), encoding="utf-8")
+
+    index[ttl_path.name] = {
+        "sha256": digest,
+        "size": stat.st_size,
+        "max_lines": max_lines,
+        "html": snippet_path.name,
+    }
+    _write_json(INDEX_FILE, index)
+
+    stats = _read_json(STAT_CACHE)
+    stats[ttl_path.name] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    _write_json(STAT_CACHE, stats)
+
+    return snippet_path
+
+
+def main():
+    for ttl_path in sorted(SERIALIZATION_DIR.glob("*.ttl")):
+        if write_preview(ttl_path) is not None:
+            print(f"Preview of {ttl_path.name} saved.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Streaming N-Triples output for the RDF scripts.
+
+`NTriplesWriter` stands in for an rdflib Graph in the add_* functions of
+rdf_datasets.py and rdf_catalog.py: added triples are buffered and written in
+chunks, each chunk encoded by rdflib's N-Triples serializer on a small
+throwaway graph, so memory does not grow with the size of the graph.
+Duplicate triples across chunks (e.g. a publisher shared by several
+datasets) are written again; they collapse when the file is parsed.
+"""
+
+from pathlib import Path
+
+from rdflib import Graph
+
+
+class NTriplesWriter:
+    def __init__(self, path, chunk_size: int = 10_000):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._buffer = []
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+        self._file.close()
+
+    def bind(self, prefix, namespace):
+        # N-Triples has no prefixes; accepted so bind_namespaces() can be reused
+        pass
+
+    def add(self, triple):
+        self._buffer.append(triple)
+        self.count += 1
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def write_encoded(self, text: str):
+        """
+        Append lines that are already N-Triples (e.g. encoded column-wise).
+        """
+        self.flush()
+        self._file.write(text)
+
+    def flush(self):
+        if self._buffer:
+            chunk = Graph()
+            for triple in self._buffer:
+                chunk.add(triple)
+            self._file.write(chunk.serialize(format="nt"))
+            self._buffer.clear()
+
+
+class TripleBatch:
+    """
+    Graph stand-in that only collects triples, e.g. in a worker process.
+    """
+
+    def __init__(self):
+        self.triples = []
+
+    def bind(self, prefix, namespace):
+        pass
+
+    def add(self, triple):
+        self.triples.append(triple)
+
+
+def ntriples_to_turtle(nt_file, ttl_file, bind_namespaces):
+    """
+    Optional post-step: parse an N-Triples file and pretty-print it as Turtle.
+
+    This holds the whole graph in memory, as the regular build does.
+    """
+    g = Graph()
+    bind_namespaces(g)
+    g.parse(nt_file, format="nt")
+    with open(ttl_file, "w", encoding="utf-8") as f:
+        f.write(g.serialize(format="turtle"))
@@ -0,0 +1,179 @@
+"""
+SHACL validation of the RDF serializations against the DCAT-AP shapes.
+
+The catalog and dataset serializations are merged, then split into one
+subgraph per dcat:Catalog / dcat:Dataset (its concise bounded description:
+the resource's own triples plus the blank nodes it owns, e.g. distributions
+and checksums). Subgraphs are validated in parallel worker processes
+against rdf/shapes/dcat_ap_shapes.ttl. Results are cached per canonical
+subgraph hash (and shapes hash), so a re-run only validates datasets whose
+description changed.
+
+Run from the project root:
+
+    python rdf/rdf_validate.py
+
+The machine-readable report is written to
+rdf/rdf_serialization/validation_report.json (results only, so it does not
+change between a cold and a cached run); the exit status is 1 when a
+violation is found.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pyshacl import validate
+from rdflib import BNode, Graph, Namespace
+from rdflib.compare import to_canonical_graph
+from rdflib.namespace import RDF
+
+DCAT = Namespace("http://www.w3.org/ns/dcat#")
+SH = Namespace("http://www.w3.org/ns/shacl#")
+
+RDF_DIR = Path(__file__).resolve().parent
+SERIALIZATION_DIR = RDF_DIR / "rdf_serialization"
+SERIALIZATIONS = ["serialization_catalog.ttl", "serialization_datasets.ttl"]
+SHAPES_FILE = RDF_DIR / "shapes" / "dcat_ap_shapes.ttl"
+CACHE_FILE = SERIALIZATION_DIR / ".validation_cache.json"
+REPORT_FILE = SERIALIZATION_DIR / "validation_report.json"
+
+
+def load_graph(paths) -> Graph:
+    g = Graph()
+    for path in paths:
+        g.parse(path, format="turtle")
+    return g
+
+
+def bounded_description(g: Graph, node) -> Graph:
+    """
+    Triples of `node`, following blank-node objects recursively.
+    """
+    sub = Graph()
+    pending, seen = [node], set()
+    while pending:
+        subject = pending.pop()
+        if subject in seen:
+            continue
+        seen.add(subject)
+        for _, p, o in g.triples((subject, None, None)):
+            sub.add((subject, p, o))
+            if isinstance(o, BNode):
+                pending.append(o)
+    return sub
+
+
+def canonical_ntriples(sub: Graph) -> str:
+    """
+    Sorted N-Triples with canonical blank-node labels: identical descriptions
+    give identical text (and hash) across runs and parses.
+    """
+    lines = to_canonical_graph(sub).serialize(format="nt").splitlines()
+    return "\n".join(sorted(line for line in lines if line.strip())) + "\n"
+
+
+def split_by_resource(g: Graph) -> dict:
+    """
+    {resource IRI: canonical N-Triples} for every catalog and dataset.
+    """
+    resources = set(g.subjects(RDF.type, DCAT.Catalog)) | set(g.subjects(RDF.type, DCAT.Dataset))
+    return {str(node): canonical_ntriples(bounded_description(g, node)) for node in sorted(resources)}
+
+
+# ---------- worker ----------
+_shapes = None
+
+
+def _init_worker(shapes_text: str):
+    global _shapes
+    _shapes = Graph().parse(data=shapes_text, format="turtle")
+
+
+def _validate_one(data_nt: str) -> dict:
+    data = Graph().parse(data=data_nt, format="nt")
+    conforms, results_graph, _ = validate(data, shacl_graph=_shapes, inference="none", advanced=False)
+
+    violations = []
+    for result in results_graph.subjects(RDF.type, SH.ValidationResult):
+        focus = results_graph.value(result, SH.focusNode)
+        violations.append({
+            "focus_node": None if isinstance(focus, BNode) else str(focus),
+            "path": str(results_graph.value(result, SH.resultPath) or ""),
+            "severity": str(results_graph.value(result, SH.resultSeverity)).rsplit("#", 1)[-1],
+            "constraint": str(results_graph.value(result, SH.sourceConstraintComponent)).rsplit("#", 1)[-1],
+            "value": str(results_graph.value(result, SH.value) or ""),
+            "message": str(results_graph.value(result, SH.resultMessage) or ""),
+        })
+    violations.sort(key=lambda v: (v["path"], v["constraint"], v["value"]))
+    return {"conforms": bool(conforms), "violations": violations}
+
+
+def validate_serializations(paths, shapes_file=SHAPES_FILE, cache_file=CACHE_FILE, max_workers=None) -> dict:
+    shapes_text = Path(shapes_file).read_text(encoding="utf-8")
+    shapes_hash = hashlib.sha256(shapes_text.encode("utf-8")).hexdigest()
+
+    cache_file = Path(cache_file)
+    if cache_file.exists():
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    else:
+        cache = {}
+
+    subgraphs = split_by_resource(load_graph(paths))
+    keys = {
+        resource: hashlib.sha256((shapes_hash + data_nt).encode("utf-8")).hexdigest()
+        for resource, data_nt in subgraphs.items()
+    }
+    pending = [resource for resource in subgraphs if keys[resource] not in cache]
+
+    if pending:
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(shapes_text,)) as pool:
+            for resource, result in zip(pending, pool.map(_validate_one, [subgraphs[r] for r in pending])):
+                cache[keys[resource]] = result
+
+        # keep only the entries of the current subgraphs
+        cache = {key: cache[key] for key in keys.values()}
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+
+    results = {resource: cache[keys[resource]] for resource in subgraphs}
+    return {
+        "conforms": all(result["conforms"] for result in results.values()),
+        "shapes_sha256": shapes_hash,
+        "validated": len(pending),
+        "cached": len(subgraphs) - len(pending),
+        "resources": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the RDF serializations against the DCAT-AP shapes.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--report", type=Path, default=REPORT_FILE)
+    args = parser.parse_args()
+
+    report = validate_serializations([SERIALIZATION_DIR / name for name in SERIALIZATIONS], max_workers=args.workers)
+
+    # the run counters depend on the local cache, so they are printed, not written to the report
+    validated, cached = report.pop("validated"), report.pop("cached")
+
+    os.makedirs(args.report.parent, exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    n_violations = sum(len(result["violations"]) for result in report["resources"].values())
+    print(
+        f"Validated {validated} resources ({cached} from cache): "
+        f"{n_violations} violation(s). Report saved to {args.report}"
+    )
+    sys.exit(0 if report["conforms"] else 1)
+
+
+if __name__ == "__main__":
+    main()
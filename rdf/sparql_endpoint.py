@@ -0,0 +1,127 @@
+"""
+Local SPARQL endpoint over the DCAT catalog, datasets and Data Cube observations.
+
+The Turtle files are parsed once at start-up into a single rdflib graph
+backed by the in-memory store, which keeps SPO, POS and OSP indexes, so
+triple patterns with any bound position are answered by dictionary lookups.
+Queries are parsed and algebra-compiled once (prepared query cache) and,
+since the graph is read-only, their serialized results are cached too.
+
+Run from the project root:
+
+    uvicorn sparql_endpoint:app --app-dir rdf --port 8001
+
+and query with GET /sparql?query=... or POST /sparql (SPARQL 1.1 protocol:
+a form-encoded `query` or an application/sparql-query body), e.g.
+datasets derived from GD2–GD6 under ODbL:
+
+    PREFIX dct:  <http://purl.org/dc/terms/>
+    PREFIX prov: <http://www.w3.org/ns/prov#>
+    PREFIX old:  <https://github.com/eugeniavd/retired_places/>
+    SELECT DISTINCT ?dataset WHERE {
+        VALUES ?source { old:GD2_places_center old:GD3_places_islands
+                         old:GD4_places_north_east old:GD5_places_north_west
+                         old:GD6_places_south }
+        ?dataset prov:wasDerivedFrom ?source ;
+                 dct:license <https://opendatacommons.org/licenses/odbl/1-0/> .
+    }
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+
+SERIALIZATION_DIR = Path(__file__).resolve().parent / "rdf_serialization"
+SERIALIZATIONS = ["serialization_catalog.ttl", "serialization_datasets.ttl", "serialization_observations.ttl"]
+
+# result formats by media type (SELECT/ASK → SPARQL results, CONSTRUCT/DESCRIBE → RDF)
+RESULT_FORMATS = {
+    "application/sparql-results+json": "json",
+    "application/sparql-results+xml": "xml",
+    "text/csv": "csv",
+}
+GRAPH_FORMATS = {
+    "text/turtle": "turtle",
+    "application/n-triples": "nt",
+    "application/ld+json": "json-ld",
+}
+
+
+def load_graph() -> Graph:
+    """
+    Parse every serialization into one graph (in-memory, indexed store).
+    """
+    g = Graph(store="Memory")
+    for name in SERIALIZATIONS:
+        g.parse(SERIALIZATION_DIR / name, format="turtle")
+    return g
+
+
+GRAPH = load_graph()
+INIT_NS = dict(GRAPH.namespaces())
+
+
+@lru_cache(maxsize=512)
+def prepared(query: str):
+    return prepareQuery(query, initNs=INIT_NS)
+
+
+@lru_cache(maxsize=1024)
+def run_query(query: str, accept: str):
+    """
+    Evaluate a query and serialize its result; cached per (query, media type).
+    """
+    result = GRAPH.query(prepared(query))
+
+    if result.type in ("CONSTRUCT", "DESCRIBE"):
+        media_type = next((m for m in GRAPH_FORMATS if m in accept), "text/turtle")
+        body = result.graph.serialize(format=GRAPH_FORMATS[media_type])
+    else:
+        media_type = next((m for m in RESULT_FORMATS if m in accept), "application/sparql-results+json")
+        body = result.serialize(format=RESULT_FORMATS[media_type])
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return body, media_type
+
+
+async def sparql(request):
+    if request.method == "POST":
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type == "application/sparql-query":
+            query = (await request.body()).decode("utf-8")
+        elif content_type == "application/x-www-form-urlencoded":
+            # parsed here rather than with request.form(), which needs python-multipart
+            form = parse_qs((await request.body()).decode("utf-8"))
+            query = form.get("query", [None])[0]
+        else:
+            return JSONResponse(
+                {"error": "POST body must be application/sparql-query or application/x-www-form-urlencoded"},
+                status_code=415,
+            )
+    else:
+        query = request.query_params.get("query")
+
+    if not query:
+        return JSONResponse({"error": "Missing 'query' parameter"}, status_code=400)
+
+    try:
+        body, media_type = run_query(query, request.headers.get("accept", ""))
+    except Exception as exc:  # parse or evaluation errors from rdflib
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    return Response(body, media_type=media_type)
+
+
+app = Starlette(
+    routes=[
+        Route("/sparql", sparql, methods=["GET", "POST"]),
+    ]
+)
@@ -0,0 +1,51 @@
+"""
+Requests over the SPARQL 1.1 protocol paths of sparql_endpoint.py.
+
+    pip install -r rdf/requirements-dev.txt
+    python -m pytest rdf
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from starlette.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from sparql_endpoint import app  # noqa: E402
+
+
+QUERY = """
+PREFIX dcat: <http://www.w3.org/ns/dcat#>
+SELECT (COUNT(?dataset) AS ?n) WHERE { ?dataset a dcat:Dataset }
+"""
+
+client = TestClient(app)
+
+
+def _count(response) -> int:
+    assert response.status_code == 200
+    return int(json.loads(response.content)["results"]["bindings"][0]["n"]["value"])
+
+
+def test_get():
+    assert _count(client.get("/sparql", params={"query": QUERY})) > 0
+
+
+def test_post_sparql_query():
+    response = client.post("/sparql", content=QUERY, headers={"Content-Type": "application/sparql-query"})
+    assert _count(response) == _count(client.get("/sparql", params={"query": QUERY}))
+
+
+def test_post_form():
+    response = client.post("/sparql", data={"query": QUERY})
+    assert _count(response) == _count(client.get("/sparql", params={"query": QUERY}))
+
+
+def test_post_form_without_query():
+    assert client.post("/sparql", data={"other": "x"}).status_code == 400
+
+
+def test_post_other_content_type():
+    response = client.post("/sparql", content=QUERY, headers={"Content-Type": "text/plain"})
+    assert response.status_code == 415